@@ -9,15 +9,38 @@ class BaseConfig:
 
     # Classification settings
     MIN_CONFIDENCE_SCORE = 0.6
+    EARLY_EXIT_CONFIDENCE = 0.9  # Stop trying strategies at this score; None runs all
+    EXTRACTION_MAX_PAGES = None  # Page budget per document; None reads every page
+    EXTRACTION_TIME_BUDGET = None  # seconds; None disables the time budget
+    PDF_EXTRACT_TABLES = True  # Find tables on PDF pages with ruling lines; same default as DocumentClassifier
+    SPOOL_TEMP_MAX_AGE = 3600  # seconds; older partial uploads in the spool are abandoned
+    SPOOL_MAX_AGE = 7 * 24 * 3600  # seconds; spooled files unreleased this long are swept
+    CLASSIFY_IN_MEMORY_MAX_SIZE = 1024 * 1024  # Smaller /classify uploads are never written to disk
     ENABLE_BATCH_PROCESSING = True
     MAX_BATCH_SIZE = 1000
 
+    # Classification result cache
+    CLASSIFICATION_CACHE_SIZE = 1024
+    CLASSIFICATION_CACHE_TTL = 3600  # seconds
+    CLASSIFICATION_CACHE_REDIS = False
+    CLASSIFICATION_CACHE_REDIS_TTL = 86400  # seconds
+
+    # Startup budget for the web process (checked by tests/unit/startup.py)
+    STARTUP_IMPORT_BUDGET_SECONDS = 1.5
+    STARTUP_RSS_BUDGET_MB = 120
+
     # Monitoring settings
     ENABLE_PROMETHEUS = True
     METRICS_PORT = 9090
 
     # Worker settings
     WORKER_CONCURRENCY = 4
+    WEB_CONCURRENCY = 4  # API worker processes per host (e.g. gunicorn --workers)
+    OCR_POOL_SIZE = None  # OCR processes per worker; None splits the CPUs across WORKER_CONCURRENCY (WEB_CONCURRENCY in the API)
+    OCR_ENGINE = None  # "tesserocr" or "pytesseract"; None prefers tesserocr when installed
+    OCR_ENGINES_PER_PROCESS = 1
+    OCR_ENGINE_MAX_PAGES = 500  # Recycle an engine after this many pages
+    OCR_QUEUE_SIZE = 8  # Callers allowed to wait for an engine before OCR is rejected
     TASK_TIME_LIMIT = 3600
     MAX_RETRIES = 3
     RETRY_BACKOFF = True
\ No newline at end of file
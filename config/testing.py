@@ -4,4 +4,5 @@ class TestingConfig(BaseConfig):
     TESTING = True
     DEBUG = True
     MAX_CONTENT_LENGTH = 1 * 1024 * 1024  # 1MB for testing
-    ENABLE_PROMETHEUS = False
\ No newline at end of file
+    ENABLE_PROMETHEUS = False
+    CLASSIFICATION_CACHE_SIZE = 0
\ No newline at end of file
@@ -1 +1 @@
-FLASK_APP=src.api.routes FLASK_ENV=development /Users/bradmallow/Library/Python/3.9/bin/flask run --host=0.0.0.0
+FLASK_APP=src.api.app:create_app FLASK_ENV=development /Users/bradmallow/Library/Python/3.9/bin/flask run --host=0.0.0.0
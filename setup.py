@@ -17,8 +17,12 @@ setup(
         "Pillow>=8.0.0",
         "pytesseract>=0.3.8",
         "PyPDF2>=2.0.0",
+        "pyahocorasick>=2.0.0",
     ],
     extras_require={
+        "ocr": [
+            "tesserocr>=2.5.0",
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.0.0",
@@ -0,0 +1,25 @@
+from flask import Flask
+from .extensions import classifier_ext
+from typing import Optional, Union
+
+def create_app(config_object: Optional[Union[str, object]] = None) -> Flask:
+    """
+    Application factory.
+    
+    Args:
+        config_object: Config class or import path, defaults to BaseConfig
+    """
+    app = Flask(__name__)
+    app.config.from_object(config_object or 'config.base.BaseConfig')
+
+    from .routes import api
+    from .batch_routes import batch_api
+    from .monitoring import monitoring
+
+    app.register_blueprint(api)
+    app.register_blueprint(batch_api)
+    app.register_blueprint(monitoring)
+
+    classifier_ext.init_app(app)
+
+    return app
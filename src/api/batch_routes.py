@@ -1,8 +1,8 @@
 from flask import Blueprint, request, jsonify, current_app
-from werkzeug.utils import secure_filename
 from ..core.tasks import process_batch
 from ..core.storage import DocumentStore
-from ..utils.file_utils import BatchFileManager
+from ..utils.file_utils import BatchFileManager, UploadRejected, UploadTooLarge
+from .ingest import ingest_request
 from ..utils.logging import RequestLogger, AuditLogger, MetricsLogger
 import uuid
 import time
@@ -30,51 +30,41 @@ def submit_batch():
     document_ids = []
 
     try:
-        if not request.files:
-            return jsonify({"error": "No files submitted"}), 400
-
+        # Spool every part to disk as it arrives; size, extension and type
+        # are checked mid-stream so memory stays flat for any batch size
         batch_manager = _init_batch_manager()
-        files = []
+        try:
+            upload = ingest_request(batch_manager, max_files=batch_manager.max_batch_size)
+        except UploadTooLarge as e:
+            return jsonify({"error": str(e)}), 413
+        except UploadRejected as e:
+            return jsonify({"error": "Invalid files in batch", "detail": str(e)}), 400
+
+        files = upload.contexts
+        if not files:
+            return jsonify({"error": "No valid files in batch"}), 400
 
-        for file in request.files.values():
-            if file and file.filename:
+        try:
+            # Store documents with the facts computed while receiving them
+            industry = upload.form.get("industry")
+            for context in files:
                 doc_id = str(uuid.uuid4())
                 document_ids.append(doc_id)
-                
-                files.append({
-                    "id": doc_id,
-                    "filename": secure_filename(file.filename),
-                    "content": file.read(),
-                    "industry": request.form.get("industry")
+                store.store_document(doc_id, {
+                    "filename": context.filename,
+                    "document": context.to_dict(),
+                    "industry": industry,
+                    "status": "pending",
+                    "batch_id": batch_id,
+                    "submitted_at": time.time()
                 })
 
-        if not files:
-            return jsonify({"error": "No valid files in batch"}), 400
-
-        # Validate batch
-        validation_results = batch_manager.validate_batch(
-            [(f["filename"], f["content"]) for f in files]
-        )
-
-        invalid_files = [r for r in validation_results if not r["valid"]]
-        if invalid_files:
-            return jsonify({
-                "error": "Invalid files in batch",
-                "invalid_files": invalid_files
-            }), 400
-
-        # Store documents
-        for file in files:
-            store.store_document(file["id"], {
-                "filename": file["filename"],
-                "industry": file["industry"],
-                "status": "pending",
-                "batch_id": batch_id,
-                "submitted_at": time.time()
-            })
-
-        # Submit batch for processing
-        process_batch.delay(batch_id, document_ids)
+            # Submit batch for processing; the worker owns the spool references from here
+            process_batch.delay(batch_id, document_ids)
+        except Exception:
+            # No worker will see these uploads
+            batch_manager.release(*files)
+            raise
 
         # Log batch submission
         metrics_logger.log_batch_metrics(
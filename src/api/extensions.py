@@ -0,0 +1,34 @@
+from flask import Flask, current_app
+from ..core.classifier import DocumentClassifier, get_classifier
+from ..core.extractors.ocr import configure_ocr_engines, configure_ocr_pool
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ClassifierExtension:
+    """Flask extension exposing the process-wide DocumentClassifier."""
+
+    def __init__(self, app: Optional[Flask] = None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        """Warm the shared classifier and attach it to the app."""
+        classifier = get_classifier(app.config)
+        configure_ocr_engines(
+            app.config.get('OCR_ENGINES_PER_PROCESS', 1),
+            max_pages=app.config.get('OCR_ENGINE_MAX_PAGES', 500),
+            max_waiting=app.config.get('OCR_QUEUE_SIZE', 8),
+            engine=app.config.get('OCR_ENGINE')
+        )
+        configure_ocr_pool(app.config.get('OCR_POOL_SIZE'), app.config.get('WEB_CONCURRENCY', 1))
+        app.extensions['classifier'] = classifier
+        logger.info("Initialized shared document classifier")
+
+    @property
+    def classifier(self) -> DocumentClassifier:
+        """Classifier bound to the current app."""
+        return current_app.extensions['classifier']
+
+classifier_ext = ClassifierExtension()
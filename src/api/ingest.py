@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from typing import BinaryIO, List, Optional, Union
+from flask import request
+from werkzeug.datastructures import MultiDict
+from werkzeug.sansio.multipart import MultipartDecoder, Field, File, Data, Epilogue, NeedData
+from werkzeug.utils import secure_filename
+from ..core.models.context import DocumentContext
+from ..utils.file_utils import FileManager, UploadRejected, UploadWriter, MemoryUploadWriter
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 256 * 1024
+MAX_FIELD_SIZE = 64 * 1024  # Non-file fields are small (industry, budgets)
+
+@dataclass
+class IngestedRequest:
+    """Form fields and spooled uploads of a multipart request."""
+    form: MultiDict = field(default_factory=MultiDict)
+    files: MultiDict = field(default_factory=MultiDict)
+
+    @property
+    def contexts(self) -> List[DocumentContext]:
+        return list(self.files.values())
+
+def ingest_multipart(
+    stream: BinaryIO,
+    boundary: bytes,
+    file_manager: FileManager,
+    max_files: Optional[int] = None,
+    in_memory: bool = False
+) -> IngestedRequest:
+    """
+    Parse a multipart body, spooling each file part straight to the upload spool.
+
+    Parts are written as they arrive while their hash, size and MIME
+    signature are computed, so memory use does not grow with the upload or
+    batch size. Extension, size and MIME type are checked as early as the
+    data allows; on any rejection, files already spooled for this request
+    are released and UploadRejected (or UploadTooLarge) is raised.
+
+    With `in_memory`, file parts are kept as in-memory DocumentContexts
+    instead; callers should only ask for this for small request bodies.
+    """
+    # The decoder buffer only ever holds about one unread chunk
+    decoder = MultipartDecoder(boundary, max_form_memory_size=4 * READ_CHUNK_SIZE)
+    ingested = IngestedRequest()
+    writer: Optional[Union[UploadWriter, MemoryUploadWriter]] = None
+    part_name: Optional[str] = None
+    field_data = bytearray()
+
+    try:
+        while True:
+            chunk = stream.read(READ_CHUNK_SIZE)
+            decoder.receive_data(chunk or None)
+            event = decoder.next_event()
+            while not isinstance(event, (NeedData, Epilogue)):
+                if isinstance(event, File):
+                    # An empty file input has no filename and is skipped
+                    part_name, writer = None, None
+                    if event.filename:
+                        part_name = event.name
+                        writer = _open_part(event, file_manager, ingested, max_files, in_memory)
+                elif isinstance(event, Field):
+                    part_name, writer = event.name, None
+                    field_data.clear()
+                elif isinstance(event, Data):
+                    if writer is not None:
+                        writer.write(event.data)
+                    elif part_name is not None:
+                        field_data += event.data
+                        if len(field_data) > MAX_FIELD_SIZE:
+                            raise UploadRejected(f"Form field '{part_name}' is too large")
+                    if not event.more_data:
+                        _close_part(writer, part_name, field_data, file_manager, ingested)
+                        writer, part_name = None, None
+                event = decoder.next_event()
+            if isinstance(event, Epilogue):
+                break
+            if not chunk:
+                raise UploadRejected("Incomplete multipart body")
+    except Exception as e:
+        if writer is not None:
+            writer.abort()
+        file_manager.release(*ingested.contexts)
+        if isinstance(e, ValueError) and not isinstance(e, UploadRejected):
+            raise UploadRejected(f"Malformed multipart body: {str(e)}") from e
+        raise
+
+    return ingested
+
+def _open_part(
+    event: File,
+    file_manager: FileManager,
+    ingested: IngestedRequest,
+    max_files: Optional[int],
+    in_memory: bool
+) -> Union[UploadWriter, MemoryUploadWriter]:
+    """Validate a file part's headers and start spooling it."""
+    if max_files is not None and len(ingested.files) >= max_files:
+        raise UploadRejected(f"Too many files; maximum is {max_files}")
+
+    filename = secure_filename(event.filename)
+    ext = os.path.splitext(filename)[1].lower().lstrip('.')
+    if ext not in file_manager.allowed_extensions:
+        raise UploadRejected(f"Extension .{ext} not allowed")
+
+    return file_manager.open_upload(filename, in_memory)
+
+def _close_part(
+    writer: Optional[Union[UploadWriter, MemoryUploadWriter]],
+    part_name: Optional[str],
+    field_data: bytearray,
+    file_manager: FileManager,
+    ingested: IngestedRequest
+):
+    """Finish a part: commit and type-check a file, or decode a form field."""
+    if writer is None:
+        if part_name is not None:
+            ingested.form.add(part_name, field_data.decode('utf-8', 'replace'))
+        return
+
+    context = writer.commit()
+    ingested.files.add(part_name, context)
+    if not file_manager._is_mime_type_allowed(context.mime_type):
+        raise UploadRejected(f"MIME type {context.mime_type} not allowed")
+
+def ingest_request(
+    file_manager: FileManager,
+    max_files: Optional[int] = None,
+    memory_limit: Optional[int] = None
+) -> IngestedRequest:
+    """
+    Stream the current Flask request's multipart body to the upload spool.
+
+    Requests whose declared body size is at most `memory_limit` bytes are
+    kept in memory instead, saving the disk write and unlink.
+    """
+    if request.mimetype != 'multipart/form-data':
+        raise UploadRejected("Expected a multipart/form-data request")
+    boundary = request.mimetype_params.get('boundary', '').encode('latin-1')
+    if not boundary:
+        raise UploadRejected("Missing multipart boundary")
+    in_memory = (
+        memory_limit is not None
+        and request.content_length is not None
+        and request.content_length <= memory_limit
+    )
+    return ingest_multipart(request.stream, boundary, file_manager, max_files, in_memory)
@@ -1,10 +1,10 @@
 from flask import Blueprint, request, jsonify, current_app
-from werkzeug.utils import secure_filename
-from ..core.classifier import DocumentClassifier
 from ..core.tasks import classify_document
 from ..exceptions.classification_exceptions import ClassificationError
-from ..utils.file_utils import FileManager
+from ..utils.file_utils import FileManager, UploadRejected, UploadTooLarge
 from ..utils.logging import RequestLogger, AuditLogger
+from .extensions import classifier_ext
+from .ingest import ingest_request
 import os
 import time
 import uuid
@@ -21,6 +21,27 @@ def _init_file_manager():
         max_file_size=current_app.config['MAX_CONTENT_LENGTH']
     )
 
+def _ingest_single_file(file_manager: FileManager, memory_limit: Optional[int] = None):
+    """
+    Stream a single-file upload to disk, or into memory below `memory_limit` bytes.
+    Returns (ingested_request, context, error_response).
+    """
+    try:
+        upload = ingest_request(file_manager, max_files=1, memory_limit=memory_limit)
+    except UploadTooLarge as e:
+        return None, None, (jsonify({"error": str(e)}), 413)
+    except UploadRejected as e:
+        return None, None, (jsonify({"error": str(e)}), 400)
+
+    context = upload.files.get('file')
+    if context is None:
+        file_manager.release(*upload.contexts)
+        return upload, None, (jsonify({
+            "error": "No file part in the request",
+            "allowed_extensions": list(current_app.config['ALLOWED_EXTENSIONS'])
+        }), 400)
+    return upload, context, None
+
 @api.before_request
 def before_request():
     request.start_time = time.time()
@@ -44,32 +65,31 @@ def after_request(response):
 @api.route('/classify', methods=['POST'])
 def classify_file():
     try:
-        if 'file' not in request.files:
-            return jsonify({
-                "error": "No file part in the request",
-                "allowed_extensions": list(current_app.config['ALLOWED_EXTENSIONS'])
-            }), 400
-
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({"error": "No selected file"}), 400
-
+        # Small uploads stay in memory and are classified from the buffer;
+        # larger ones are streamed to disk. Either way hash, size and type
+        # are computed on the way in.
         file_manager = _init_file_manager()
-        is_valid, error = file_manager.validate_file(file)
-        if not is_valid:
-            return jsonify({"error": error}), 400
-
-        # Save file
-        filename = secure_filename(file.filename)
-        file_path, file_hash = file_manager.save_uploaded_file(file, filename)
+        upload, context, error_response = _ingest_single_file(
+            file_manager, current_app.config.get('CLASSIFY_IN_MEMORY_MAX_SIZE')
+        )
+        if error_response:
+            return error_response
+        file_hash = context.file_hash
 
         try:
             # Get industry from request if provided
-            industry = request.form.get('industry')
+            industry = upload.form.get('industry')
+            max_pages = upload.form.get('max_pages', type=int)
+            time_budget = upload.form.get('time_budget', type=float)
             
-            # Classify document
-            classifier = DocumentClassifier()
-            result = classifier.classify(file_path, industry=industry)
+            # Classify document with the shared, pre-warmed classifier
+            result = classifier_ext.classifier.classify(
+                context,
+                industry=industry,
+                return_extracted_text=current_app.config.get('INCLUDE_EXTRACTED_TEXT', False),
+                max_pages=max_pages,
+                time_budget=time_budget
+            )
             
             # Log classification
             audit_logger.log_classification(
@@ -89,7 +109,8 @@ def classify_file():
                     "file_size": result.file_size,
                     "file_hash": result.file_hash,
                     "industry": result.industry,
-                    "processed_at": result.processed_at.isoformat()
+                    "processed_at": result.processed_at.isoformat(),
+                    "pages_read": result.metadata.get('pages_read')
                 }
             }
             
@@ -99,8 +120,8 @@ def classify_file():
             return jsonify(response), 200
 
         finally:
-            # Clean up uploaded file
-            file_manager.cleanup_temp_files(file_path)
+            # Drop this request's reference to the spooled upload
+            file_manager.release(context)
 
     except ClassificationError as e:
         request_logger.log_error(
@@ -119,28 +140,24 @@ def classify_file():
 @api.route('/classify/async', methods=['POST'])
 def classify_file_async():
     try:
-        if 'file' not in request.files:
-            return jsonify({"error": "No file part"}), 400
-
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({"error": "No selected file"}), 400
-
+        # Spool to the shared upload folder; the worker reads it from there
+        # and releases the spool reference when done
         file_manager = _init_file_manager()
-        is_valid, error = file_manager.validate_file(file)
-        if not is_valid:
-            return jsonify({"error": error}), 400
+        upload, context, error_response = _ingest_single_file(file_manager)
+        if error_response:
+            return error_response
 
-        # Read file content and get industry
-        file_content = file.read()
-        industry = request.form.get('industry')
-        
         # Submit async task
-        task = classify_document.delay(
-            file_content=file_content,
-            filename=secure_filename(file.filename),
-            industry=industry
-        )
+        try:
+            task = classify_document.delay(
+                document=context.to_dict(),
+                filename=context.filename,
+                industry=upload.form.get('industry')
+            )
+        except Exception:
+            # No worker will see this upload
+            file_manager.release(context)
+            raise
         
         return jsonify({
             "task_id": task.id,
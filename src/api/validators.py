@@ -1,9 +1,9 @@
 from typing import Tuple, Optional, Set, Dict, Any
 from werkzeug.datastructures import FileStorage
-import magic
 import os
 from functools import wraps
 from flask import request, jsonify, current_app
+from ..core.extractors.mime import detect_stream_mime_type
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,9 +11,6 @@ logger = logging.getLogger(__name__)
 class RequestValidator:
     """Validator for API request data."""
     
-    def __init__(self):
-        self.mime = magic.Magic(mime=True)
-
     def validate_file(self, file: FileStorage) -> Tuple[bool, Optional[str]]:
         """
         Validate uploaded file.
@@ -42,9 +39,7 @@ class RequestValidator:
                 return False, f"File too large. Maximum size: {max_mb}MB"
 
             # Check MIME type
-            file_content = file.read(2048)  # Read first 2KB for MIME detection
-            file.seek(0)
-            mime_type = self.mime.from_buffer(file_content)
+            mime_type = detect_stream_mime_type(file.stream)
             
             if not self._allowed_mime_type(mime_type):
                 return False, f"Invalid file type: {mime_type}"
@@ -0,0 +1,160 @@
+from typing import Optional, Dict, Any
+from collections import OrderedDict
+from .monitoring.prometheus import CACHE_HITS, CACHE_MISSES
+import threading
+import json
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with per-entry TTL."""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[int] = 3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return cached value or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any):
+        """Store value, evicting least recently used entries when full."""
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class RedisCache:
+    """Redis-backed cache tier storing JSON-encoded values."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client=None,
+        ttl: Optional[int] = 86400,
+        prefix: str = "classification"
+    ):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(redis_url)
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached value or None; Redis failures are treated as misses."""
+        try:
+            raw = self.client.get(f"{self.prefix}:{key}")
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store value; Redis failures are logged and ignored."""
+        try:
+            self.client.set(
+                f"{self.prefix}:{key}",
+                json.dumps(value, default=str),
+                ex=self.ttl or None
+            )
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {str(e)}")
+
+class ClassificationCache:
+    """
+    Two-tier cache for classification results.
+
+    Entries are keyed by (file_hash, industry, strategy_version). The
+    in-process LRU is checked first, then the optional Redis tier; Redis
+    hits are promoted into the LRU.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[int] = 3600,
+        redis_tier: Optional[RedisCache] = None
+    ):
+        self.memory = LRUCache(max_size=max_size, ttl=ttl)
+        self.redis = redis_tier
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ClassificationCache':
+        """Build cache from application config (e.g. Flask app.config)."""
+        redis_tier = None
+        if config.get('CLASSIFICATION_CACHE_REDIS'):
+            redis_tier = RedisCache(
+                redis_url=config['REDIS_URL'],
+                ttl=config.get('CLASSIFICATION_CACHE_REDIS_TTL', 86400)
+            )
+        return cls(
+            max_size=config.get('CLASSIFICATION_CACHE_SIZE', 1024),
+            ttl=config.get('CLASSIFICATION_CACHE_TTL', 3600),
+            redis_tier=redis_tier
+        )
+
+    @staticmethod
+    def make_key(file_hash: str, industry: Optional[str], strategy_version: str) -> str:
+        """Build cache key for a document/industry/strategy-set combination."""
+        return f"{strategy_version}:{industry or '*'}:{file_hash}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a classification result in all tiers."""
+        value = self.memory.get(key)
+        if value is not None:
+            CACHE_HITS.labels(cache_type='memory').inc()
+            return value
+        CACHE_MISSES.labels(cache_type='memory').inc()
+
+        if self.redis is None:
+            return None
+
+        value = self.redis.get(key)
+        if value is not None:
+            CACHE_HITS.labels(cache_type='redis').inc()
+            self.memory.set(key, value)
+            return value
+        CACHE_MISSES.labels(cache_type='redis').inc()
+        return None
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Store a classification result in all tiers."""
+        self.memory.set(key, value)
+        if self.redis is not None:
+            self.redis.set(key, value)
+
+    def clear(self):
+        """
+        Drop in-process entries. Redis entries are left to expire since
+        strategy-version changes already move lookups to a new key space.
+        """
+        self.memory.clear()
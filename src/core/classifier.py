@@ -1,31 +1,78 @@
-from typing import Optional, Dict, Type, List
+from typing import Any, Optional, Dict, Mapping, Type, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from .extractors.registry import ExtractorRegistry
 from .strategies.base import BaseIndustryStrategy
+from .strategies.keywords import KeywordIndex
+from .strategies.features import DocumentFeatures
 from .models.document import Document
+from .models.context import DocumentContext
 from .extractors.base import ExtractedContent
+from .cache import ClassificationCache
+from .monitoring.prometheus import (
+    PROCESSED_DOCUMENTS, CLASSIFICATION_CONFIDENCE,
+    STRATEGY_EVALUATIONS, STRATEGY_EVALUATIONS_SKIPPED
+)
 from ..exceptions.classification_exceptions import ClassificationError
-from ..utils.file_utils import FileManager
+import copy
 import hashlib
+import json
 import os
+import threading
+import time
 import logging
-from prometheus_client import Summary, Counter, Histogram
+from contextlib import closing
+from prometheus_client import Summary
 
 logger = logging.getLogger(__name__)
 
 # Metrics
 CLASSIFICATION_TIME = Summary('document_classification_seconds', 'Time spent classifying documents')
-DOCUMENTS_PROCESSED = Counter('documents_processed_total', 'Total number of documents processed', ['industry', 'document_type'])
-CLASSIFICATION_CONFIDENCE = Histogram('classification_confidence', 'Classification confidence scores', ['industry', 'document_type'])
 
 class DocumentClassifier:
-    def __init__(self):
-        self.registry = ExtractorRegistry()
+    def __init__(
+        self,
+        cache: Optional[ClassificationCache] = None,
+        early_exit_threshold: Optional[float] = 0.9,
+        max_pages: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        pdf_extract_tables: bool = True
+    ):
+        """
+        Args:
+            cache: Result cache, defaults to an in-process LRU
+            early_exit_threshold: Stop generic classification (and page
+                extraction) once a strategy reaches this confidence;
+                None evaluates everything
+            max_pages: Default per-document page budget
+            time_budget: Default per-document extraction time budget in seconds
+            pdf_extract_tables: Run the PDF table finder (pages with ruling lines)
+        """
+        self.registry = ExtractorRegistry(
+            options={'pdf:PDFExtractor': {'extract_tables': pdf_extract_tables}}
+        )
         self.strategies: Dict[str, BaseIndustryStrategy] = {}
+        self.cache = cache if cache is not None else ClassificationCache()
+        self.early_exit_threshold = early_exit_threshold
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.pdf_extract_tables = pdf_extract_tables
+        self.strategy_version = ''
+        self.keyword_index = KeywordIndex([])
+        self._strategy_rank: Dict[str, int] = {}
+        self._strategy_hits: Dict[str, int] = {}
+        self._hits_lock = threading.Lock()
         self._register_strategies()
-        self.file_manager = FileManager(
-            upload_dir='uploads',
-            allowed_extensions={'pdf', 'doc', 'docx', 'jpg', 'jpeg', 'png', 'tiff', 'xls', 'xlsx'},
-            max_file_size=10 * 1024 * 1024  # 10MB
+    
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> 'DocumentClassifier':
+        """Build a classifier from application config (e.g. Flask app.config)."""
+        settings = classifier_settings(config)
+        return cls(
+            cache=ClassificationCache.from_config(settings),
+            early_exit_threshold=settings['EARLY_EXIT_CONFIDENCE'],
+            max_pages=settings['EXTRACTION_MAX_PAGES'],
+            time_budget=settings['EXTRACTION_TIME_BUDGET'],
+            pdf_extract_tables=settings['PDF_EXTRACT_TABLES']
         )
         
     def _register_strategies(self):
@@ -39,102 +86,387 @@ class DocumentClassifier:
         ]
         
         for strategy_class in strategies:
-            strategy = strategy_class()
-            self.strategies[strategy.industry_name] = strategy
-            logger.info(f"Registered {strategy.industry_name} industry strategy")
+            self.register_strategy(strategy_class())
+
+    def register_strategy(self, strategy: BaseIndustryStrategy):
+        """Register an industry strategy and invalidate cached results."""
+        strategy.rules  # compile rule patterns up front
+        self.strategies[strategy.industry_name] = strategy
+        self._strategy_rank = {name: rank for rank, name in enumerate(self.strategies)}
+        self.keyword_index = KeywordIndex(self.strategies.values())
+        self.strategy_version = self._calculate_strategy_version()
+        self.cache.clear()
+        logger.info(f"Registered {strategy.industry_name} industry strategy")
+
+    def _calculate_strategy_version(self) -> str:
+        """Fingerprint the registered strategy set and result-affecting options for cache keying."""
+        fingerprint = {
+            'early_exit_threshold': self.early_exit_threshold,
+            'pdf_extract_tables': self.pdf_extract_tables,
+            'strategies': {
+                name: {
+                    'class': type(strategy).__qualname__,
+                    'version': strategy.version,
+                    'document_types': strategy.document_types,
+                    'keywords': strategy.keywords,
+                    'rule_patterns': strategy.rule_patterns
+                }
+                for name, strategy in self.strategies.items()
+            }
+        }
+        encoded = json.dumps(fingerprint, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
     
     @CLASSIFICATION_TIME.time()
     def classify(
         self,
-        file_path: str,
+        document: Union[str, DocumentContext],
         industry: Optional[str] = None,
-        return_extracted_text: bool = False
+        return_extracted_text: bool = False,
+        max_pages: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        mime_type: Optional[str] = None
     ) -> Document:
         """
         Classify a document, optionally within a specific industry context.
         If no industry is specified, tries all registered strategies.
+        
+        Extraction stops after `max_pages` pages, after `time_budget`
+        seconds, or once a strategy is confident; defaults come from the
+        classifier. The number of pages read is in metadata['pages_read'].
+        With `return_extracted_text`, extraction does not stop early on
+        confidence and the Document carries the extracted text.
+        
+        `document` is a path or a DocumentContext built at ingestion; a
+        context's hash, size and MIME type are used as is. Pass
+        `mime_type` with a path when it was detected at upload.
         """
         try:
-            # Validate file
-            if not os.path.exists(file_path):
-                raise ClassificationError(f"File not found: {file_path}")
-            
-            # Get file metadata
-            file_size = os.path.getsize(file_path)
-            file_hash = self._calculate_file_hash(file_path)
-            
-            # Get appropriate extractor and extract content
-            extractor = self.registry.get_extractor(file_path)
-            content = extractor.extract_content(file_path)
+            self._validate_industry(industry)
+            context = self._get_context(document, mime_type)
             
-            # Enhance classification with format-specific features
-            enhancement = self._enhance_classification(content)
-            
-            if industry:
-                if industry not in self.strategies:
-                    raise ClassificationError(f"Unknown industry: {industry}")
-                result = self._classify_with_strategy(
-                    self.strategies[industry],
-                    content,
-                    enhancement
+            # Serve repeated uploads from the result cache
+            cache_key = ClassificationCache.make_key(context.file_hash, industry, self.strategy_version)
+            result = self._cached_result(cache_key, return_extracted_text)
+            if result is None:
+                content, enhancement, features = self._extract(
+                    context, industry, max_pages, time_budget,
+                    early_exit=not return_extracted_text
                 )
-            else:
-                result = self._classify_generic(content, enhancement)
+                result = self._classify_content(content, enhancement, features, industry)
+                self._cache_result(cache_key, result, return_extracted_text)
             
-            # Record metrics
-            DOCUMENTS_PROCESSED.labels(
-                industry=industry or 'unknown',
-                document_type=result['document_type']
-            ).inc()
-            
-            CLASSIFICATION_CONFIDENCE.labels(
-                industry=industry or 'unknown',
-                document_type=result['document_type']
-            ).observe(result['confidence_score'])
-            
-            # Create document instance
-            document = Document(
-                file_path=file_path,
-                document_type=result['document_type'],
-                confidence_score=result['confidence_score'],
-                mime_type=content.metadata['mime_type'],
-                file_size=file_size,
-                file_hash=file_hash,
-                industry=industry,
-                extracted_text=content.text if return_extracted_text else None,
-                metadata={
-                    **content.metadata,
-                    **enhancement,
-                    'classification_method': result['method']
-                },
-                tables=content.tables,
-                headers=content.headers,
-                footers=content.footers
-            )
-            
-            logger.info(
-                "Document classified successfully",
-                extra={
-                    'document_type': document.document_type,
-                    'confidence_score': document.confidence_score,
-                    'industry': document.industry,
-                    'file_size': document.file_size
-                }
-            )
-            
-            return document
+            return self._build_document(context, industry, result, return_extracted_text)
             
         except Exception as e:
             logger.error(f"Classification error: {str(e)}", exc_info=True)
             raise ClassificationError(f"Error classifying document: {str(e)}")
     
-    def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA-256 hash of file contents."""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+    def classify_bytes(
+        self,
+        buffer: Union[bytes, memoryview],
+        filename: Optional[str] = None,
+        industry: Optional[str] = None,
+        return_extracted_text: bool = False,
+        max_pages: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        mime_type: Optional[str] = None
+    ) -> Document:
+        """
+        Classify an in-memory document without writing it to disk.
+        
+        Extractors read the buffer directly; one that can only read files
+        gets a temporary copy. Otherwise behaves like `classify`.
+        """
+        try:
+            context = DocumentContext.from_bytes(buffer, filename, mime_type)
+        except Exception as e:
+            raise ClassificationError(f"Error classifying document: {str(e)}")
+        return self.classify(
+            context,
+            industry=industry,
+            return_extracted_text=return_extracted_text,
+            max_pages=max_pages,
+            time_budget=time_budget
+        )
+    
+    def classify_many(
+        self,
+        documents: List[Union[str, DocumentContext]],
+        industry: Optional[str] = None,
+        return_extracted_text: bool = False,
+        max_workers: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> List[Union[Document, ClassificationError]]:
+        """
+        Classify a batch of documents.
+        
+        Extraction runs concurrently; keyword scoring for every document
+        and document type is then a single matrix product. Results match
+        per-document `classify` and keep the order of `documents`; a
+        document that fails yields its ClassificationError in its slot.
+        """
+        self._validate_industry(industry)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            items = list(pool.map(
+                lambda document: self._prepare_batch_item(
+                    document, industry, max_pages, time_budget, return_extracted_text
+                ),
+                documents
+            ))
+        
+        # Score all uncached documents against all document types at once
+        pending = [item for item in items if 'features' in item]
+        if pending:
+            scores = self.keyword_index.score_matrix(
+                [item['features'].keyword_hits for item in pending]
+            )
+            for item, row in zip(pending, scores):
+                item['features'].keyword_scores = self.keyword_index.scores_by_industry(row)
+        
+        results: List[Union[Document, ClassificationError]] = []
+        for item in items:
+            try:
+                if 'error' in item:
+                    raise item['error']
+                result = item.get('result')
+                if result is None:
+                    result = self._classify_content(
+                        item['content'], item['enhancement'], item['features'], industry
+                    )
+                    self._cache_result(item['cache_key'], result, return_extracted_text)
+                results.append(self._build_document(
+                    item['context'], industry, result, return_extracted_text
+                ))
+            except Exception as e:
+                logger.error(f"Classification error for {item['name']}: {str(e)}", exc_info=True)
+                results.append(ClassificationError(f"Error classifying document: {str(e)}"))
+        
+        return results
+    
+    def _prepare_batch_item(
+        self,
+        document: Union[str, DocumentContext],
+        industry: Optional[str],
+        max_pages: Optional[int],
+        time_budget: Optional[float],
+        return_extracted_text: bool
+    ) -> dict:
+        """Hash, look up and (on a cache miss) extract one batch document."""
+        item = {'name': document if isinstance(document, str) else document.name}
+        try:
+            item['context'] = context = self._get_context(document)
+            item['cache_key'] = ClassificationCache.make_key(
+                context.file_hash, industry, self.strategy_version
+            )
+            item['result'] = self._cached_result(item['cache_key'], return_extracted_text)
+            if item['result'] is None:
+                item['content'], item['enhancement'], item['features'] = self._extract(
+                    context, industry, max_pages, time_budget,
+                    early_exit=not return_extracted_text
+                )
+        except Exception as e:
+            item['error'] = e
+        return item
+    
+    def _validate_industry(self, industry: Optional[str]):
+        """Raise if an unknown industry was requested."""
+        if industry and industry not in self.strategies:
+            raise ClassificationError(f"Unknown industry: {industry}")
+    
+    def _get_context(
+        self,
+        document: Union[str, DocumentContext],
+        mime_type: Optional[str] = None
+    ) -> DocumentContext:
+        """Use a caller's DocumentContext, or hash, size and sniff a path in one read."""
+        if isinstance(document, DocumentContext):
+            return document
+        if not os.path.isfile(document):
+            raise ClassificationError(f"File not found: {document}")
+        return DocumentContext.from_path(document, mime_type)
+    
+    def _cached_result(self, cache_key: str, return_extracted_text: bool) -> Optional[dict]:
+        """
+        Look up a cached result usable for this call.
+        
+        Only results cached for a caller that wanted the extracted text
+        hold it (and those never stopped early on confidence), so others
+        are a miss when the text is requested. The in-process tier hands
+        out its stored object, so callers get a copy they may mutate.
+        """
+        result = self.cache.get(cache_key)
+        if result is None or (return_extracted_text and result['extracted_text'] is None):
+            return None
+        return copy.deepcopy(result)
+    
+    def _cache_result(self, cache_key: str, result: dict, return_extracted_text: bool):
+        """
+        Cache a result unless extraction was cut short by a budget.
+        
+        The extracted text is only kept when the caller asked for it, so
+        entries stay small and document text is not copied into the
+        shared Redis tier needlessly.
+        """
+        if result['metadata'].get('extraction_stopped') in ('page_budget', 'time_budget'):
+            return
+        # Stored apart from the result the caller is about to receive
+        result = copy.deepcopy(result)
+        if not return_extracted_text:
+            result['extracted_text'] = None
+        self.cache.set(cache_key, result)
+    
+    def _extract(
+        self,
+        context: DocumentContext,
+        industry: Optional[str] = None,
+        max_pages: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        early_exit: bool = True
+    ) -> Tuple[ExtractedContent, dict, DocumentFeatures]:
+        """
+        Extract content page by page and compute shared classification features.
+        
+        Extraction stops at the page or time budget, or (with `early_exit`)
+        once a strategy is confident on the pages read so far. Confidence
+        is checked after pages 1, 2, 4, 8, ... to keep re-scanning linear
+        overall.
+        """
+        max_pages = max_pages or self.max_pages
+        time_budget = time_budget or self.time_budget
+        deadline = time.monotonic() + time_budget if time_budget else None
+        
+        extractor = self.registry.get_extractor(context.file_path, context.mime_type)
+        pages: List[ExtractedContent] = []
+        stop_reason = None
+        next_check = 1
+        
+        with closing(extractor.iter_document(context)) as page_iter:
+            for page in page_iter:
+                pages.append(page)
+                if max_pages and len(pages) >= max_pages:
+                    stop_reason = 'page_budget'
+                    break
+                if deadline and time.monotonic() >= deadline:
+                    stop_reason = 'time_budget'
+                    break
+                if early_exit and self.early_exit_threshold is not None and len(pages) >= next_check:
+                    next_check *= 2
+                    if self._is_confident(' '.join(p.text for p in pages), industry):
+                        stop_reason = 'confident'
+                        break
+        
+        if not pages:
+            raise ClassificationError(f"No content extracted from {context.name}")
+        
+        content = extractor.combine_pages(pages)
+        # Image references point at the context's file, which may be a spooled
+        # upload released after the request; results must not outlive it
+        content.images = None
+        content.metadata['mime_type'] = context.mime_type
+        content.metadata['pages_read'] = len(pages)
+        if stop_reason:
+            content.metadata['extraction_stopped'] = stop_reason
+        
+        # Enhance classification with format-specific features
+        enhancement = self._enhance_classification(content)
+        
+        # Features are computed once and shared by every strategy
+        features = self._build_features(content.text, enhancement, content.tables)
+        
+        return content, enhancement, features
+    
+    def _is_confident(self, text: str, industry: Optional[str]) -> bool:
+        """Check whether partial text already clears the early-exit threshold."""
+        features = self._build_features(text, {})
+        strategies = [self.strategies[industry]] if industry else self._ordered_strategies()
+        return any(
+            strategy.classify_features(features)['confidence_score'] >= self.early_exit_threshold
+            for strategy in strategies
+        )
+    
+    def _classify_content(
+        self,
+        content: ExtractedContent,
+        enhancement: dict,
+        features: DocumentFeatures,
+        industry: Optional[str]
+    ) -> dict:
+        """Classify extracted content, returning a cacheable result."""
+        if industry:
+            result = self._classify_with_strategy(
+                self.strategies[industry],
+                features
+            )
+        else:
+            result = self._classify_generic(features)
+        
+        return {
+            'document_type': result['document_type'],
+            'confidence_score': result['confidence_score'],
+            'mime_type': content.metadata['mime_type'],
+            'extracted_text': content.text,
+            'metadata': {
+                **content.metadata,
+                **enhancement,
+                'classification_method': result['method']
+            },
+            # Cached results hold plain lists, not extractor table objects
+            'tables': [
+                table.tolist() if hasattr(table, 'tolist') else table
+                for table in content.tables
+            ] if content.tables else content.tables,
+            'headers': content.headers,
+            'footers': content.footers
+        }
+    
+    def _build_document(
+        self,
+        context: DocumentContext,
+        industry: Optional[str],
+        result: dict,
+        return_extracted_text: bool
+    ) -> Document:
+        """Record metrics and build a Document from a classification result."""
+        PROCESSED_DOCUMENTS.labels(
+            industry=industry or 'unknown',
+            status='success',
+            document_type=result['document_type']
+        ).inc()
+        
+        CLASSIFICATION_CONFIDENCE.labels(
+            industry=industry or 'unknown',
+            document_type=result['document_type']
+        ).observe(result['confidence_score'])
+        
+        document = Document(
+            file_path=context.name,
+            document_type=result['document_type'],
+            confidence_score=result['confidence_score'],
+            mime_type=result['mime_type'],
+            file_size=context.file_size,
+            file_hash=context.file_hash,
+            industry=industry,
+            extracted_text=result['extracted_text'] if return_extracted_text else None,
+            metadata=dict(result['metadata']),
+            tables=result['tables'],
+            headers=result['headers'],
+            footers=result['footers']
+        )
+        
+        logger.info(
+            "Document classified successfully",
+            extra={
+                'document_type': document.document_type,
+                'confidence_score': document.confidence_score,
+                'industry': document.industry,
+                'file_size': document.file_size
+            }
+        )
+        
+        return document
     
     def _enhance_classification(self, content: ExtractedContent) -> dict:
         """Extract format-specific features to enhance classification."""
@@ -159,19 +491,33 @@ class DocumentClassifier:
         
         return enhancement
     
+    def _build_features(
+        self,
+        text: str,
+        metadata: dict,
+        tables: Optional[List[List[str]]] = None
+    ) -> DocumentFeatures:
+        """Compute document features for all registered strategies."""
+        return DocumentFeatures.build(
+            text,
+            metadata,
+            self.keyword_index,
+            self.strategies.values(),
+            tables=tables
+        )
+    
     def _classify_with_strategy(
         self,
         strategy: BaseIndustryStrategy,
-        content: ExtractedContent,
-        enhancement: dict
+        features: DocumentFeatures
     ) -> dict:
         """Classify document using a specific industry strategy."""
-        result = strategy.classify(content.text, enhancement)
+        result = strategy.classify_features(features)
         
-        if result['document_type'] == 'unknown' and content.tables:
+        if result['document_type'] == 'unknown' and features.tables:
             # Try classification based on table patterns
             table_result = self._classify_from_tables(
-                content.tables,
+                features,
                 strategy
             )
             if table_result['confidence_score'] > result['confidence_score']:
@@ -179,25 +525,39 @@ class DocumentClassifier:
         
         return result
     
-    def _classify_generic(
-        self,
-        content: ExtractedContent,
-        enhancement: dict
-    ) -> dict:
-        """Classify document without industry context."""
+    def _classify_generic(self, features: DocumentFeatures) -> dict:
+        """
+        Classify document without industry context.
+        
+        Strategies run in order of observed hit rate and evaluation stops
+        once a result reaches `early_exit_threshold`. Ties keep going to
+        the earliest registered strategy, so results only differ from a
+        full evaluation when the cascade exits early.
+        """
         best_result = None
         best_score = 0
+        best_rank = None
         
-        # Try all strategies
-        for strategy in self.strategies.values():
-            result = self._classify_with_strategy(
-                strategy,
-                content,
-                enhancement
-            )
-            if result['confidence_score'] > best_score:
-                best_score = result['confidence_score']
+        strategies = self._ordered_strategies()
+        for position, strategy in enumerate(strategies):
+            result = self._classify_with_strategy(strategy, features)
+            STRATEGY_EVALUATIONS.labels(industry=strategy.industry_name).inc()
+            
+            score = result['confidence_score']
+            rank = self._strategy_rank[strategy.industry_name]
+            is_tie_with_earlier = best_rank is not None and score == best_score and rank < best_rank
+            if score > best_score or is_tie_with_earlier:
+                best_score = score
                 best_result = result
+                best_rank = rank
+                best_industry = strategy.industry_name
+            
+            if self.early_exit_threshold is not None and best_score >= self.early_exit_threshold:
+                STRATEGY_EVALUATIONS_SKIPPED.inc(len(strategies) - position - 1)
+                break
+        
+        if best_result:
+            self._record_strategy_hit(best_industry)
         
         return best_result or {
             'document_type': "unknown",
@@ -205,6 +565,20 @@ class DocumentClassifier:
             'method': 'none'
         }
     
+    def _ordered_strategies(self) -> List[BaseIndustryStrategy]:
+        """Strategies sorted by how often they produced the winning result."""
+        with self._hits_lock:
+            hits = dict(self._strategy_hits)
+        return sorted(
+            self.strategies.values(),
+            key=lambda strategy: -hits.get(strategy.industry_name, 0)
+        )
+    
+    def _record_strategy_hit(self, industry: str):
+        """Count a generic classification won by `industry`."""
+        with self._hits_lock:
+            self._strategy_hits[industry] = self._strategy_hits.get(industry, 0) + 1
+    
     def _analyze_table_patterns(self, tables: List[List[str]]) -> dict:
         """Analyze table structures for common patterns."""
         return {
@@ -271,21 +645,37 @@ class DocumentClassifier:
         return patterns
     
     def _count_financial_tables(self, tables: List[List[str]]) -> int:
-        """Count tables that appear to contain financial data."""
+        """
+        Count tables that appear to contain financial data.
+        
+        A table counts when a financial keyword labels a column (header row)
+        or a row (first column) and at least one column holds mostly
+        monetary values below the header.
+        """
+        financial_keywords = ['amount', 'total', 'balance', 'price']
         count = 0
         for table in tables:
-            numeric_cols = 0
-            financial_keywords = ['amount', 'total', 'balance', 'price']
+            rows = [[str(cell or '') for cell in row] for row in table if row]
+            if len(rows) < 2:
+                continue
+            
+            labels = rows[0] + [row[0] for row in rows[1:]]
+            if not any(keyword in label.lower() for label in labels for keyword in financial_keywords):
+                continue
             
-            for row in table:
-                if any(str(cell).replace('.', '').isdigit() for cell in row):
-                    numeric_cols += 1
-                if any(keyword in str(cell).lower() for cell in row 
-                      for keyword in financial_keywords):
+            width = max(len(row) for row in rows)
+            for col in range(width):
+                values = [row[col] for row in rows[1:] if col < len(row) and row[col].strip()]
+                if values and sum(map(self._is_monetary, values)) * 2 > len(values):
                     count += 1
                     break
         return count
     
+    def _is_monetary(self, cell: str) -> bool:
+        """Check whether a cell holds a number, allowing currency symbols and separators."""
+        value = cell.strip().strip('$€£()-+ ').replace(',', '').replace('.', '', 1)
+        return value.isdigit()
+    
     def _count_list_tables(self, tables: List[List[str]]) -> int:
         """Count tables that appear to be lists."""
         return sum(1 for table in tables if len(table[0]) == 1)
@@ -311,18 +701,68 @@ class DocumentClassifier:
     
     def _classify_from_tables(
         self,
-        tables: List[List[str]],
+        features: DocumentFeatures,
         strategy: BaseIndustryStrategy
     ) -> dict:
         """Attempt classification based on table patterns."""
-        table_text = ' '.join(
-            ' '.join(str(cell) for cell in row)
-            for table in tables
-            for row in table
-        )
+        # Table text features are built on first use and shared across strategies
+        if features.table_features is None:
+            table_text = ' '.join(
+                ' '.join(str(cell) for cell in row)
+                for table in features.tables
+                for row in table
+            )
+            features.table_features = self._build_features(table_text, {})
         
-        result = strategy.classify(table_text)
+        result = strategy.classify_features(features.table_features)
         if result['document_type'] != 'unknown':
             result['method'] = 'table_analysis'
             
         return result
+
+# Config keys a classifier is built from, with their defaults
+CLASSIFIER_SETTINGS = {
+    'EARLY_EXIT_CONFIDENCE': 0.9,
+    'EXTRACTION_MAX_PAGES': None,
+    'EXTRACTION_TIME_BUDGET': None,
+    'PDF_EXTRACT_TABLES': True,
+    'CLASSIFICATION_CACHE_SIZE': 1024,
+    'CLASSIFICATION_CACHE_TTL': 3600,
+    'CLASSIFICATION_CACHE_REDIS': False,
+    'CLASSIFICATION_CACHE_REDIS_TTL': 86400,
+    'REDIS_URL': None,
+}
+
+def classifier_settings(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """The classifier-related subset of `config`, with defaults filled in."""
+    return {key: config.get(key, default) for key, default in CLASSIFIER_SETTINGS.items()}
+
+_shared_classifiers: Dict[tuple, DocumentClassifier] = {}
+_default_classifier: Optional[DocumentClassifier] = None
+_shared_lock = threading.Lock()
+
+def get_classifier(config: Optional[Mapping[str, Any]] = None) -> DocumentClassifier:
+    """
+    Return the process-wide classifier for `config`, creating it on first use.
+    
+    The instance is shared by the API, batch path and Celery tasks so
+    strategies, extractors and the result cache are set up once per
+    worker process. Instances are keyed by their classifier settings, so
+    apps with different config (e.g. testing with the cache off) never
+    share one. Without `config`, the first classifier built in this
+    process is returned, or one with the default settings.
+    """
+    global _default_classifier
+    with _shared_lock:
+        if config is None:
+            if _default_classifier is None:
+                config = {}
+            else:
+                return _default_classifier
+        key = tuple(classifier_settings(config).items())
+        classifier = _shared_classifiers.get(key)
+        if classifier is None:
+            classifier = _shared_classifiers[key] = DocumentClassifier.from_config(config)
+            if _default_classifier is None:
+                _default_classifier = classifier
+        return classifier
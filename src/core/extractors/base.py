@@ -1,11 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, TYPE_CHECKING
 from dataclasses import dataclass
 from ...exceptions.extraction_exceptions import ExtractionError
 import logging
 
+if TYPE_CHECKING:
+    from ..models.context import DocumentContext
+
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class ImageReference:
+    """
+    Lazy reference to image bytes stored in a file.
+
+    Extracted content keeps only the location of an image, so raw bytes are
+    not held in memory or serialized unless `read` is called. A reference
+    is only valid while the file exists: references to spooled uploads
+    must be read before the upload is released, and are never put into
+    classification results or the result cache.
+    """
+    path: str
+    offset: int = 0
+    length: Optional[int] = None
+
+    def read(self) -> bytes:
+        """Materialize the referenced bytes."""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            return f.read() if self.length is None else f.read(self.length)
+
 @dataclass
 class ExtractedContent:
     """Container for extracted document content."""
@@ -14,13 +38,21 @@ class ExtractedContent:
     tables: Optional[List[List[str]]] = None
     headers: Optional[List[str]] = None
     footers: Optional[List[str]] = None
-    images: Optional[List[bytes]] = None
+    images: Optional[List[ImageReference]] = None
     page_count: Optional[int] = None
     language: Optional[str] = None
     confidence: Optional[float] = None
 
 class BaseExtractor(ABC):
-    """Base class for all format-specific extractors."""
+    """
+    Base class for all format-specific extractors.
+
+    Extractors that set `accepts_streams` also take a seekable binary
+    file object wherever a `file_path` is expected, so in-memory
+    documents are extracted without touching disk.
+    """
+
+    accepts_streams = False
 
     @property
     @abstractmethod
@@ -38,6 +70,33 @@ class BaseExtractor(ABC):
         """Validate if file is properly formatted."""
         pass
 
+    def iter_pages(self, file_path: str) -> Iterator[ExtractedContent]:
+        """
+        Yield content incrementally, one page (or sheet) at a time.
+        
+        Extractors without natural page units yield the whole document
+        once. Pass the pages read so far to `combine_pages`.
+        """
+        yield self.extract_content(file_path)
+
+    def iter_document(self, context: 'DocumentContext') -> Iterator[ExtractedContent]:
+        """
+        Yield pages of an ingested document, as `iter_pages` does for a path.
+
+        An in-memory document is read from its buffer when the extractor
+        accepts streams, and spilled to a temp file otherwise.
+        """
+        if context.buffer is not None and self.accepts_streams:
+            with context.open() as stream:
+                yield from self.iter_pages(stream)
+            return
+        with context.local_path() as file_path:
+            yield from self.iter_pages(file_path)
+
+    def combine_pages(self, pages: List[ExtractedContent]) -> ExtractedContent:
+        """Merge pages produced by `iter_pages` into one ExtractedContent."""
+        return pages[0]
+
     def _clean_text(self, text: str) -> str:
         """Clean extracted text content."""
         if not text:
@@ -1,7 +1,11 @@
-from typing import List, Optional
-from .base import BaseExtractor, ExtractedContent
-from PIL import Image
-import pytesseract
+from typing import List, Optional, Dict, Any, Tuple
+from .base import BaseExtractor, ExtractedContent, ImageReference
+from .ocr import image_to_data
+from ..monitoring.prometheus import IMAGE_PREPROCESSING_TIME
+from PIL import Image, ImageOps
+from contextlib import contextmanager
+import os
+import time
 import cv2
 import numpy as np
 from ..exceptions.extraction_exceptions import ExtractionError
@@ -10,6 +14,42 @@ import logging
 logger = logging.getLogger(__name__)
 
 class ImageExtractor(BaseExtractor):
+    # Images with no plausible DPI (e.g. phone photos) are capped to a
+    # letter page at the target DPI instead
+    MIN_TRUSTED_DPI = 100
+    PAGE_INCHES = 11
+
+    # Ruling lines must span 1/40 of the image; tables at least 5% of each side
+    TABLE_LINE_DIVISOR = 40
+    MIN_TABLE_FRACTION = 0.05
+
+    accepts_streams = True
+
+    def __init__(
+        self,
+        target_dpi: int = 300,
+        normalize: bool = True,
+        threshold: bool = True,
+        denoise: bool = True,
+        deskew: bool = True,
+        skew_sample_size: int = 1000
+    ):
+        """
+        Args:
+            target_dpi: Resolution images are scaled down to before OCR
+            normalize: Scale to target_dpi, decoding JPEGs at reduced scale
+            threshold: Apply Otsu binarization
+            denoise: Apply a median blur
+            deskew: Estimate and correct skew
+            skew_sample_size: Longest side of the image used for skew estimation
+        """
+        self.target_dpi = target_dpi
+        self.normalize = normalize
+        self.threshold = threshold
+        self.denoise = denoise
+        self.deskew = deskew
+        self.skew_sample_size = skew_sample_size
+
     @property
     def supported_mimes(self) -> List[str]:
         return [
@@ -21,44 +61,39 @@ class ImageExtractor(BaseExtractor):
 
     def extract_content(self, file_path: str) -> ExtractedContent:
         try:
-            # Read image using OpenCV
-            image = cv2.imread(file_path)
-            if image is None:
-                raise ExtractionError("Failed to read image file")
+            timings: Dict[str, float] = {}
+
+            # Decode once; metadata comes from the same open image
+            with self._timed('decode', timings):
+                image, metadata = self._load_image(file_path)
 
             # Preprocess image
-            preprocessed = self._preprocess_image(image)
-            
-            # Perform OCR
-            text = pytesseract.image_to_string(preprocessed)
+            preprocessed = self._preprocess_image(image, timings)
             
-            # Get additional data
-            data = pytesseract.image_to_data(preprocessed, output_type=pytesseract.Output.DICT)
+            # Perform OCR once; text, confidences and tables all come from the word data
+            data = image_to_data(preprocessed)
+            text = self._text_from_data(data)
             
-            # Detect tables
-            tables = self._detect_tables(preprocessed)
+            # Detect ruled tables on the binarized image
+            with self._timed('tables', timings):
+                tables = self._detect_tables(preprocessed, data)
             
             # Get confidence scores
-            confidence_scores = [float(conf) for conf in data['conf'] if conf != '-1']
+            confidence_scores = [float(conf) for conf in data['conf'] if float(conf) >= 0]
             avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
             
-            # Get image metadata
-            with Image.open(file_path) as img:
-                metadata = {
-                    'width': img.width,
-                    'height': img.height,
-                    'format': img.format,
-                    'mode': img.mode,
-                    'dpi': img.info.get('dpi'),
-                    'has_tables': bool(tables),
-                    'ocr_confidence': avg_confidence
-                }
+            metadata['has_tables'] = bool(tables)
+            metadata['ocr_confidence'] = avg_confidence
+            metadata['preprocessing_ms'] = timings
 
             return ExtractedContent(
                 text=self._clean_text(text),
                 metadata=metadata,
                 tables=tables,
-                images=[open(file_path, 'rb').read()],
+                # In-memory images have no file to reference
+                images=[
+                    ImageReference(file_path, length=os.path.getsize(file_path))
+                ] if isinstance(file_path, str) else [],
                 language=self._detect_language(text),
                 confidence=avg_confidence / 100
             )
@@ -75,34 +110,116 @@ class ImageExtractor(BaseExtractor):
         except Exception:
             return False
 
-    def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
-        """Preprocess image for better OCR results."""
+    @contextmanager
+    def _timed(self, stage: str, timings: Dict[str, float]):
+        """Record a preprocessing stage's wall time in ms and as a metric."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            timings[stage] = round(elapsed * 1000, 2)
+            IMAGE_PREPROCESSING_TIME.labels(stage=stage).observe(elapsed)
+
+    def _load_image(self, file_path: str) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Decode the image once into an RGB pixel array plus its metadata.
+        
+        With normalization on, the image is scaled down to the target DPI;
+        JPEGs are decoded directly at a reduced DCT scale where possible.
+        EXIF orientation is applied before any later deskew.
+        """
+        try:
+            with Image.open(file_path) as img:
+                metadata = {
+                    'width': img.width,
+                    'height': img.height,
+                    'format': img.format,
+                    'mode': img.mode,
+                    'dpi': img.info.get('dpi')
+                }
+                
+                scale = self._normalization_scale(img) if self.normalize else 1.0
+                longest = max(img.size)
+                if scale < 1.0:
+                    img.draft('RGB', (round(img.width * scale), round(img.height * scale)))
+                
+                decoded = ImageOps.exif_transpose(img).convert('RGB')
+                
+                # draft() only gets within a power of two; finish the scaling here
+                remaining = scale * longest / max(decoded.size)
+                if remaining < 1.0:
+                    decoded = decoded.resize(
+                        (max(1, round(decoded.width * remaining)), max(1, round(decoded.height * remaining))),
+                        Image.BOX
+                    )
+                if scale < 1.0:
+                    metadata['scale'] = scale
+                pixels = np.asarray(decoded)
+        except Exception as e:
+            raise ExtractionError(f"Failed to read image file: {str(e)}")
+        return pixels, metadata
+
+    def _normalization_scale(self, img: Image.Image) -> float:
+        """Downscale factor that brings the image to the target OCR DPI."""
+        dpi = img.info.get('dpi')
+        dpi = float(dpi[0]) if dpi else 0.0
+        if dpi >= self.MIN_TRUSTED_DPI:
+            return min(1.0, self.target_dpi / dpi)
+        
+        max_side = self.target_dpi * self.PAGE_INCHES
+        return min(1.0, max_side / max(img.width, img.height))
+
+    def _preprocess_image(
+        self,
+        image: np.ndarray,
+        timings: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """Preprocess image for better OCR results; each stage can be switched off."""
+        timings = {} if timings is None else timings
         try:
             # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            with self._timed('grayscale', timings):
+                processed = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
             
             # Apply thresholding
-            thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+            if self.threshold:
+                with self._timed('threshold', timings):
+                    processed = cv2.threshold(processed, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
             
             # Remove noise
-            denoised = cv2.medianBlur(thresh, 3)
+            if self.denoise:
+                with self._timed('denoise', timings):
+                    processed = cv2.medianBlur(processed, 3)
             
             # Deskew
-            angle = self._get_skew_angle(denoised)
-            if abs(angle) > 0.5:
-                (h, w) = denoised.shape[:2]
-                center = (w // 2, h // 2)
-                M = cv2.getRotationMatrix2D(center, angle, 1.0)
-                denoised = cv2.warpAffine(denoised, M, (w, h),
-                                        flags=cv2.INTER_CUBIC,
-                                        borderMode=cv2.BORDER_REPLICATE)
+            if self.deskew:
+                with self._timed('deskew', timings):
+                    angle = self._get_skew_angle(self._skew_sample(processed))
+                    if abs(angle) > 0.5:
+                        (h, w) = processed.shape[:2]
+                        center = (w // 2, h // 2)
+                        M = cv2.getRotationMatrix2D(center, angle, 1.0)
+                        processed = cv2.warpAffine(processed, M, (w, h),
+                                                flags=cv2.INTER_CUBIC,
+                                                borderMode=cv2.BORDER_REPLICATE)
             
-            return denoised
+            return processed
 
         except Exception as e:
             logger.warning(f"Image preprocessing error: {str(e)}")
             return image
 
+    def _skew_sample(self, image: np.ndarray) -> np.ndarray:
+        """Downsample for skew estimation; the angle does not depend on scale."""
+        h, w = image.shape[:2]
+        longest = max(h, w)
+        if longest <= self.skew_sample_size:
+            return image
+        factor = self.skew_sample_size / longest
+        return cv2.resize(image, (max(1, int(w * factor)), max(1, int(h * factor))),
+                          interpolation=cv2.INTER_AREA)
+
     def _get_skew_angle(self, image: np.ndarray) -> float:
         """Detect skew angle of text in image."""
         try:
@@ -130,40 +247,116 @@ class ImageExtractor(BaseExtractor):
             logger.warning(f"Skew detection error: {str(e)}")
             return 0.0
 
-    def _detect_tables(self, image: np.ndarray) -> List[List[str]]:
-        """Detect and extract tables from image."""
+    def _text_from_data(self, data: Dict[str, List]) -> str:
+        """Rebuild page text from tesseract word data: words per line, blank line between blocks."""
+        blocks: List[str] = []
+        lines: List[str] = []
+        words: List[str] = []
+        last_block = last_line = None
+        
+        for i, word in enumerate(data['text']):
+            if not word.strip():
+                continue
+            
+            block = data['block_num'][i]
+            line = (block, data['par_num'][i], data['line_num'][i])
+            if line != last_line and words:
+                lines.append(" ".join(words))
+                words = []
+            if block != last_block and lines:
+                blocks.append("\n".join(lines))
+                lines = []
+            
+            words.append(word)
+            last_block, last_line = block, line
+        
+        if words:
+            lines.append(" ".join(words))
+        if lines:
+            blocks.append("\n".join(lines))
+        return "\n\n".join(blocks)
+
+    def _detect_tables(self, image: np.ndarray, data: Dict[str, List]) -> List[List[List[str]]]:
+        """
+        Detect ruled tables and fill their cells from the page's OCR word data.
+        
+        Ruling lines are isolated with morphological opening on the binarized
+        image; every sufficiently large line grid is a table whose row and
+        column boundaries come from line projections. Words are placed in
+        cells by their box centres, so no further OCR is needed.
+        """
         try:
-            # Use pytesseract to detect tables
-            tables_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+            if image.ndim == 3:
+                image = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+            ink = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]
+            h, w = ink.shape
+            
+            horizontal = cv2.morphologyEx(
+                ink, cv2.MORPH_OPEN,
+                cv2.getStructuringElement(cv2.MORPH_RECT, (max(w // self.TABLE_LINE_DIVISOR, 10), 1))
+            )
+            vertical = cv2.morphologyEx(
+                ink, cv2.MORPH_OPEN,
+                cv2.getStructuringElement(cv2.MORPH_RECT, (1, max(h // self.TABLE_LINE_DIVISOR, 10)))
+            )
+            grid = cv2.dilate(cv2.bitwise_or(horizontal, vertical), np.ones((3, 3), np.uint8))
             
-            # Group text by lines and blocks
+            count, _, stats, _ = cv2.connectedComponentsWithStats(grid, connectivity=8)
+            words = self._word_centres(data)
             tables = []
-            current_table = []
-            current_row = []
-            last_block_num = -1
-            
-            for i in range(len(tables_data['text'])):
-                if tables_data['text'][i].strip():
-                    if tables_data['block_num'][i] != last_block_num:
-                        if current_row:
-                            current_table.append(current_row)
-                            current_row = []
-                        if current_table:
-                            if len(current_table) > 1:  # Minimum table size
-                                tables.append(current_table)
-                            current_table = []
-                    
-                    current_row.append(tables_data['text'][i])
-                    last_block_num = tables_data['block_num'][i]
-            
-            # Add last row and table if they exist
-            if current_row:
-                current_table.append(current_row)
-            if current_table and len(current_table) > 1:
-                tables.append(current_table)
+            for x, y, bw, bh, _ in stats[1:count]:
+                if bw < w * self.MIN_TABLE_FRACTION or bh < h * self.MIN_TABLE_FRACTION:
+                    continue
+                
+                rows = self._line_positions(horizontal[y:y + bh, x:x + bw] > 0, axis=1) + y
+                cols = self._line_positions(vertical[y:y + bh, x:x + bw] > 0, axis=0) + x
+                if len(rows) < 3 or len(cols) < 3:
+                    continue
+                
+                tables.append(self._fill_cells(rows, cols, words))
             
             return tables
 
         except Exception as e:
             logger.warning(f"Table detection error: {str(e)}")
             return []
+
+    def _line_positions(self, mask: np.ndarray, axis: int) -> np.ndarray:
+        """Centres of ruling lines spanning most of a table region along `axis`."""
+        coverage = mask.mean(axis=axis)
+        on = coverage > 0.5
+        if not on.any():
+            return np.empty(0, dtype=int)
+        
+        # Collapse runs of adjacent line pixels into a single position
+        edges = np.diff(np.concatenate(([0], on.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return (starts + ends - 1) // 2
+
+    def _word_centres(self, data: Dict[str, List]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Box centres and text of the non-empty words in tesseract word data."""
+        keep = [i for i, word in enumerate(data['text']) if word.strip()]
+        left = np.array([data['left'][i] for i in keep], dtype=float)
+        top = np.array([data['top'][i] for i in keep], dtype=float)
+        width = np.array([data['width'][i] for i in keep], dtype=float)
+        height = np.array([data['height'][i] for i in keep], dtype=float)
+        return left + width / 2, top + height / 2, [data['text'][i] for i in keep]
+
+    def _fill_cells(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        words: Tuple[np.ndarray, np.ndarray, List[str]]
+    ) -> List[List[str]]:
+        """Place words into the cell grid bounded by `rows` and `cols`."""
+        xs, ys, texts = words
+        cells = [[[] for _ in range(len(cols) - 1)] for _ in range(len(rows) - 1)]
+        
+        row_index = np.searchsorted(rows, ys) - 1
+        col_index = np.searchsorted(cols, xs) - 1
+        inside = (row_index >= 0) & (row_index < len(rows) - 1) & (col_index >= 0) & (col_index < len(cols) - 1)
+        for i in np.flatnonzero(inside):
+            cells[row_index[i]][col_index[i]].append(texts[i])
+        
+        return [[" ".join(cell) for cell in row] for row in cells]
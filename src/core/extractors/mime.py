@@ -0,0 +1,120 @@
+from typing import Optional, BinaryIO
+import struct
+import threading
+from ..monitoring.prometheus import MIME_DETECTIONS
+
+# Bytes read from the start of a file for type detection
+SNIFF_BYTES = 8192
+# libmagic reads at most this much of a file itself
+MAGIC_BYTES = 1024 * 1024
+
+PDF = 'application/pdf'
+DOCX = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+XLSX = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# File suffixes for stored documents; some readers (openpyxl) go by the suffix
+MIME_EXTENSIONS = {
+    PDF: '.pdf',
+    DOCX: '.docx',
+    XLSX: '.xlsx',
+    'application/msword': '.doc',
+    'application/vnd.ms-excel': '.xls',
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/tiff': '.tiff',
+    'image/bmp': '.bmp',
+}
+
+# Fixed-offset signatures that identify a format on their own
+_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+)
+
+# OOXML parts that identify the document type inside the zip container
+_OOXML_PARTS = (
+    (b'word/', DOCX),
+    (b'xl/', XLSX),
+)
+
+_ZIP_LOCAL_HEADER = b'PK\x03\x04'
+_ZIP_HEADER_SIZE = 30
+
+_magic = None
+_magic_lock = threading.Lock()  # libmagic handles are not thread-safe
+
+def sniff_mime_type(head: bytes) -> Optional[str]:
+    """
+    Identify an accepted format from its leading bytes.
+
+    Returns None when the signature is unknown or ambiguous (e.g. OLE2
+    .doc/.xls, or a zip whose first entries don't name an OOXML part).
+    """
+    for signature, mime_type in _SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    # The PDF header may follow up to 1 KB of leading junk
+    if b'%PDF-' in head[:1024]:
+        return PDF
+    if head.startswith(_ZIP_LOCAL_HEADER):
+        return _sniff_ooxml(head)
+    return None
+
+def _sniff_ooxml(head: bytes) -> Optional[str]:
+    """Walk the zip local file headers in `head` looking for a word/ or xl/ part."""
+    position = 0
+    while head[position:position + 4] == _ZIP_LOCAL_HEADER:
+        if position + _ZIP_HEADER_SIZE > len(head):
+            break
+        flags, = struct.unpack_from('<H', head, position + 6)
+        compressed_size, = struct.unpack_from('<I', head, position + 18)
+        name_length, extra_length = struct.unpack_from('<HH', head, position + 26)
+        name = head[position + _ZIP_HEADER_SIZE:position + _ZIP_HEADER_SIZE + name_length]
+        for prefix, mime_type in _OOXML_PARTS:
+            if name.startswith(prefix):
+                return mime_type
+        if flags & 0x08:
+            break  # sizes follow the data, so the next header can't be located
+        position += _ZIP_HEADER_SIZE + name_length + extra_length + compressed_size
+    return None
+
+def _libmagic_mime_type(head: bytes, file_path: Optional[str]) -> str:
+    global _magic
+    with _magic_lock:
+        if _magic is None:
+            import magic
+            _magic = magic.Magic(mime=True)
+        return _magic.from_file(file_path) if file_path else _magic.from_buffer(head)
+
+def detect_mime_type(head: bytes, file_path: Optional[str] = None) -> str:
+    """
+    Detect a MIME type from the file's leading bytes (or whole content).
+
+    Falls back to libmagic when no signature matches, on `file_path` when
+    given since formats like OLE2 need more than the head.
+    """
+    mime_type = sniff_mime_type(head)
+    if mime_type is not None:
+        MIME_DETECTIONS.labels(method='signature').inc()
+        return mime_type
+    MIME_DETECTIONS.labels(method='libmagic').inc()
+    return _libmagic_mime_type(head, file_path)
+
+def detect_file_mime_type(file_path: str) -> str:
+    """Detect the MIME type of a file on disk."""
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    return detect_mime_type(head, file_path)
+
+def detect_stream_mime_type(stream: BinaryIO) -> str:
+    """Detect the MIME type of a seekable stream, leaving its position unchanged."""
+    position = stream.tell()
+    try:
+        head = stream.read(SNIFF_BYTES)
+        if sniff_mime_type(head) is None:
+            head += stream.read(MAGIC_BYTES - len(head))
+        return detect_mime_type(head)
+    finally:
+        stream.seek(position)
@@ -0,0 +1,349 @@
+from typing import Optional, Dict, List, Any, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+import atexit
+import multiprocessing
+import os
+import queue
+import threading
+from ..monitoring.prometheus import OCR_ENGINE_RECYCLES
+from ...exceptions.extraction_exceptions import ExtractionError
+import logging
+
+logger = logging.getLogger(__name__)
+
+# OCR libraries are imported on first OCR call; the web process configures
+# the pools at startup but may never OCR anything.
+def _tesserocr_available() -> bool:
+    try:
+        import tesserocr  # noqa: F401
+        return True
+    except ImportError:  # pragma: no cover - optional C extension
+        logger.info("tesserocr not installed, falling back to pytesseract subprocesses")
+        return False
+
+_TSV_TEXT_COLUMNS = {'text'}
+_TSV_FLOAT_COLUMNS = {'conf'}
+
+def _parse_tsv(tsv: str) -> Dict[str, List[Any]]:
+    """Parse tesseract TSV output into pytesseract's Output.DICT layout."""
+    columns = [
+        'level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+        'left', 'top', 'width', 'height', 'conf', 'text'
+    ]
+    data: Dict[str, List[Any]] = {column: [] for column in columns}
+    for row in tsv.splitlines():
+        values = row.split('\t')
+        if len(values) < len(columns) - 1 or values[0] == 'level':
+            continue
+        values += [''] * (len(columns) - len(values))
+        for column, value in zip(columns, values):
+            if column in _TSV_TEXT_COLUMNS:
+                data[column].append(value)
+            elif column in _TSV_FLOAT_COLUMNS:
+                data[column].append(float(value))
+            else:
+                data[column].append(int(value))
+    return data
+
+class PytesseractEngine:
+    """Fallback engine: every call runs a fresh tesseract subprocess."""
+
+    name = 'pytesseract'
+
+    def __init__(self):
+        self.pages = 0
+
+    def image_to_string(self, image) -> str:
+        import pytesseract
+        self.pages += 1
+        return pytesseract.image_to_string(image)
+
+    def image_to_data(self, image) -> Dict[str, List[Any]]:
+        import pytesseract
+        self.pages += 1
+        return pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+
+    def healthy(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+class TesserocrEngine:
+    """In-process tesseract API; the language model is loaded once per engine."""
+
+    name = 'tesserocr'
+
+    def __init__(self, lang: str = 'eng'):
+        import tesserocr
+        self.api = tesserocr.PyTessBaseAPI(lang=lang)
+        self.pages = 0
+
+    def _set_image(self, image):
+        import numpy as np
+        from PIL import Image
+        if isinstance(image, np.ndarray):
+            image = Image.fromarray(image)
+        self.api.SetImage(image)
+        self.pages += 1
+
+    def image_to_string(self, image) -> str:
+        self._set_image(image)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, image) -> Dict[str, List[Any]]:
+        self._set_image(image)
+        return _parse_tsv(self.api.GetTSVText(0))
+
+    def healthy(self) -> bool:
+        try:
+            return bool(self.api.GetInitLanguagesAsString())
+        except Exception:
+            return False
+
+    def close(self):
+        self.api.End()
+
+class OCREnginePool:
+    """
+    Long-lived OCR engines shared by the threads of one process.
+
+    Engines are created lazily up to `size`, health-checked on checkout
+    and recycled after `max_pages` pages to bound memory growth. At most
+    `size + max_waiting` callers may hold or wait for an engine; beyond
+    that OCR requests are rejected rather than queued without limit.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_pages: int = 500,
+        max_waiting: int = 8,
+        timeout: float = 60,
+        engine: Optional[str] = None
+    ):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.engine_name = engine
+        self._idle: "queue.Queue" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size + max_waiting)
+
+    @contextmanager
+    def engine(self) -> Iterator[Any]:
+        """Check out an engine for the duration of one OCR call."""
+        if not self._slots.acquire(blocking=False):
+            raise ExtractionError("OCR queue is full")
+        try:
+            engine = self._checkout()
+            try:
+                yield engine
+            finally:
+                self._checkin(engine)
+        finally:
+            self._slots.release()
+
+    def image_to_string(self, image) -> str:
+        with self.engine() as engine:
+            return engine.image_to_string(image)
+
+    def image_to_data(self, image) -> Dict[str, List[Any]]:
+        with self.engine() as engine:
+            return engine.image_to_data(image)
+
+    def close(self):
+        """Close idle engines; engines in use are closed when returned."""
+        with self._lock:
+            self.size = 0
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _new_engine(self):
+        if self.engine_name is None:
+            self.engine_name = 'tesserocr' if _tesserocr_available() else 'pytesseract'
+        if self.engine_name == 'tesserocr':
+            try:
+                return TesserocrEngine()
+            except Exception as e:
+                logger.warning(f"tesserocr engine failed to start, using pytesseract: {str(e)}")
+                self.engine_name = 'pytesseract'
+        return PytesseractEngine()
+
+    def _replace(self, engine, reason: str):
+        OCR_ENGINE_RECYCLES.labels(reason=reason).inc()
+        try:
+            engine.close()
+        except Exception as e:
+            logger.warning(f"Failed to close OCR engine: {str(e)}")
+        return self._new_engine()
+
+    def _checkout(self):
+        try:
+            engine = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                return self._new_engine()
+            try:
+                engine = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise ExtractionError("Timed out waiting for an OCR engine")
+
+        if not engine.healthy():
+            engine = self._replace(engine, 'unhealthy')
+        return engine
+
+    def _checkin(self, engine):
+        if self.size == 0:
+            engine.close()
+            return
+        if engine.pages >= self.max_pages:
+            engine = self._replace(engine, 'max_pages')
+        self._idle.put(engine)
+
+_engines: Optional[OCREnginePool] = None
+_engines_lock = threading.Lock()
+
+def configure_ocr_engines(
+    size: int = 1,
+    max_pages: int = 500,
+    max_waiting: int = 8,
+    engine: Optional[str] = None
+) -> OCREnginePool:
+    """Replace the process-wide OCR engine pool."""
+    global _engines
+    with _engines_lock:
+        if _engines is not None:
+            _engines.close()
+        _engines = OCREnginePool(size, max_pages=max_pages, max_waiting=max_waiting, engine=engine)
+        return _engines
+
+def get_ocr_engines() -> OCREnginePool:
+    """Return the process-wide OCR engine pool, creating a default one on first use."""
+    global _engines
+    if _engines is None:
+        with _engines_lock:
+            if _engines is None:
+                _engines = OCREnginePool()
+    return _engines
+
+def _forget_inherited_engines():
+    # Engines hold native handles that must not be shared with forked children
+    global _engines
+    if _engines is not None:
+        _engines = OCREnginePool(
+            _engines.size or 1,
+            max_pages=_engines.max_pages,
+            engine=_engines.engine_name
+        )
+
+os.register_at_fork(after_in_child=_forget_inherited_engines)
+
+def image_to_string(image) -> str:
+    """OCR an image to text on a pooled engine."""
+    return get_ocr_engines().image_to_string(image)
+
+def image_to_data(image) -> Dict[str, List[Any]]:
+    """OCR an image to word data (pytesseract Output.DICT layout) on a pooled engine."""
+    return get_ocr_engines().image_to_data(image)
+
+def ocr_image(image) -> str:
+    """OCR a single rendered page or image; runs inside pool workers."""
+    return image_to_string(image)
+
+def ocr_pool_size(worker_concurrency: int = 1) -> int:
+    """Split the host's CPUs between worker processes (Celery or web)."""
+    return max(1, (os.cpu_count() or 1) // max(1, worker_concurrency))
+
+class OCRPool:
+    """
+    Bounded process pool for page OCR.
+
+    Tesseract is CPU bound, so pages are OCR'd in separate processes, each
+    with its own OCR engines. The pool is sized so that all Celery or web
+    workers together do not oversubscribe the host. Pool processes come
+    from a forkserver (or are spawned), never forked from the caller: the
+    first OCR call may run in a threaded web worker, and forking a
+    multithreaded process can deadlock on locks other threads held. Where
+    child processes cannot be started (e.g. inside a daemonic prefork
+    worker) OCR falls back to running inline.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or ocr_pool_size()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inline = self.max_workers <= 1
+        self._lock = threading.Lock()
+
+    def submit(self, image) -> Future:
+        """Queue an image for OCR; the future resolves to its text."""
+        if not self._inline:
+            try:
+                with self._lock:
+                    if self._executor is None:
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=_process_context()
+                        )
+                return self._executor.submit(ocr_image, image)
+            except Exception as e:
+                logger.warning(f"OCR pool unavailable, running OCR inline: {str(e)}")
+                self._inline = True
+                self.shutdown()
+
+        future = Future()
+        try:
+            future.set_result(ocr_image(image))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self):
+        """Stop pool processes; a later submit starts a new pool."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+def _process_context():
+    """Start method for pool processes that is safe from threaded parents."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+_pool: Optional[OCRPool] = None
+_pool_lock = threading.Lock()
+
+def shutdown_ocr_pool():
+    """Stop the process-wide OCR pool's processes, e.g. from a worker shutdown hook."""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+
+atexit.register(shutdown_ocr_pool)
+
+def configure_ocr_pool(max_workers: Optional[int] = None, worker_concurrency: int = 1) -> OCRPool:
+    """Replace the process-wide OCR pool, e.g. from a worker init hook."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = OCRPool(max_workers or ocr_pool_size(worker_concurrency))
+        return _pool
+
+def get_ocr_pool() -> OCRPool:
+    """Return the process-wide OCR pool, creating a default one on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = OCRPool()
+    return _pool
@@ -1,15 +1,134 @@
-from typing import List, Optional
+from typing import List, Optional, Iterator, Tuple, Dict
+from dataclasses import dataclass
+from xml.etree import ElementTree as ET
+import zipfile
 from .base import BaseExtractor, ExtractedContent
 import docx
 import openpyxl
 from openpyxl.utils import get_column_letter
-import pandas as pd
+import numpy as np
 import logging
 from ..exceptions.extraction_exceptions import ExtractionError
 
 logger = logging.getLogger(__name__)
 
+# Legacy binary Office files (.doc, .xls) are OLE2 compound documents
+OLE2_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+def _is_ole2(file) -> bool:
+    """Check a path or seekable stream for the OLE2 signature."""
+    if isinstance(file, str):
+        with open(file, 'rb') as f:
+            return f.read(len(OLE2_SIGNATURE)) == OLE2_SIGNATURE
+    position = file.tell()
+    try:
+        return file.read(len(OLE2_SIGNATURE)) == OLE2_SIGNATURE
+    finally:
+        file.seek(position)
+
+# Rows added to a sheet's cell array each time it fills up
+SHEET_ROW_BLOCK = 1024
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """Half-open [start, end) index ranges of consecutive True values."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False])).astype(np.int8)))
+    return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
+@dataclass(eq=False)
+class SheetTable:
+    """
+    Block of cells found in a sheet.
+    
+    Cells are a view into the sheet's cell array rather than copied nested
+    lists; iterating or indexing yields rows as lists, like other tables.
+    """
+    sheet: str
+    top: int
+    left: int
+    cells: np.ndarray
+
+    def __len__(self) -> int:
+        return self.cells.shape[0]
+
+    def __getitem__(self, index: int) -> List[str]:
+        return self.cells[index].tolist()
+
+    def __iter__(self) -> Iterator[List[str]]:
+        return (row.tolist() for row in self.cells)
+
+    def tolist(self) -> List[List[str]]:
+        """Plain nested lists, e.g. for serialization."""
+        return self.cells.tolist()
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_W_BODY, _W_P, _W_PPR, _W_SECTPR = f'{_W}body', f'{_W}p', f'{_W}pPr', f'{_W}sectPr'
+_W_TBL, _W_TR, _W_TC = f'{_W}tbl', f'{_W}tr', f'{_W}tc'
+
+def _run_text(run: ET.Element) -> str:
+    """Run text as python-docx renders it, with tabs and line breaks as characters."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == f'{_W}t':
+            parts.append(child.text or '')
+        elif tag in (f'{_W}tab', f'{_W}ptab'):
+            parts.append('\t')
+        elif tag == f'{_W}br':
+            # Page and column breaks carry no text
+            if child.get(f'{_W}type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag == f'{_W}cr':
+            parts.append('\n')
+        elif tag == f'{_W}noBreakHyphen':
+            parts.append('-')
+    return ''.join(parts)
+
+def _paragraph_text(paragraph: ET.Element) -> str:
+    """Text of a paragraph's runs, including runs inside hyperlinks."""
+    parts = []
+    for child in paragraph:
+        if child.tag == f'{_W}r':
+            parts.append(_run_text(child))
+        elif child.tag == f'{_W}hyperlink':
+            parts.extend(_run_text(run) for run in child.findall(f'{_W}r'))
+    return ''.join(parts)
+
+def _section_refs(section: ET.Element) -> Tuple[Optional[str], Optional[str]]:
+    """Relationship ids of a section's default header and footer, if defined."""
+    refs = {}
+    for kind in ('header', 'footer'):
+        for ref in section.findall(f'{_W}{kind}Reference'):
+            if ref.get(f'{_W}type') == 'default':
+                refs[kind] = ref.get(f'{_R}id')
+    return refs.get('header'), refs.get('footer')
+
+def _close_cell(table: dict, cell: ET.Element):
+    """Append a finished cell to the current row, expanding gridSpan and vMerge."""
+    properties = cell.find(f'{_W}tcPr')
+    span = 1
+    merge = None
+    if properties is not None:
+        grid_span = properties.find(f'{_W}gridSpan')
+        if grid_span is not None:
+            span = int(grid_span.get(f'{_W}val', 1))
+        v_merge = properties.find(f'{_W}vMerge')
+        if v_merge is not None:
+            merge = v_merge.get(f'{_W}val', 'continue')
+    
+    row = table['row']
+    column = len(row)
+    text = '\n'.join(table['cell'])
+    if merge == 'continue':
+        text = table['above'].get(column, '')
+    for offset in range(span):
+        table['above'][column + offset] = text
+    row.extend([text] * span)
+
 class WordExtractor(BaseExtractor):
+    accepts_streams = True
+
     @property
     def supported_mimes(self) -> List[str]:
         return [
@@ -18,33 +137,20 @@ class WordExtractor(BaseExtractor):
         ]
 
     def extract_content(self, file_path: str) -> ExtractedContent:
+        # Neither parser reads the binary .doc format, only OOXML packages
+        if _is_ole2(file_path):
+            raise ExtractionError("Legacy .doc documents are not supported; convert to .docx")
         try:
-            doc = docx.Document(file_path)
-            
-            # Extract main text
-            text = []
-            for paragraph in doc.paragraphs:
-                text.append(paragraph.text)
-            
-            # Extract headers and footers
-            headers = []
-            footers = []
-            for section in doc.sections:
-                headers.extend([header.text for header in section.header.paragraphs])
-                footers.extend([footer.text for footer in section.footer.paragraphs])
-            
-            # Extract tables
-            tables = []
-            for table in doc.tables:
-                table_data = []
-                for row in table.rows:
-                    table_data.append([cell.text for cell in row.cells])
-                tables.append(table_data)
+            try:
+                text, headers, footers, tables, section_count = self._parse_streaming(file_path)
+            except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+                logger.info(f"Streaming DOCX parse failed, falling back to python-docx: {str(e)}")
+                text, headers, footers, tables, section_count = self._parse_with_python_docx(file_path)
             
             # Collect metadata
             metadata = {
-                'page_count': len(doc.sections),
-                'paragraph_count': len(doc.paragraphs),
+                'page_count': section_count,
+                'paragraph_count': len(text),
                 'table_count': len(tables),
                 'word_count': len(' '.join(text).split()),
                 'has_headers': bool(headers),
@@ -68,6 +174,129 @@ class WordExtractor(BaseExtractor):
             logger.error(f"Word extraction error: {str(e)}", exc_info=True)
             raise ExtractionError(f"Failed to extract Word content: {str(e)}")
 
+    def _parse_with_python_docx(self, file_path: str) -> tuple:
+        """Parse through the python-docx object model (fallback for OOXML the stream parser rejects)."""
+        doc = docx.Document(file_path)
+        
+        # Extract main text
+        text = []
+        for paragraph in doc.paragraphs:
+            text.append(paragraph.text)
+        
+        # Extract headers and footers
+        headers = []
+        footers = []
+        for section in doc.sections:
+            headers.extend([header.text for header in section.header.paragraphs])
+            footers.extend([footer.text for footer in section.footer.paragraphs])
+        
+        # Extract tables
+        tables = []
+        for table in doc.tables:
+            table_data = []
+            for row in table.rows:
+                table_data.append([cell.text for cell in row.cells])
+            tables.append(table_data)
+        
+        return text, headers, footers, tables, len(doc.sections)
+
+    def _parse_streaming(self, file_path: str) -> tuple:
+        """
+        Stream-parse the package XML without building an object model.
+        
+        `word/document.xml` is read with iterparse and body elements are
+        cleared once handled, so memory stays bounded by the largest
+        paragraph or table row. Text follows python-docx semantics: body
+        paragraphs only, cells repeated across gridSpan and vMerge, and
+        each section's default header/footer, inherited when linked. A
+        section with no header or footer definition yields one empty
+        paragraph, like the blank part python-docx adds on access.
+        """
+        with zipfile.ZipFile(file_path) as package:
+            targets = self._relationship_targets(package)
+            with package.open('word/document.xml') as document:
+                text, tables, sections = self._stream_body(document)
+            
+            headers: List[str] = []
+            footers: List[str] = []
+            header_ref = footer_ref = None
+            for section_header, section_footer in sections:
+                header_ref = section_header or header_ref
+                footer_ref = section_footer or footer_ref
+                headers.extend(self._part_paragraphs(package, targets.get(header_ref)))
+                footers.extend(self._part_paragraphs(package, targets.get(footer_ref)))
+        
+        return text, headers, footers, tables, len(sections)
+
+    def _stream_body(self, document) -> tuple:
+        """Collect body paragraphs, top-level tables and section references in one pass."""
+        text: List[str] = []
+        tables: List[List[List[str]]] = []
+        sections: List[Tuple[Optional[str], Optional[str]]] = []
+        stack: List[ET.Element] = []
+        open_tables: List[dict] = []
+        
+        for event, elem in ET.iterparse(document, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                if elem.tag == _W_TBL:
+                    open_tables.append({'rows': [], 'above': {}})
+                elif elem.tag == _W_TR:
+                    open_tables[-1]['row'] = []
+                elif elem.tag == _W_TC:
+                    open_tables[-1]['cell'] = []
+                continue
+            
+            stack.pop()
+            parent = stack[-1].tag if stack else None
+            
+            if elem.tag == _W_P:
+                paragraph = _paragraph_text(elem)
+                if parent == _W_BODY:
+                    text.append(paragraph)
+                    section = elem.find(f'{_W_PPR}/{_W_SECTPR}')
+                    if section is not None:
+                        sections.append(_section_refs(section))
+                elif parent == _W_TC and open_tables:
+                    open_tables[-1]['cell'].append(paragraph)
+                elem.clear()
+            elif elem.tag == _W_TC and open_tables:
+                _close_cell(open_tables[-1], elem)
+            elif elem.tag == _W_TR and open_tables:
+                table = open_tables[-1]
+                table['rows'].append(table['row'])
+                elem.clear()
+            elif elem.tag == _W_TBL:
+                table = open_tables.pop()
+                if parent == _W_BODY:
+                    tables.append(table['rows'])
+                elem.clear()
+            elif elem.tag == _W_SECTPR and parent == _W_BODY:
+                sections.append(_section_refs(elem))
+        
+        return text, tables, sections
+
+    def _relationship_targets(self, package: zipfile.ZipFile) -> Dict[str, str]:
+        """Map document relationship ids to part names inside the package."""
+        targets = {}
+        with package.open('word/_rels/document.xml.rels') as rels:
+            for _, elem in ET.iterparse(rels):
+                if elem.tag == f'{_REL_NS}Relationship':
+                    target = elem.get('Target', '')
+                    targets[elem.get('Id')] = target.lstrip('/') if target.startswith('/') else f'word/{target}'
+        return targets
+
+    def _part_paragraphs(self, package: zipfile.ZipFile, part_name: Optional[str]) -> List[str]:
+        """Top-level paragraph texts of a header or footer part, or [''] when undefined."""
+        if part_name is None:
+            return ['']
+        paragraphs = []
+        with package.open(part_name) as part:
+            root = ET.parse(part).getroot()
+        for paragraph in root.findall(_W_P):
+            paragraphs.append(_paragraph_text(paragraph))
+        return paragraphs
+
     def validate_file(self, file_path: str) -> bool:
         try:
             docx.Document(file_path)
@@ -76,6 +305,8 @@ class WordExtractor(BaseExtractor):
             return False
 
 class ExcelExtractor(BaseExtractor):
+    accepts_streams = True
+
     @property
     def supported_mimes(self) -> List[str]:
         return [
@@ -83,80 +314,145 @@ class ExcelExtractor(BaseExtractor):
             'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'  # .xlsx
         ]
 
+    def __init__(self, max_rows: int = 10000):
+        """
+        Args:
+            max_rows: Rows read per sheet; the rest is not needed for classification
+        """
+        self.max_rows = max_rows
+
     def extract_content(self, file_path: str) -> ExtractedContent:
+        return self.combine_pages(list(self.iter_pages(file_path)))
+
+    def iter_pages(self, file_path: str) -> Iterator[ExtractedContent]:
+        """
+        Yield the text, tables and header row of each sheet in turn.
+        
+        The workbook is opened read-only and rows are streamed as plain
+        values straight into one cell array per sheet, grown in blocks of
+        rows. A sheet is held once, as that array plus its text; tables are
+        views into the array.
+        """
         try:
-            workbook = openpyxl.load_workbook(file_path, data_only=True)
-            
-            text_content = []
-            all_tables = []
-            headers = []
-            
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        except Exception as e:
+            logger.error(f"Excel extraction error: {str(e)}", exc_info=True)
+            raise ExtractionError(f"Failed to extract Excel content: {str(e)}")
+        
+        try:
+            sheet_count = len(workbook.worksheets)
             for sheet in workbook.worksheets:
-                # Convert sheet to DataFrame for easier processing
-                data = []
-                for row in sheet.iter_rows():
-                    data.append([str(cell.value) if cell.value is not None else '' 
-                               for cell in row])
-                df = pd.DataFrame(data)
-                
-                # Detect tables within the sheet
-                tables = self._detect_tables(df)
-                all_tables.extend(tables)
-                
-                # Extract header rows
-                if len(data) > 0:
-                    headers.append(data[0])
-                
-                # Extract text content
-                text_content.append(f"Sheet: {sheet.title}")
-                for row in data:
-                    text_content.extend([str(cell) for cell in row if cell])
-            
-            metadata = {
-                'sheet_count': len(workbook.worksheets),
-                'table_count': len(all_tables),
-                'total_rows': sum(sheet.max_row for sheet in workbook.worksheets),
-                'total_columns': sum(sheet.max_column for sheet in workbook.worksheets)
-            }
-            
-            final_text = '\n'.join(text_content)
-            
-            return ExtractedContent(
-                text=self._clean_text(final_text),
-                metadata=metadata,
-                tables=all_tables,
-                headers=headers,
-                language=self._detect_language(final_text),
-                confidence=self._calculate_confidence(final_text)
-            )
+                yield self._extract_sheet(sheet, sheet_count)
 
         except Exception as e:
             logger.error(f"Excel extraction error: {str(e)}", exc_info=True)
             raise ExtractionError(f"Failed to extract Excel content: {str(e)}")
+        finally:
+            workbook.close()
+
+    def _extract_sheet(self, sheet, sheet_count: int) -> ExtractedContent:
+        """Stream one sheet's rows, collecting text, tables and sizes in one pass."""
+        text_content = [f"Sheet: {sheet.title}"]
+        cells = np.full((0, 0), '', dtype=object)
+        header: List[str] = []
+        rows = columns = 0
+        truncated = False
+        
+        for values in sheet.iter_rows(values_only=True):
+            if rows >= self.max_rows:
+                truncated = True
+                break
+            
+            row = [str(value) if value is not None else '' for value in values]
+            if rows == cells.shape[0] or len(row) > cells.shape[1]:
+                cells = self._grow(cells, rows + SHEET_ROW_BLOCK, len(row))
+            cells[rows, :len(row)] = row
+            if not rows:
+                header = row
+            rows += 1
+            columns = max(columns, len(row))
+            text_content.extend(cell for cell in row if cell)
+        
+        cells = cells[:rows, :columns]
+        tables = self._detect_tables(cells, sheet.title)
+        
+        metadata = {
+            'sheet_title': sheet.title,
+            'sheet_count': sheet_count,
+            # Declared dimensions cover the rows left unread past the cap
+            'rows': max(rows, sheet.max_row or 0) if truncated else rows,
+            'columns': max(columns, sheet.max_column or 0) if truncated else columns
+        }
+        if truncated:
+            metadata['truncated'] = True
+        
+        return ExtractedContent(
+            text='\n'.join(text_content),
+            metadata=metadata,
+            tables=tables,
+            headers=[' '.join(cell for cell in header if cell)] if rows else []
+        )
+
+    def _grow(self, cells: np.ndarray, rows: int, columns: int) -> np.ndarray:
+        """Copy `cells` into a larger blank array of at least the given size."""
+        rows = min(max(rows, cells.shape[0]), self.max_rows)
+        grown = np.full((rows, max(columns, cells.shape[1])), '', dtype=object)
+        grown[:cells.shape[0], :cells.shape[1]] = cells
+        return grown
+
+    def combine_pages(self, pages: List[ExtractedContent]) -> ExtractedContent:
+        all_tables = [table for page in pages for table in page.tables]
+        
+        metadata = {
+            'sheet_count': pages[0].metadata['sheet_count'],
+            'table_count': len(all_tables),
+            'total_rows': sum(page.metadata['rows'] for page in pages),
+            'total_columns': sum(page.metadata['columns'] for page in pages)
+        }
+        truncated = [page.metadata['sheet_title'] for page in pages if page.metadata.get('truncated')]
+        if truncated:
+            metadata['truncated_sheets'] = truncated
+        
+        final_text = '\n'.join(page.text for page in pages)
+        
+        return ExtractedContent(
+            text=self._clean_text(final_text),
+            metadata=metadata,
+            tables=all_tables,
+            headers=[header for page in pages for header in page.headers],
+            language=self._detect_language(final_text),
+            confidence=self._calculate_confidence(final_text)
+        )
 
     def validate_file(self, file_path: str) -> bool:
         try:
-            openpyxl.load_workbook(file_path, data_only=True)
+            openpyxl.load_workbook(file_path, read_only=True, data_only=True).close()
             return True
         except Exception:
             return False
 
-    def _detect_tables(self, df: pd.DataFrame) -> List[List[str]]:
-        """Detect table structures within a DataFrame."""
-        tables = []
-        current_table = []
-        
-        for idx, row in df.iterrows():
-            if not row.isna().all():  # If row is not empty
-                current_table.append(row.tolist())
-            elif current_table:  # Empty row after table content
-                if len(current_table) > 1:  # Minimum table size
-                    tables.append(current_table)
-                current_table = []
-        
-        if current_table and len(current_table) > 1:
-            tables.append(current_table)
+    def _detect_tables(self, cells: np.ndarray, sheet_title: str = '') -> List['SheetTable']:
+        """
+        Split a sheet into tables separated by blank rows and blank columns.
         
+        Rows are first cut into bands at fully blank rows; each band is then
+        cut at columns that are blank within it. Blocks are trimmed to their
+        non-blank rows and kept when they span at least two rows.
+        """
+        filled = cells != ''
+        tables = []
+        for top, bottom in _runs(filled.any(axis=1)):
+            band = filled[top:bottom]
+            for left, right in _runs(band.any(axis=0)):
+                block_rows = _runs(band[:, left:right].any(axis=1))
+                first, last = block_rows[0][0] + top, block_rows[-1][1] + top
+                if last - first > 1:  # Minimum table size
+                    tables.append(SheetTable(
+                        sheet=sheet_title,
+                        top=first,
+                        left=left,
+                        cells=cells[first:last, left:right]
+                    ))
         return tables
 
     def _is_header_row(self, row: List[str]) -> bool:
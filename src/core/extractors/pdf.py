@@ -1,57 +1,96 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Deque
+from collections import deque
+from concurrent.futures import Future
 from .base import BaseExtractor, ExtractedContent
+from .ocr import get_ocr_pool
 import PyPDF2
 import pdfplumber
-import pytesseract
-from PIL import Image
-import io
-import re
 from ..exceptions.extraction_exceptions import ExtractionError
 import logging
 
 logger = logging.getLogger(__name__)
 
 class PDFExtractor(BaseExtractor):
+    # Header/footer bands as a fraction of page height
+    HEADER_BAND = 0.1
+    FOOTER_BAND = 0.9
+    LINE_TOLERANCE = 3
+
+    accepts_streams = True
+
+    def __init__(self, extract_tables: bool = False):
+        """
+        Args:
+            extract_tables: Run the table finder on pages with ruling lines
+        """
+        self.extract_tables = extract_tables
+
     @property
     def supported_mimes(self) -> List[str]:
         return ['application/pdf']
 
     def extract_content(self, file_path: str) -> ExtractedContent:
+        return self.combine_pages(list(self.iter_pages(file_path)))
+
+    def iter_pages(self, file_path: str) -> Iterator[ExtractedContent]:
+        """
+        Yield each page from a single parse of the document.
+        
+        Words are extracted once per page and reused for the body text and
+        the header/footer bands; tables are only searched for when enabled.
+        Only pages without a usable text layer are rendered, and those are
+        OCR'd on the shared OCR pool while later pages are parsed. Pages
+        are yielded in document order, at most one pool's worth ahead.
+        """
+        pool = get_ocr_pool()
+        pending: Deque[Tuple[ExtractedContent, Optional[Future]]] = deque()
         try:
-            with open(file_path, 'rb') as file:
-                # Try text extraction with PyPDF2 first
-                text, metadata = self._extract_with_pypdf2(file)
+            with pdfplumber.open(file_path) as pdf:
+                metadata = self._extract_plumber_metadata(pdf)
                 
-                # If text extraction yields poor results, try pdfplumber
-                if not text or self._needs_ocr(text):
-                    text, tables = self._extract_with_pdfplumber(file_path)
+                for page_number, page in enumerate(pdf.pages, start=1):
+                    content, image = self._extract_page(page, page_number, metadata)
+                    page.flush_cache()
+                    pending.append((content, pool.submit(image) if image is not None else None))
                     
-                    # If still poor results, try OCR
-                    if self._needs_ocr(text):
-                        text = self._extract_with_ocr(file_path)
-                else:
-                    tables = []
-
-                # Extract headers and footers
-                headers, footers = self._extract_headers_footers(file_path)
-
-                # Calculate confidence
-                confidence = self._calculate_confidence(text)
-
-                return ExtractedContent(
-                    text=self._clean_text(text),
-                    metadata=metadata,
-                    tables=tables,
-                    headers=headers,
-                    footers=footers,
-                    page_count=metadata.get('page_count'),
-                    language=self._detect_language(text),
-                    confidence=confidence
-                )
+                    while pending and (
+                        len(pending) > pool.max_workers
+                        or pending[0][1] is None
+                        or pending[0][1].done()
+                    ):
+                        yield self._resolve_page(*pending.popleft())
+                
+                while pending:
+                    yield self._resolve_page(*pending.popleft())
 
         except Exception as e:
             logger.error(f"PDF extraction error: {str(e)}", exc_info=True)
             raise ExtractionError(f"Failed to extract PDF content: {str(e)}")
+        finally:
+            # Pages left unread by an early stop don't need their OCR
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+
+    def combine_pages(self, pages: List[ExtractedContent]) -> ExtractedContent:
+        text = "\n".join(page.text for page in pages)
+        metadata = dict(pages[0].metadata)
+        metadata.pop('page_number', None)
+        metadata['ocr_pages'] = [
+            page.metadata['page_number'] for page in pages if page.metadata.get('ocr')
+        ]
+        metadata.pop('ocr', None)
+        
+        return ExtractedContent(
+            text=self._clean_text(text),
+            metadata=metadata,
+            tables=[table for page in pages for table in page.tables],
+            headers=[header for page in pages for header in page.headers],
+            footers=[footer for page in pages for footer in page.footers],
+            page_count=metadata.get('page_count'),
+            language=self._detect_language(text),
+            confidence=self._calculate_confidence(text)
+        )
 
     def validate_file(self, file_path: str) -> bool:
         try:
@@ -61,72 +100,78 @@ class PDFExtractor(BaseExtractor):
         except Exception:
             return False
 
-    def _extract_with_pypdf2(self, file) -> tuple[str, Dict[str, Any]]:
-        """Extract text and metadata using PyPDF2."""
-        pdf = PyPDF2.PdfReader(file)
-        
-        # Extract text
-        text = ""
-        for page in pdf.pages:
-            text += page.extract_text() or ""
-
-        # Extract metadata
-        metadata = {
+    def _extract_plumber_metadata(self, pdf) -> Dict[str, Any]:
+        """Extract document metadata from an open pdfplumber document."""
+        info = pdf.metadata or {}
+        return {
             'page_count': len(pdf.pages),
-            'encrypted': pdf.is_encrypted,
-            'author': pdf.metadata.get('/Author', ''),
-            'creator': pdf.metadata.get('/Creator', ''),
-            'producer': pdf.metadata.get('/Producer', ''),
-            'subject': pdf.metadata.get('/Subject', ''),
-            'title': pdf.metadata.get('/Title', ''),
-            'creation_date': pdf.metadata.get('/CreationDate', ''),
-            'modification_date': pdf.metadata.get('/ModDate', '')
+            'encrypted': bool(getattr(pdf.doc, 'encryption', None)),
+            'author': info.get('Author', ''),
+            'creator': info.get('Creator', ''),
+            'producer': info.get('Producer', ''),
+            'subject': info.get('Subject', ''),
+            'title': info.get('Title', ''),
+            'creation_date': info.get('CreationDate', ''),
+            'modification_date': info.get('ModDate', '')
         }
 
-        return text, metadata
-
-    def _extract_with_pdfplumber(self, file_path: str) -> tuple[str, List[List[str]]]:
-        """Extract text and tables using pdfplumber."""
-        with pdfplumber.open(file_path) as pdf:
-            text = ""
-            tables = []
-            
-            for page in pdf.pages:
-                text += page.extract_text() or ""
-                tables.extend(page.extract_tables())
-
-        return text, tables
-
-    def _extract_with_ocr(self, file_path: str) -> str:
-        """Extract text using OCR."""
-        text = ""
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                # Convert page to image
-                img = page.to_image()
-                # Perform OCR
-                text += pytesseract.image_to_string(img.original) + "\n"
-        return text
-
-    def _extract_headers_footers(self, file_path: str) -> tuple[List[str], List[str]]:
-        """Extract headers and footers from PDF."""
-        headers = []
-        footers = []
+    def _extract_page(
+        self,
+        page,
+        page_number: int,
+        metadata: Dict[str, Any]
+    ) -> Tuple[ExtractedContent, Optional[Any]]:
+        """
+        Extract text, header/footer and tables for one page.
         
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                # Define header and footer regions
-                header_bbox = (0, 0, page.width, page.height * 0.1)
-                footer_bbox = (0, page.height * 0.9, page.width, page.height)
-                
-                # Extract text from regions
-                header = page.crop(header_bbox).extract_text() or ""
-                footer = page.crop(footer_bbox).extract_text() or ""
-                
-                if header: headers.append(header)
-                if footer: footers.append(footer)
-
-        return headers, footers
+        Returns the page content and, when the text layer is missing or
+        garbage, the rendered page image still to be OCR'd.
+        """
+        words = page.extract_words()
+        text = "\n".join(self._group_lines(words))
+        
+        header = "\n".join(self._group_lines(
+            [w for w in words if w['top'] < page.height * self.HEADER_BAND]
+        ))
+        footer = "\n".join(self._group_lines(
+            [w for w in words if w['bottom'] > page.height * self.FOOTER_BAND]
+        ))
+        
+        # The default table finder only uses ruling lines, so skip it on pages without any
+        tables = page.extract_tables() if self.extract_tables and page.edges else []
+        
+        ocr = self._needs_ocr(text)
+        image = page.to_image().original if ocr else None
+        
+        content = ExtractedContent(
+            text=text,
+            metadata={**metadata, 'page_number': page_number, 'ocr': ocr},
+            tables=tables,
+            headers=[header] if header else [],
+            footers=[footer] if footer else [],
+            page_count=metadata['page_count']
+        )
+        return content, image
+
+    def _resolve_page(self, content: ExtractedContent, ocr: Optional[Future]) -> ExtractedContent:
+        """Fill in OCR text for a page once its OCR job has finished."""
+        if ocr is not None:
+            content.text = ocr.result()
+        return content
+
+    def _group_lines(self, words: List[Dict[str, Any]]) -> List[str]:
+        """Group words into text lines by vertical position, top to bottom."""
+        lines: List[List[Dict[str, Any]]] = []
+        for word in sorted(words, key=lambda w: (w['top'], w['x0'])):
+            if lines and abs(word['top'] - lines[-1][0]['top']) <= self.LINE_TOLERANCE:
+                lines[-1].append(word)
+            else:
+                lines.append([word])
+        
+        return [
+            " ".join(w['text'] for w in sorted(line, key=lambda w: w['x0']))
+            for line in lines
+        ]
 
     def _needs_ocr(self, text: str) -> bool:
         """Determine if OCR is needed based on text quality."""
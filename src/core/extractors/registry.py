@@ -1,42 +1,108 @@
-from typing import Dict, Type, Optional
+from typing import Any, Dict, Type, Optional, List, Union
 from .base import BaseExtractor
-import magic
+from .mime import detect_file_mime_type
+import importlib
+import threading
 import logging
 from ..exceptions.extraction_exceptions import ExtractionError
 
 logger = logging.getLogger(__name__)
 
+# Built-in extractors by declared MIME type. Modules are only imported when
+# one of their MIME types is first seen, so format libraries (cv2,
+# pdfplumber, openpyxl, ...) stay unloaded in processes that never need them.
+BUILTIN_EXTRACTORS: Dict[str, List[str]] = {
+    'pdf:PDFExtractor': [
+        'application/pdf'
+    ],
+    'image:ImageExtractor': [
+        'image/jpeg',
+        'image/png',
+        'image/tiff',
+        'image/bmp'
+    ],
+    'office:WordExtractor': [
+        'application/msword',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+    ],
+    'office:ExcelExtractor': [
+        'application/vnd.ms-excel',
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    ],
+}
+
 class ExtractorRegistry:
-    """Registry for file format extractors."""
-    
-    def __init__(self):
-        self._extractors: Dict[str, Type[BaseExtractor]] = {}
-        self._mime = magic.Magic(mime=True)
-    
+    """
+    Registry for file format extractors.
+
+    Extractors are registered either as classes or lazily as
+    "module:Class" references with their declared MIME types. Each
+    extractor is instantiated once, on first use, and the instance is
+    shared between threads. `options` holds constructor arguments keyed by
+    the same reference or class, e.g.
+    {'pdf:PDFExtractor': {'extract_tables': True}}.
+    """
+
+    def __init__(
+        self,
+        builtin: bool = True,
+        options: Optional[Dict[Union[str, Type[BaseExtractor]], Dict[str, Any]]] = None
+    ):
+        self._extractors: Dict[str, Union[str, Type[BaseExtractor]]] = {}
+        self._instances: Dict[Union[str, Type[BaseExtractor]], BaseExtractor] = {}
+        self._instances_lock = threading.Lock()
+        self._options = options or {}
+
+        if builtin:
+            for reference, mime_types in BUILTIN_EXTRACTORS.items():
+                self.register_lazy(reference, mime_types)
+
     def register(self, extractor_class: Type[BaseExtractor]):
         """Register an extractor for its supported MIME types."""
-        extractor = extractor_class()
+        extractor = extractor_class(**self._options.get(extractor_class, {}))
+        with self._instances_lock:
+            self._instances[extractor_class] = extractor
         for mime_type in extractor.supported_mimes:
             self._extractors[mime_type] = extractor_class
             logger.info(f"Registered extractor {extractor_class.__name__} for MIME type {mime_type}")
-    
-    def get_extractor(self, file_path: str) -> BaseExtractor:
-        """Get appropriate extractor for a file."""
+
+    def register_lazy(self, reference: str, mime_types: List[str]):
+        """
+        Register an extractor by "module:Class" reference without importing it.
+
+        Relative module names resolve against this package.
+        """
+        for mime_type in mime_types:
+            self._extractors[mime_type] = reference
+
+    def detect_mime_type(self, file_path: str) -> str:
+        """Detect a file's MIME type from its leading bytes."""
         try:
-            mime_type = self._mime.from_file(file_path)
-            extractor_class = self._extractors.get(mime_type)
-            
-            if not extractor_class:
+            return detect_file_mime_type(file_path)
+        except Exception as e:
+            raise ExtractionError(f"Error determining file type: {str(e)}")
+
+    def get_extractor(self, file_path: str, mime_type: Optional[str] = None) -> BaseExtractor:
+        """
+        Get appropriate extractor for a file.
+
+        Pass `mime_type` when it is already known to skip detection.
+        """
+        mime_type = mime_type or self.detect_mime_type(file_path)
+        try:
+            extractor = self.get_extractor_for_mime_type(mime_type)
+
+            if not extractor:
                 raise ExtractionError(f"No extractor registered for MIME type: {mime_type}")
-                
-            return extractor_class()
+
+            return extractor
         except Exception as e:
             raise ExtractionError(f"Error determining file type: {str(e)}")
 
     def get_supported_mime_types(self) -> Dict[str, str]:
         """Get all supported MIME types and their corresponding extractors."""
         return {
-            mime_type: extractor.__name__ 
+            mime_type: extractor if isinstance(extractor, str) else extractor.__name__
             for mime_type, extractor in self._extractors.items()
         }
 
@@ -45,6 +111,33 @@ class ExtractorRegistry:
         return mime_type in self._extractors
 
     def get_extractor_for_mime_type(self, mime_type: str) -> Optional[BaseExtractor]:
-        """Get extractor instance for specific MIME type."""
-        extractor_class = self._extractors.get(mime_type)
-        return extractor_class() if extractor_class else None
+        """Get the shared extractor instance for a specific MIME type."""
+        entry = self._extractors.get(mime_type)
+        if entry is None:
+            return None
+
+        extractor = self._instances.get(entry)
+        if extractor is None:
+            with self._instances_lock:
+                extractor = self._instances.get(entry)
+                if extractor is None:
+                    extractor = self._load(entry)(**self._options.get(entry, {}))
+                    self._instances[entry] = extractor
+        return extractor
+
+    def preload(self):
+        """Import and instantiate every registered extractor, e.g. to warm a worker."""
+        for mime_type in list(self._extractors):
+            self.get_extractor_for_mime_type(mime_type)
+
+    def _load(self, entry: Union[str, Type[BaseExtractor]]) -> Type[BaseExtractor]:
+        """Resolve a lazy "module:Class" reference to its class."""
+        if not isinstance(entry, str):
+            return entry
+
+        module_name, _, class_name = entry.partition(':')
+        if '.' not in module_name:
+            module_name = f'.{module_name}'
+        module = importlib.import_module(module_name, __package__)
+        logger.info(f"Loaded extractor {class_name} from {module.__name__}")
+        return getattr(module, class_name)
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Optional, Union, Iterator, BinaryIO
+import hashlib
+import io
+import os
+import tempfile
+from ..extractors.mime import SNIFF_BYTES, detect_mime_type
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+@dataclass
+class DocumentContext:
+    """
+    Facts about an ingested document, computed once and passed through the pipeline.
+
+    A context refers to the document on disk (`file_path`), holds its
+    bytes in memory (`buffer`), or both. Build it where the bytes are
+    first seen (upload, spool, task payload) so later stages never
+    re-hash, re-stat or re-sniff the file.
+    """
+    file_hash: str
+    file_size: int
+    mime_type: str
+    file_path: Optional[str] = None
+    filename: Optional[str] = None
+    buffer: Optional[Union[bytes, memoryview]] = None
+
+    @classmethod
+    def from_path(cls, file_path: str, mime_type: Optional[str] = None) -> 'DocumentContext':
+        """Hash, size and sniff a file on disk in a single read."""
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        file_hash = hashlib.sha256()
+        file_size = 0
+        head = b''
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+                if not head:
+                    head = chunk[:SNIFF_BYTES]
+                file_hash.update(chunk)
+                file_size += len(chunk)
+
+        return cls(
+            file_hash=file_hash.hexdigest(),
+            file_size=file_size,
+            mime_type=mime_type or detect_mime_type(head, file_path),
+            file_path=file_path,
+            filename=os.path.basename(file_path)
+        )
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: Union[bytes, memoryview],
+        filename: Optional[str] = None,
+        mime_type: Optional[str] = None
+    ) -> 'DocumentContext':
+        """Describe an in-memory document."""
+        return cls(
+            file_hash=hashlib.sha256(data).hexdigest(),
+            file_size=len(data),
+            mime_type=mime_type or detect_mime_type(bytes(data[:SNIFF_BYTES]), None),
+            filename=filename,
+            buffer=data
+        )
+
+    @property
+    def name(self) -> str:
+        """Path or filename for logs and results."""
+        return self.file_path or self.filename or self.file_hash
+
+    def open(self) -> BinaryIO:
+        """Open the document's bytes, preferring the in-memory buffer."""
+        if self.buffer is not None:
+            return io.BytesIO(self.buffer)
+        return open(self.file_path, 'rb')
+
+    @contextmanager
+    def local_path(self) -> Iterator[str]:
+        """Yield a path to the document, spilling the buffer to a temp file if needed."""
+        if self.file_path:
+            yield self.file_path
+            return
+
+        suffix = os.path.splitext(self.filename or '')[1]
+        fd, temp_path = tempfile.mkstemp(suffix=suffix)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.buffer)
+            yield temp_path
+        finally:
+            os.remove(temp_path)
+
+    def to_dict(self) -> dict:
+        """JSON-safe form for task payloads; the buffer is not included."""
+        return {
+            'file_hash': self.file_hash,
+            'file_size': self.file_size,
+            'mime_type': self.mime_type,
+            'file_path': self.file_path,
+            'filename': self.filename
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DocumentContext':
+        """Rebuild a context from `to_dict` output."""
+        return cls(**data)
+
+    @classmethod
+    def from_task_payload(cls, payload: dict) -> 'DocumentContext':
+        """
+        Rebuild a context from task kwargs or a stored batch document.
+
+        Current payloads carry `document` (`to_dict` output). Payloads queued
+        before the spool change carry `file_path` or raw `file_content` with
+        `filename`; they are still accepted for one release so tasks queued
+        across a deploy are not lost.
+        """
+        if payload.get('document'):
+            return cls.from_dict(payload['document'])
+        if payload.get('file_path'):
+            return cls.from_path(payload['file_path'])
+        if payload.get('file_content') is not None:
+            data = payload['file_content']
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            return cls.from_bytes(data, payload.get('filename'))
+        raise ValueError("Task payload has no document, file_path or file_content")
@@ -59,6 +59,24 @@ EXTRACTION_ERRORS = Counter(
     ['extractor_type', 'error_type']
 )
 
+IMAGE_PREPROCESSING_TIME = Histogram(
+    'image_preprocessing_seconds',
+    'Time spent in each image preprocessing stage',
+    ['stage']
+)
+
+MIME_DETECTIONS = Counter(
+    'mime_detections_total',
+    'Number of MIME type detections by method',
+    ['method']
+)
+
+OCR_ENGINE_RECYCLES = Counter(
+    'ocr_engine_recycles_total',
+    'Number of OCR engines replaced',
+    ['reason']
+)
+
 # Classification Metrics
 CLASSIFICATION_CONFIDENCE = Histogram(
     'classification_confidence',
@@ -67,6 +85,17 @@ CLASSIFICATION_CONFIDENCE = Histogram(
     buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
 )
 
+STRATEGY_EVALUATIONS = Counter(
+    'strategy_evaluations_total',
+    'Number of industry strategy evaluations in generic classification',
+    ['industry']
+)
+
+STRATEGY_EVALUATIONS_SKIPPED = Counter(
+    'strategy_evaluations_skipped_total',
+    'Number of strategy evaluations saved by early exit'
+)
+
 MISCLASSIFICATION_RATE = Gauge(
     'misclassification_rate',
     'Rate of document misclassifications',
@@ -1,8 +1,21 @@
 from celery import Celery
 from celery.schedules import crontab
-from ..config import get_settings
+from celery.signals import worker_process_init, worker_process_shutdown
+from importlib import import_module
+import os
 
-settings = get_settings()
+def load_settings(config_object: str = None):
+    """
+    Load the worker's config class from the top-level `config` package.
+
+    Uses the same default as the API's `create_app`, overridable with the
+    CONFIG_OBJECT environment variable (e.g. config.production.ProductionConfig).
+    """
+    path = config_object or os.environ.get('CONFIG_OBJECT', 'config.base.BaseConfig')
+    module_name, _, class_name = path.rpartition('.')
+    return getattr(import_module(module_name), class_name)
+
+settings = load_settings()
 
 celery_app = Celery(
     'document_classifier',
@@ -39,9 +52,41 @@ celery_app.conf.update(
             'task': 'document_classifier.tasks.cleanup_expired_documents',
             'schedule': crontab(hour=0, minute=0)
         },
+        'sweep-upload-spool': {
+            'task': 'document_classifier.tasks.sweep_upload_spool',
+            'schedule': crontab(minute=30)
+        },
         'monitor-queue-sizes': {
             'task': 'document_classifier.tasks.monitor_queue_sizes',
             'schedule': 60.0
         }
     }
 )
+
+@worker_process_init.connect
+def warm_classifier(**kwargs):
+    """Build the shared classifier and OCR pool once per worker process, after fork."""
+    from ..classifier import get_classifier
+    from ..extractors.ocr import configure_ocr_engines, configure_ocr_pool
+    configure_ocr_engines(
+        settings.OCR_ENGINES_PER_PROCESS,
+        max_pages=settings.OCR_ENGINE_MAX_PAGES,
+        max_waiting=settings.OCR_QUEUE_SIZE,
+        engine=settings.OCR_ENGINE
+    )
+    configure_ocr_pool(settings.OCR_POOL_SIZE, settings.WORKER_CONCURRENCY)
+    # Same settings source as the API's ClassifierExtension
+    get_classifier({key: getattr(settings, key) for key in dir(settings) if key.isupper()})
+
+@worker_process_shutdown.connect
+def stop_ocr_pool(**kwargs):
+    """Stop the worker's OCR pool processes with the worker process."""
+    from ..extractors.ocr import shutdown_ocr_pool
+    shutdown_ocr_pool()
+
+@celery_app.task(name='document_classifier.tasks.sweep_upload_spool')
+def sweep_upload_spool() -> int:
+    """Remove spool files pinned or abandoned by crashed requests and workers."""
+    from ...utils.file_utils import SPOOL_DIR, UploadSpool
+    spool = UploadSpool(os.path.join(settings.UPLOAD_FOLDER, SPOOL_DIR))
+    return spool.sweep(settings.SPOOL_TEMP_MAX_AGE, settings.SPOOL_MAX_AGE)
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
+from functools import cached_property
+from .keywords import KeywordIndex
+from .rules import RuleSet
+from .features import DocumentFeatures
 import logging
 
 logger = logging.getLogger(__name__)
 
 class BaseIndustryStrategy(ABC):
     """Base strategy for industry-specific document classification."""
+
+    # Bump when custom_rules change so cached classifications are invalidated
+    version: str = "1"
+
+    # Regex rule families used by custom_rules, keyed by family name
+    rule_patterns: Dict[str, List[str]] = {}
     
     @property
     @abstractmethod
@@ -26,10 +36,20 @@ class BaseIndustryStrategy(ABC):
         pass
 
     @abstractmethod
-    def custom_rules(self, text: str, metadata: dict) -> Optional[str]:
+    def custom_rules(self, features: DocumentFeatures) -> Optional[str]:
         """Apply industry-specific classification rules."""
         pass
 
+    @cached_property
+    def rules(self) -> RuleSet:
+        """Compiled rule_patterns, built once per strategy instance."""
+        return RuleSet(self.rule_patterns)
+
+    @cached_property
+    def keyword_index(self) -> KeywordIndex:
+        """Keyword matcher for this strategy alone, built on first use."""
+        return KeywordIndex([self])
+
     def classify(self, text: str, metadata: Optional[dict] = None) -> Dict[str, Any]:
         """
         Classify document using industry-specific rules and keywords.
@@ -41,11 +61,22 @@ class BaseIndustryStrategy(ABC):
         Returns:
             Dictionary containing classification results
         """
-        try:
-            metadata = metadata or {}
+        features = DocumentFeatures.build(text, metadata, self.keyword_index, [self])
+        return self.classify_features(features)
+
+    def classify_features(self, features: DocumentFeatures) -> Dict[str, Any]:
+        """
+        Classify document from features shared with other strategies.
+        
+        Args:
+            features: Precomputed document features
             
+        Returns:
+            Dictionary containing classification results
+        """
+        try:
             # Try custom rules first
-            doc_type = self.custom_rules(text, metadata)
+            doc_type = self.custom_rules(features)
             if doc_type:
                 return {
                     'document_type': doc_type,
@@ -57,9 +88,11 @@ class BaseIndustryStrategy(ABC):
             best_match = None
             best_score = 0
             
-            text = text.lower()
-            for doc_type, keywords in self.keywords.items():
-                score = self._calculate_keyword_score(text, keywords)
+            if features.keyword_scores is not None:
+                scores = features.keyword_scores[self.industry_name]
+            else:
+                scores = self._calculate_keyword_scores(features.keyword_hits)
+            for doc_type, score in scores.items():
                 if score > best_score:
                     best_score = score
                     best_match = doc_type
@@ -79,13 +112,18 @@ class BaseIndustryStrategy(ABC):
                 'error': str(e)
             }
 
-    def _calculate_keyword_score(self, text: str, keywords: List[str]) -> float:
-        """Calculate confidence score based on keyword matches."""
-        if not keywords:
-            return 0.0
+    def _calculate_keyword_scores(self, keyword_hits: Set[str]) -> Dict[str, float]:
+        """Calculate confidence score per document type from keyword hits."""
+        index = self.keyword_index
+        matches = {doc_type: 0 for _, doc_type in index.keyword_counts}
+        for keyword in keyword_hits:
+            for _, doc_type in index.owners.get(keyword, ()):
+                matches[doc_type] += 1
         
-        matches = sum(1 for keyword in keywords if keyword.lower() in text)
-        return matches / len(keywords)
+        return {
+            doc_type: matches[doc_type] / total if total else 0.0
+            for (_, doc_type), total in index.keyword_counts.items()
+        }
 
     def validate_document_type(self, document_type: str) -> bool:
         """Validate if document type is supported by this strategy."""
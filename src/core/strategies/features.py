@@ -0,0 +1,62 @@
+from typing import Dict, List, Optional, Any, Set, Iterable, TYPE_CHECKING
+from dataclasses import dataclass, field
+from .keywords import KeywordIndex
+from .rules import RuleMatches
+
+if TYPE_CHECKING:
+    from .base import BaseIndustryStrategy
+
+@dataclass
+class DocumentFeatures:
+    """
+    Per-document features shared by every industry strategy.
+
+    Built once per text so strategies read normalized text, keyword hits,
+    regex rule hits and table header sets instead of rescanning the text.
+    """
+    text: str
+    metadata: Dict[str, Any]
+    keyword_hits: Set[str]
+    rule_hits: Dict[str, RuleMatches]
+    table_headers: List[Set[str]] = field(default_factory=list)
+    tables: Optional[List[List[str]]] = None
+    table_features: Optional['DocumentFeatures'] = None
+    keyword_scores: Optional[Dict[str, Dict[str, float]]] = None
+
+    @classmethod
+    def build(
+        cls,
+        text: str,
+        metadata: Optional[dict],
+        keyword_index: KeywordIndex,
+        strategies: Iterable['BaseIndustryStrategy'],
+        tables: Optional[List[List[str]]] = None
+    ) -> 'DocumentFeatures':
+        """
+        Compute features for a document.
+
+        Args:
+            text: Extracted text content
+            metadata: Document metadata; `metadata['tables']` feeds the
+                table header sets used by custom_rules
+            keyword_index: Index covering the keywords of `strategies`
+            strategies: Strategies that will read these features
+            tables: Extracted tables, kept for table-based fallback
+        """
+        metadata = metadata or {}
+        normalized = text.lower()
+        return cls(
+            text=normalized,
+            metadata=metadata,
+            keyword_hits=keyword_index.find(normalized),
+            rule_hits={
+                strategy.industry_name: strategy.rules.match(normalized)
+                for strategy in strategies
+            },
+            table_headers=[
+                {str(cell).lower() for cell in table[0]}
+                for table in metadata.get('tables') or []
+                if table
+            ],
+            tables=tables
+        )
@@ -1,6 +1,6 @@
-from typing import Dict, List, Optional
-import re
+from typing import Dict, List, Optional, Set
 from .base import BaseIndustryStrategy
+from .features import DocumentFeatures
 import logging
 
 logger = logging.getLogger(__name__)
@@ -140,47 +140,15 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             ]
         }
 
-    def custom_rules(self, text: str, metadata: dict) -> Optional[str]:
-        """Apply healthcare document specific rules."""
-        text = text.lower()
-        
-        if self._contains_phi(text):
-            if self._contains_lab_patterns(text):
-                return "lab_report"
-            if self._contains_prescription_patterns(text):
-                return "prescription"
-            if self._contains_imaging_patterns(text):
-                return "medical_imaging"
-
-        if self._contains_discharge_patterns(text):
-            return "discharge_summary"
-        if self._contains_vaccination_patterns(text):
-            return "vaccination_record"
-        if self._contains_billing_patterns(text):
-            return "medical_bill"
-
-        if metadata.get('tables'):
-            if self._is_lab_results_table(metadata['tables']):
-                return "lab_report"
-            if self._is_vital_signs_table(metadata['tables']):
-                return "medical_record"
-            if self._is_billing_table(metadata['tables']):
-                return "medical_bill"
-
-        return None
-
-    def _contains_phi(self, text: str) -> bool:
-        phi_patterns = [
+    rule_patterns = {
+        "phi": [
             r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
             r'\b(MRN|Medical Record Number):\s*\d+\b',  # Medical Record Number
             r'\bDOB:\s*\d{1,2}/\d{1,2}/\d{2,4}\b',  # Date of Birth
             r'\b(patient|name):\s*[A-Za-z\s,]+\b',  # Patient Name
             r'\b(address|phone|email):\s*.+\b'  # Contact Information
-        ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in phi_patterns)
-
-    def _contains_lab_patterns(self, text: str) -> bool:
-        lab_patterns = [
+        ],
+        "lab": [
             r'(test|lab)\s+results?',
             r'reference\s+range',
             r'specimen\s+(collected|type)',
@@ -189,11 +157,8 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             r'laboratory\s+report',
             r'collection\s+date',
             r'test\s+performed'
-        ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in lab_patterns)
-
-    def _contains_prescription_patterns(self, text: str) -> bool:
-        rx_patterns = [
+        ],
+        "prescription": [
             r'\brx\b',
             r'take\s+\d+\s+(tablet|capsule)',
             r'refills?:\s*\d+',
@@ -202,11 +167,8 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             r'prescribed\s+by',
             r'pharmacy',
             r'medication\s+order'
-        ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in rx_patterns)
-
-    def _contains_imaging_patterns(self, text: str) -> bool:
-        imaging_patterns = [
+        ],
+        "imaging": [
             r'(radiology|imaging)\s+report',
             r'(mri|ct|x-ray|ultrasound)\s+findings',
             r'impression:',
@@ -214,11 +176,8 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             r'contrast(\s+material)?:',
             r'comparison:',
             r'anatomic\s+region'
-        ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in imaging_patterns)
-
-    def _contains_discharge_patterns(self, text: str) -> bool:
-        discharge_patterns = [
+        ],
+        "discharge": [
             r'discharge\s+summary',
             r'admission\s+date',
             r'discharge\s+date',
@@ -227,11 +186,8 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             r'discharge\s+medications',
             r'discharge\s+diagnosis',
             r'discharge\s+instructions'
-        ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in discharge_patterns)
-
-    def _contains_vaccination_patterns(self, text: str) -> bool:
-        vaccination_patterns = [
+        ],
+        "vaccination": [
             r'vaccine\s+record',
             r'immunization\s+history',
             r'(vaccine|immunization)\s+administered',
@@ -239,11 +195,8 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             r'next\s+dose\s+due',
             r'vaccination\s+site',
             r'dose\s+(\d+|series)'
-        ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in vaccination_patterns)
-
-    def _contains_billing_patterns(self, text: str) -> bool:
-        billing_patterns = [
+        ],
+        "billing": [
             r'bill(ing)?\s+statement',
             r'amount\s+due',
             r'payment\s+due\s+date',
@@ -252,43 +205,63 @@ class HealthcareIndustryStrategy(BaseIndustryStrategy):
             r'total\s+charges',
             r'patient\s+responsibility'
         ]
-        return any(bool(re.search(pattern, text, re.I)) for pattern in billing_patterns)
+    }
+
+    def custom_rules(self, features: DocumentFeatures) -> Optional[str]:
+        """Apply healthcare document specific rules."""
+        rule_hits = features.rule_hits[self.industry_name]
+        
+        if "phi" in rule_hits:
+            if "lab" in rule_hits:
+                return "lab_report"
+            if "prescription" in rule_hits:
+                return "prescription"
+            if "imaging" in rule_hits:
+                return "medical_imaging"
+
+        if "discharge" in rule_hits:
+            return "discharge_summary"
+        if "vaccination" in rule_hits:
+            return "vaccination_record"
+        if "billing" in rule_hits:
+            return "medical_bill"
+
+        if features.table_headers:
+            if self._is_lab_results_table(features.table_headers):
+                return "lab_report"
+            if self._is_vital_signs_table(features.table_headers):
+                return "medical_record"
+            if self._is_billing_table(features.table_headers):
+                return "medical_bill"
+
+        return None
 
-    def _is_lab_results_table(self, tables: List[List[str]]) -> bool:
+    def _is_lab_results_table(self, table_headers: List[Set[str]]) -> bool:
         lab_headers = {
             'test', 'result', 'value', 'range', 'units', 'reference',
             'normal', 'specimen', 'collection'
         }
-        for table in tables:
-            if not table:
-                continue
-            headers = {cell.lower() for cell in table[0]}
+        for headers in table_headers:
             if len(headers & lab_headers) >= 3:
                 return True
         return False
 
-    def _is_vital_signs_table(self, tables: List[List[str]]) -> bool:
+    def _is_vital_signs_table(self, table_headers: List[Set[str]]) -> bool:
         vital_headers = {
             'temperature', 'pulse', 'blood pressure', 'respiration',
             'height', 'weight', 'bmi', 'oxygen', 'pain'
         }
-        for table in tables:
-            if not table:
-                continue
-            headers = {cell.lower() for cell in table[0]}
+        for headers in table_headers:
             if len(headers & vital_headers) >= 3:
                 return True
         return False
 
-    def _is_billing_table(self, tables: List[List[str]]) -> bool:
+    def _is_billing_table(self, table_headers: List[Set[str]]) -> bool:
         billing_headers = {
             'code', 'description', 'charge', 'amount', 'date',
             'service', 'payment', 'adjustment', 'balance'
         }
-        for table in tables:
-            if not table:
-                continue
-            headers = {cell.lower() for cell in table[0]}
+        for headers in table_headers:
             if len(headers & billing_headers) >= 3:
                 return True
         return False
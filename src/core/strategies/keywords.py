@@ -0,0 +1,105 @@
+from typing import Dict, List, Set, Tuple, Iterable, TYPE_CHECKING
+from functools import cached_property
+import logging
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .base import BaseIndustryStrategy
+
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional C extension
+    ahocorasick = None
+    logger.info("pyahocorasick not installed, falling back to per-keyword scanning")
+
+class KeywordIndex:
+    """
+    Multi-pattern keyword matcher shared by all registered strategies.
+
+    Keywords from every (industry, document_type) are compiled into a single
+    Aho-Corasick automaton, so one pass over the text finds every keyword
+    for every strategy. Without pyahocorasick, each distinct keyword is
+    scanned once instead of once per strategy and document type.
+    """
+
+    def __init__(self, strategies: Iterable['BaseIndustryStrategy']):
+        self.owners: Dict[str, List[Tuple[str, str]]] = {}
+        self.keyword_counts: Dict[Tuple[str, str], int] = {}
+
+        for strategy in strategies:
+            for doc_type, keywords in strategy.keywords.items():
+                owner = (strategy.industry_name, doc_type)
+                self.keyword_counts[owner] = len(keywords)
+                for keyword in keywords:
+                    keyword = keyword.lower()
+                    if keyword:
+                        self.owners.setdefault(keyword, []).append(owner)
+
+        self._automaton = None
+        if ahocorasick is not None and self.owners:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.owners:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords occurring in already-lowercased text."""
+        if not text:
+            return set()
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        return {keyword for keyword in self.owners if keyword in text}
+
+    def hit_counts(self, text: str) -> Dict[Tuple[str, str], int]:
+        """Count matched keywords for every (industry, document_type) in one pass."""
+        counts = dict.fromkeys(self.keyword_counts, 0)
+        for keyword in self.find(text):
+            for owner in self.owners[keyword]:
+                counts[owner] += 1
+        return counts
+
+    @cached_property
+    def _weights(self) -> Tuple[Dict[str, int], 'np.ndarray', 'np.ndarray']:
+        """Keyword columns, keyword x (industry, document_type) counts and totals."""
+        import numpy as np
+        columns = {keyword: i for i, keyword in enumerate(self.owners)}
+        owner_columns = {owner: j for j, owner in enumerate(self.keyword_counts)}
+        weights = np.zeros((len(columns), len(owner_columns)), dtype=np.int64)
+        for keyword, owners in self.owners.items():
+            for owner in owners:
+                weights[columns[keyword], owner_columns[owner]] += 1
+        totals = np.array(list(self.keyword_counts.values()), dtype=np.float64)
+        return columns, weights, totals
+
+    def score_matrix(self, keyword_hits: List[Set[str]]) -> 'np.ndarray':
+        """
+        Score many documents at once.
+
+        Builds the document x keyword hit matrix from each document's
+        keyword hits and multiplies it by the keyword weight matrix. Rows
+        follow `keyword_hits`, columns follow `keyword_counts`; values equal
+        the per-strategy matches / len(keywords) score.
+        """
+        import numpy as np
+        columns, weights, totals = self._weights
+        hits = np.zeros((len(keyword_hits), len(columns)), dtype=np.int64)
+        rows = [i for i, found in enumerate(keyword_hits) for _ in found]
+        cols = [columns[keyword] for found in keyword_hits for keyword in found]
+        hits[rows, cols] = 1
+
+        counts = hits @ weights
+        return np.divide(
+            counts,
+            totals,
+            out=np.zeros(counts.shape, dtype=np.float64),
+            where=totals > 0
+        )
+
+    def scores_by_industry(self, row: 'np.ndarray') -> Dict[str, Dict[str, float]]:
+        """Convert one score_matrix row into {industry: {document_type: score}}."""
+        scores: Dict[str, Dict[str, float]] = {}
+        for (industry, doc_type), score in zip(self.keyword_counts, row):
+            scores.setdefault(industry, {})[doc_type] = float(score)
+        return scores
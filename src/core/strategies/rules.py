@@ -0,0 +1,59 @@
+from typing import Dict, List, Set, Pattern
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+_ESCAPE = re.compile(r'\\.')
+
+def compile_rule_pattern(pattern: str) -> Pattern:
+    """
+    Compile a rule pattern for matching against lowercased text.
+
+    Rules always run on lowercased text, so IGNORECASE is only kept for
+    patterns that spell out uppercase literals; case-sensitive matching
+    is several times faster in the stdlib engine.
+    """
+    literals = _ESCAPE.sub('', pattern)
+    flags = re.IGNORECASE if any(c.isupper() for c in literals) else 0
+    return re.compile(pattern, flags)
+
+class RuleSet:
+    """Rule families compiled once per strategy from raw pattern strings."""
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        self.families: Dict[str, List[Pattern]] = {
+            family: [compile_rule_pattern(pattern) for pattern in family_patterns]
+            for family, family_patterns in patterns.items()
+        }
+
+    def match(self, text: str) -> 'RuleMatches':
+        """Bind the rule set to already-lowercased text."""
+        return RuleMatches(self, text)
+
+class RuleMatches:
+    """
+    Memoized view of which rule families fire for one text.
+
+    Families are evaluated on first lookup only, so `custom_rules`
+    precedence still short-circuits and no family is scanned twice.
+    """
+
+    def __init__(self, rules: RuleSet, text: str):
+        self._rules = rules
+        self._text = text
+        self._results: Dict[str, bool] = {}
+
+    def __contains__(self, family: str) -> bool:
+        if family not in self._results:
+            patterns = self._rules.families.get(family)
+            if patterns is None:
+                raise KeyError(f"Unknown rule family: {family}")
+            self._results[family] = any(
+                pattern.search(self._text) for pattern in patterns
+            )
+        return self._results[family]
+
+    def fired(self) -> Set[str]:
+        """Evaluate every family and return those that matched."""
+        return {family for family in self._rules.families if family in self}
@@ -1,16 +1,270 @@
+import io
 import os
+import fcntl
 import hashlib
-import magic
 import shutil
+import time
+from contextlib import contextmanager
 from typing import Optional, Tuple, Set, List, Dict
 from pathlib import Path
 import tempfile
 from datetime import datetime
 import logging
 from werkzeug.utils import secure_filename
+from ..core.extractors.mime import (
+    MIME_EXTENSIONS, SNIFF_BYTES, detect_mime_type, detect_file_mime_type, detect_stream_mime_type
+)
+from ..core.models.context import DocumentContext
 
 logger = logging.getLogger(__name__)
 
+WRITE_BUFFER_SIZE = 1024 * 1024
+# Spool directory inside the upload folder
+SPOOL_DIR = 'spool'
+
+class UploadRejected(ValueError):
+    """Raised when an upload fails validation while it is received."""
+
+class UploadTooLarge(UploadRejected):
+    """Raised when an upload exceeds the size limit while it is received."""
+
+class UploadSpool:
+    """
+    Content-addressed store for uploads, keyed by SHA-256.
+    
+    Files live at `<root>/<h[:2]>/<h[2:4]>/<h><suffix>`, the suffix coming
+    from the MIME type since some readers (openpyxl) require one. They
+    are written under a temporary name in `<root>/tmp`, then atomically
+    renamed into place. Identical uploads share one file: each `add`
+    takes a reference and each `release` drops one, and the file is
+    deleted with the last reference. Reference counts are kept in a
+    `<name>.refs` file next to the content and updated under a per-shard
+    `flock`, so API and worker processes sharing the upload folder agree
+    on them.
+    
+    A crashed request or worker never releases its references; `sweep`
+    removes what it leaves behind. Generic cleanup such as
+    `cleanup_old_files` must not be pointed at the spool, as it ignores
+    reference counts and lock files.
+    """
+    
+    def __init__(self, root: str):
+        self.root = root
+        self.tmp_dir = os.path.join(root, 'tmp')
+        os.makedirs(self.tmp_dir, exist_ok=True)
+    
+    @staticmethod
+    def entry_name(file_hash: str, mime_type: Optional[str]) -> str:
+        """Spooled file name for content with this hash and type."""
+        return file_hash + MIME_EXTENSIONS.get(mime_type, '')
+    
+    def path_for(self, name: str) -> str:
+        """Final location of the entry with this name."""
+        return os.path.join(self.root, name[:2], name[2:4], name)
+    
+    def temp_file(self) -> Tuple[int, str]:
+        """Open a new temporary file on the spool's filesystem."""
+        return tempfile.mkstemp(dir=self.tmp_dir, suffix='.part')
+    
+    def add(self, temp_path: str, name: str) -> str:
+        """
+        Move a finished temp file into place and take a reference to it.
+        
+        When the content is already stored, the temp file is discarded.
+        Returns the content path.
+        """
+        file_path = self.path_for(name)
+        with self._refs(name) as refs:
+            count = refs.get()
+            if count and os.path.exists(file_path):
+                os.remove(temp_path)
+                logger.info(f"Deduplicated upload {name}")
+            else:
+                os.replace(temp_path, file_path)
+                count = 0
+            refs.set(count + 1)
+        return file_path
+    
+    def release(self, name: str):
+        """Drop a reference, deleting the content when none remain."""
+        with self._refs(name) as refs:
+            count = refs.get() - 1
+            if count > 0:
+                refs.set(count)
+                return
+            _remove_file(self.path_for(name))
+            _remove_file(refs.path)
+    
+    def sweep(self, temp_max_age: float, max_age: float) -> int:
+        """
+        Remove temp files and entries left behind by crashed holders.
+        
+        Temp files older than `temp_max_age` seconds are abandoned
+        uploads. Entries without references, or whose reference count has
+        not changed for `max_age` seconds, are removed with their refs
+        file. Returns the number of content and temp files removed.
+        """
+        now = time.time()
+        removed = 0
+        for entry in os.scandir(self.tmp_dir):
+            if entry.is_file() and now - entry.stat().st_mtime > temp_max_age:
+                removed += _remove_file(entry.path)
+        
+        for directory, subdirectories, names in os.walk(self.root):
+            if directory == self.root:
+                subdirectories[:] = [name for name in subdirectories if name != 'tmp']
+            for name in names:
+                # Content files are named by their hash and sit in their own shard
+                if not name.endswith('.refs') and os.path.dirname(self.path_for(name)) == directory:
+                    removed += self._sweep_entry(name, now, max_age)
+        
+        if removed:
+            logger.info(f"Swept {removed} stale files from upload spool {self.root}")
+        return removed
+    
+    def _sweep_entry(self, name: str, now: float, max_age: float) -> int:
+        """Remove one entry if it is unreferenced or stale."""
+        file_path = self.path_for(name)
+        with self._refs(name) as refs:
+            count = refs.get()
+            if count > 0:
+                # Each add and release rewrites the refs file
+                last_used = max(
+                    os.path.getmtime(path) for path in (file_path, refs.path)
+                    if os.path.exists(path)
+                )
+                if now - last_used <= max_age:
+                    return 0
+                logger.warning(f"Removing upload {name} still holding {count} references")
+            _remove_file(refs.path)
+            return _remove_file(file_path)
+    
+    def references(self, name: str) -> int:
+        """Current reference count of the entry with this name."""
+        with self._refs(name) as refs:
+            return refs.get()
+    
+    @contextmanager
+    def _refs(self, name: str):
+        """Hold the shard lock and yield the entry's reference counter."""
+        shard = os.path.dirname(self.path_for(name))
+        os.makedirs(shard, exist_ok=True)
+        with open(os.path.join(shard, '.lock'), 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield _RefCount(self.path_for(name) + '.refs')
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+def _remove_file(path: str) -> int:
+    """Remove a file if present, returning 1 if it was removed."""
+    try:
+        os.remove(path)
+        return 1
+    except FileNotFoundError:
+        return 0
+
+class _RefCount:
+    """Integer counter stored in a small file; callers hold the shard lock."""
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def get(self) -> int:
+        try:
+            with open(self.path) as f:
+                return int(f.read() or 0)
+        except FileNotFoundError:
+            return 0
+    
+    def set(self, count: int):
+        with open(self.path, 'w') as f:
+            f.write(str(count))
+
+class UploadWriter:
+    """
+    Spool one upload to disk as it is received.
+    
+    Bytes are hashed, counted and sniffed on the way through and written
+    with a large buffer to a temporary file in the spool; `commit` moves
+    it to its content address. Memory use is independent of the upload
+    size.
+    """
+    
+    def __init__(
+        self,
+        spool: UploadSpool,
+        filename: str,
+        max_size: Optional[int] = None,
+        buffer_size: int = WRITE_BUFFER_SIZE
+    ):
+        self.spool = spool
+        self.filename = filename
+        self.max_size = max_size
+        self.size = 0
+        fd, self._temp_path = spool.temp_file()
+        self._file = os.fdopen(fd, 'wb', buffering=buffer_size)
+        self._hash = hashlib.sha256()
+        self._head = bytearray()
+    
+    def write(self, data: bytes):
+        """Append a chunk, rejecting the upload once it passes `max_size`."""
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            self.abort()
+            raise UploadTooLarge(f"File size exceeds maximum of {self.max_size} bytes")
+        if len(self._head) < SNIFF_BYTES:
+            self._head += data[:SNIFF_BYTES - len(self._head)]
+        self._hash.update(data)
+        self._file.write(data)
+    
+    def commit(self, mime_type: Optional[str] = None) -> DocumentContext:
+        """Move the finished upload to its content address and describe it."""
+        self._file.close()
+        file_hash = self._hash.hexdigest()
+        mime_type = mime_type or detect_mime_type(bytes(self._head), self._temp_path)
+        file_path = self.spool.add(self._temp_path, self.spool.entry_name(file_hash, mime_type))
+        return DocumentContext(
+            file_hash=file_hash,
+            file_size=self.size,
+            mime_type=mime_type,
+            file_path=file_path,
+            filename=self.filename
+        )
+    
+    def abort(self):
+        """Discard a partial upload."""
+        self._file.close()
+        try:
+            os.remove(self._temp_path)
+        except FileNotFoundError:
+            pass
+
+class MemoryUploadWriter:
+    """Collect a small upload in memory; same interface as UploadWriter."""
+    
+    def __init__(self, filename: str, max_size: Optional[int] = None):
+        self.filename = filename
+        self.max_size = max_size
+        self.size = 0
+        self._buffer = bytearray()
+    
+    def write(self, data: bytes):
+        """Append a chunk, rejecting the upload once it passes `max_size`."""
+        self.size += len(data)
+        if self.max_size is not None and self.size > self.max_size:
+            self.abort()
+            raise UploadTooLarge(f"File size exceeds maximum of {self.max_size} bytes")
+        self._buffer += data
+    
+    def commit(self, mime_type: Optional[str] = None) -> DocumentContext:
+        """Describe the buffered upload."""
+        return DocumentContext.from_bytes(bytes(self._buffer), self.filename, mime_type)
+    
+    def abort(self):
+        """Discard the buffered upload."""
+        self._buffer = bytearray()
+
 class FileManager:
     """Utility class for file operations."""
     
@@ -23,46 +277,86 @@ class FileManager:
         self.upload_dir = upload_dir
         self.allowed_extensions = allowed_extensions
         self.max_file_size = max_file_size
-        self.mime = magic.Magic(mime=True)
         
         # Create upload directory if it doesn't exist
         os.makedirs(upload_dir, exist_ok=True)
+        self.spool = UploadSpool(os.path.join(upload_dir, SPOOL_DIR))
     
-    def save_uploaded_file(
+    def save_uploaded_file(self, file, filename: str) -> Tuple[str, str]:
+        """
+        Save uploaded file and return (file_path, file_hash).
+        
+        Args:
+            file: File-like object
+            filename: Original filename
+        
+        Returns:
+            Tuple containing (file_path, file_hash)
+        """
+        context = self.save_upload(file, filename)
+        return context.file_path, context.file_hash
+    
+    def save_upload(
         self,
         file,
         filename: str,
-        prefix: Optional[str] = None
-    ) -> Tuple[str, str]:
+        mime_type: Optional[str] = None
+    ) -> DocumentContext:
         """
-        Save uploaded file and return (file_path, file_hash).
+        Save uploaded file, hashing, sizing and sniffing it while writing.
         
         Args:
             file: File-like object
             filename: Original filename
-            prefix: Optional prefix for saved filename
+            mime_type: MIME type already detected for this upload
         
         Returns:
-            Tuple containing (file_path, file_hash)
+            DocumentContext for the saved file; release it when done
         """
+        writer = self.open_upload(filename)
         try:
-            # Generate unique filename
-            safe_filename = self.get_safe_filename(filename, prefix)
-            file_path = os.path.join(self.upload_dir, safe_filename)
-            
-            # Save file and calculate hash
-            file_hash = hashlib.sha256()
-            with open(file_path, 'wb') as f:
-                for chunk in iter(lambda: file.read(8192), b''):
-                    file_hash.update(chunk)
-                    f.write(chunk)
-            
-            return file_path, file_hash.hexdigest()
+            for chunk in iter(lambda: file.read(WRITE_BUFFER_SIZE), b''):
+                writer.write(chunk)
+            return writer.commit(mime_type)
             
         except Exception as e:
+            writer.abort()
             logger.error(f"Error saving file {filename}: {str(e)}")
             raise
     
+    def open_upload(self, filename: str, in_memory: bool = False):
+        """
+        Start spooling an upload into the content-addressed upload spool.
+        
+        Args:
+            filename: Original filename
+            in_memory: Keep the upload in memory instead of writing it
+        
+        Returns:
+            UploadWriter (or MemoryUploadWriter) enforcing the maximum file size
+        """
+        if in_memory:
+            return MemoryUploadWriter(filename, max_size=self.max_file_size)
+        return UploadWriter(self.spool, filename, max_size=self.max_file_size)
+    
+    def release(self, *contexts: DocumentContext):
+        """
+        Drop the references taken by spooled uploads.
+        
+        The spooled file is removed once no other upload refers to it.
+        In-memory contexts and files outside the spool are ignored.
+        
+        Args:
+            contexts: Contexts returned by `save_upload` or `open_upload`
+        """
+        for context in contexts:
+            name = os.path.basename(context.file_path or '')
+            if name.startswith(context.file_hash) and context.file_path == self.spool.path_for(name):
+                try:
+                    self.spool.release(name)
+                except Exception as e:
+                    logger.warning(f"Error releasing {context.file_path}: {str(e)}")
+    
     def get_safe_filename(self, filename: str, prefix: Optional[str] = None) -> str:
         """
         Generate safe filename with timestamp and optional prefix.
@@ -95,29 +389,52 @@ class FileManager:
         
         return '_'.join(parts) + ext
     
-    def validate_file(self, file_path: str) -> Tuple[bool, Optional[str]]:
+    def detect_mime_type(self, file) -> str:
+        """
+        Detect the MIME type of a file path or seekable upload stream.
+        
+        Args:
+            file: Path to file, or file-like object (e.g. FileStorage)
+        
+        Returns:
+            MIME type string
+        """
+        if isinstance(file, (str, os.PathLike)):
+            return detect_file_mime_type(file)
+        return detect_stream_mime_type(getattr(file, 'stream', file))
+    
+    def validate_file(self, file, mime_type: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """
         Validate file against size and type restrictions.
         
         Args:
-            file_path: Path to file to validate
+            file: Path to file, or seekable upload (e.g. FileStorage)
+            mime_type: MIME type already detected for this file
         
         Returns:
             Tuple of (is_valid, error_message)
         """
         try:
             # Check file size
-            size = os.path.getsize(file_path)
+            if isinstance(file, (str, os.PathLike)):
+                size = os.path.getsize(file)
+                filename = str(file)
+            else:
+                stream = getattr(file, 'stream', file)
+                position = stream.tell()
+                size = stream.seek(0, os.SEEK_END) - position
+                stream.seek(position)
+                filename = file.filename
             if size > self.max_file_size:
                 return False, f"File size {size} exceeds maximum of {self.max_file_size}"
 
             # Check extension
-            ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+            ext = os.path.splitext(filename)[1].lower().lstrip('.')
             if ext not in self.allowed_extensions:
                 return False, f"Extension .{ext} not allowed"
 
             # Check MIME type
-            mime_type = self.mime.from_file(file_path)
+            mime_type = mime_type or self.detect_mime_type(file)
             if not self._is_mime_type_allowed(mime_type):
                 return False, f"MIME type {mime_type} not allowed"
 
@@ -183,7 +500,7 @@ class FileManager:
                 'size': stat.st_size,
                 'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                 'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'mime_type': self.mime.from_file(file_path),
+                'mime_type': detect_file_mime_type(file_path),
                 'hash': file_hash.hexdigest()
             }
         except Exception as e:
@@ -226,15 +543,13 @@ class BatchFileManager(FileManager):
     
     def process_batch(
         self,
-        files: List[Tuple[str, bytes]],
-        prefix: Optional[str] = None
+        files: List[Tuple[str, bytes]]
     ) -> List[Dict[str, any]]:
         """
         Process a batch of files.
         
         Args:
             files: List of (filename, content) tuples
-            prefix: Optional prefix for saved files
         
         Returns:
             List of dictionaries containing file information
@@ -245,37 +560,22 @@ class BatchFileManager(FileManager):
             )
         
         results = []
-        temp_files = []
+        for filename, content in files:
+            # Write straight to the spool; hash, size and type come from the write
+            context = self.save_upload(io.BytesIO(content), filename)
+            stat = os.stat(context.file_path)
+            results.append({
+                'original_filename': filename,
+                'saved_path': context.file_path,
+                'hash': context.file_hash,
+                'size': context.file_size,
+                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'mime_type': context.mime_type,
+                'context': context
+            })
         
-        try:
-            for filename, content in files:
-                # Save file temporarily
-                with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                    temp_file.write(content)
-                    temp_file.flush()
-                    temp_files.append(temp_file.name)
-                    
-                    # Move to final location
-                    file_path, file_hash = self.save_uploaded_file(
-                        open(temp_file.name, 'rb'),
-                        filename,
-                        prefix
-                    )
-                    
-                    # Get file info
-                    file_info = self.get_file_info(file_path)
-                    results.append({
-                        'original_filename': filename,
-                        'saved_path': file_path,
-                        'hash': file_hash,
-                        **file_info
-                    })
-            
-            return results
-            
-        finally:
-            # Cleanup temporary files
-            self.cleanup_temp_files(*temp_files)
+        return results
     
     def validate_batch(self, files: List[Tuple[str, bytes]]) -> List[Dict[str, any]]:
         """
@@ -310,7 +610,8 @@ class BatchFileManager(FileManager):
                 result['errors'].append(f'Extension .{ext} not allowed')
             
             # Check MIME type
-            mime_type = magic.from_buffer(content, mime=True)
+            mime_type = detect_mime_type(content)
+            result['mime_type'] = mime_type
             if not self._is_mime_type_allowed(mime_type):
                 result['valid'] = False
                 result['errors'].append(f'MIME type {mime_type} not allowed')
@@ -0,0 +1,98 @@
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# Modules that should only load when a document actually needs them
+HEAVY_MODULES = (
+    'cv2', 'numpy', 'pandas', 'pdfplumber', 'PyPDF2', 'PIL',
+    'docx', 'openpyxl', 'pytesseract', 'tesserocr', 'langdetect', 'magic'
+)
+
+_PROBE = """
+import importlib, json, resource, sys, time
+start = time.perf_counter()
+module = importlib.import_module({module!r})
+{call}
+print(json.dumps({{
+    'seconds': time.perf_counter() - start,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': sorted(sys.modules),
+}}))
+"""
+
+@dataclass
+class ModuleCost:
+    name: str
+    self_us: int
+    cumulative_us: int
+
+@dataclass
+class StartupProfile:
+    module: str
+    seconds: float
+    rss_mb: float
+    heavy_modules: List[str]
+    costs: List[ModuleCost] = field(default_factory=list)
+
+    def top(self, count: int = 20, key: str = 'cumulative_us') -> List[ModuleCost]:
+        return sorted(self.costs, key=lambda cost: getattr(cost, key), reverse=True)[:count]
+
+def _parse_importtime(stderr: str) -> List[ModuleCost]:
+    """Parse `-X importtime` lines: "import time: self [us] | cumulative | module"."""
+    costs = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        costs.append(ModuleCost(parts[2].strip(), int(parts[0]), int(parts[1])))
+    return costs
+
+def measure_import(target: str, env: Optional[Dict[str, str]] = None) -> StartupProfile:
+    """
+    Start `target` in a fresh interpreter and report its startup cost.
+
+    `target` is a module, or "module:factory" to also call a factory such
+    as `create_app` so imports and setup done inside it are measured.
+    """
+    module, _, factory = target.partition(':')
+    call = f"module.{factory}()" if factory else ''
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE.format(module=module, call=call)],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Starting {target} failed:\n{result.stderr[-2000:]}")
+
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    loaded = set(probe['modules'])
+    return StartupProfile(
+        module=target,
+        seconds=probe['seconds'],
+        rss_mb=probe['max_rss_kb'] / 1024,
+        heavy_modules=[name for name in HEAVY_MODULES if name in loaded],
+        costs=_parse_importtime(result.stderr)
+    )
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Report per-module import cost of a process entry point.")
+    parser.add_argument('module', nargs='?', default='src.api.app:create_app',
+                        help='module, or module:factory to also call an app factory')
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--sort', choices=('cumulative', 'self'), default='cumulative')
+    args = parser.parse_args(argv)
+
+    profile = measure_import(args.module)
+    print(f"{profile.module}: {profile.seconds * 1000:.1f} ms, {profile.rss_mb:.1f} MB RSS, "
+          f"{len(profile.costs)} modules imported")
+    print(f"Heavy modules loaded: {', '.join(profile.heavy_modules) or 'none'}")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for cost in profile.top(args.top, key=f'{args.sort}_us'):
+        print(f"{cost.self_us / 1000:9.1f} {cost.cumulative_us / 1000:9.1f}  {cost.name}")
+
+if __name__ == "__main__":
+    main()
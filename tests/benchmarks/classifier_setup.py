@@ -0,0 +1,31 @@
+import time
+import statistics
+from src.core.classifier import DocumentClassifier, get_classifier
+
+def benchmark_classifier_setup(iterations: int = 200):
+    """Compare per-request classifier construction with the shared instance."""
+
+    def measure(factory):
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            factory()
+            timings.append((time.perf_counter() - start) * 1000)
+        return timings
+
+    # Warm imports so both sides measure steady-state cost only
+    get_classifier()
+
+    per_request = measure(DocumentClassifier)
+    shared = measure(get_classifier)
+
+    print("Per-request classifier setup cost")
+    print("-" * 50)
+    for label, timings in [("new DocumentClassifier()", per_request), ("get_classifier()", shared)]:
+        print(
+            f"{label:<28} mean {statistics.mean(timings):8.3f} ms  "
+            f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:8.3f} ms"
+        )
+
+if __name__ == "__main__":
+    benchmark_classifier_setup()
@@ -0,0 +1,66 @@
+import random
+import time
+import tracemalloc
+import docx
+from docx.enum.text import WD_BREAK
+from src.core.extractors.office import WordExtractor
+
+CLAUSE = (
+    "The Supplier shall deliver the Services in accordance with the Agreement, "
+    "and the Customer shall pay all undisputed invoices within thirty days of receipt. "
+)
+
+def _generate_contract(pages: int, path: str) -> str:
+    """Build a contract-like DOCX with clauses, merged-cell schedules and page breaks."""
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "Master Services Agreement - Confidential"
+    document.sections[0].footer.paragraphs[0].text = "Page footer"
+
+    for page in range(pages):
+        document.add_heading(f"Clause {page + 1}", level=2)
+        for _ in range(8):
+            document.add_paragraph(CLAUSE * random.randint(1, 3))
+
+        if page % 10 == 0:
+            table = document.add_table(rows=12, cols=5)
+            for i, row in enumerate(table.rows):
+                for j, cell in enumerate(row.cells):
+                    cell.text = f"Item {i}.{j}" if j else f"Fee {i * 100}.00"
+            table.cell(0, 0).merge(table.cell(0, 4))
+            table.cell(1, 0).merge(table.cell(5, 0))
+
+        document.paragraphs[-1].add_run().add_break(WD_BREAK.PAGE)
+
+    document.save(path)
+    return path
+
+def _measure(func, *args):
+    """Wall time of an untraced run and peak traced memory of a second run."""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def benchmark_docx_extraction(pages=(50, 500)):
+    """Compare the python-docx object model with the streaming parser."""
+    extractor = WordExtractor()
+
+    print("DOCX extraction (contract-style documents)")
+    print("-" * 72)
+    for count in pages:
+        path = _generate_contract(count, f"/tmp/benchmark_contract_{count}.docx")
+
+        legacy_time, legacy_peak, legacy = _measure(extractor._parse_with_python_docx, path)
+        stream_time, stream_peak, streamed = _measure(extractor._parse_streaming, path)
+
+        assert streamed == legacy
+        print(f"{count:>4} pages  python-docx {legacy_time * 1000:8.1f} ms {legacy_peak / 2**20:7.1f} MB  "
+              f"streaming {stream_time * 1000:8.1f} ms {stream_peak / 2**20:6.1f} MB")
+
+if __name__ == "__main__":
+    benchmark_docx_extraction()
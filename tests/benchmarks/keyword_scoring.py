@@ -0,0 +1,56 @@
+import random
+import time
+from src.core.strategies.financial import FinancialIndustryStrategy
+from src.core.strategies.healthcare import HealthcareIndustryStrategy
+from src.core.strategies.keywords import KeywordIndex
+
+VOCABULARY = (
+    "account balance deposit statement period patient dosage total amount "
+    "invoice due date lorem ipsum dolor sit amet page of the and tax year"
+).split()
+
+def _generate_text(size_mb: float) -> str:
+    words = []
+    length = 0
+    while length < size_mb * 1024 * 1024:
+        word = random.choice(VOCABULARY)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+def _loop_scores(strategies, text: str) -> dict:
+    """Previous behaviour: one substring scan per keyword per document type."""
+    text = text.lower()
+    return {
+        (strategy.industry_name, doc_type): sum(
+            1 for keyword in keywords if keyword.lower() in text
+        )
+        for strategy in strategies
+        for doc_type, keywords in strategy.keywords.items()
+    }
+
+def benchmark_keyword_scoring(sizes_mb=(1, 4, 8)):
+    """Compare the per-keyword loop with a single KeywordIndex pass."""
+    strategies = [FinancialIndustryStrategy(), HealthcareIndustryStrategy()]
+    index = KeywordIndex(strategies)
+
+    print(f"Keyword scoring ({len(index.owners)} distinct keywords, "
+          f"automaton={'yes' if index._automaton is not None else 'no'})")
+    print("-" * 50)
+    for size in sizes_mb:
+        text = _generate_text(size)
+
+        start = time.perf_counter()
+        expected = _loop_scores(strategies, text)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        counts = index.hit_counts(text.lower())
+        index_time = time.perf_counter() - start
+
+        assert counts == expected
+        print(f"{size:>4} MB  loop {loop_time * 1000:9.1f} ms  "
+              f"index {index_time * 1000:9.1f} ms  speedup {loop_time / index_time:5.1f}x")
+
+if __name__ == "__main__":
+    benchmark_keyword_scoring()
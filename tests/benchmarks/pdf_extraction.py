@@ -0,0 +1,74 @@
+import io
+import time
+import tracemalloc
+from pathlib import Path
+import PyPDF2
+import pdfplumber
+from src.core.extractors.pdf import PDFExtractor
+
+FILES_DIR = Path(__file__).parent.parent / "files"
+
+def _legacy_extract(extractor: PDFExtractor, file_path: str) -> str:
+    """Previous behaviour: PyPDF2 pass, pdfplumber fallback, separate header/footer pass."""
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        text = "".join(page.extract_text() or "" for page in reader.pages)
+
+    if not text or extractor._needs_ocr(text):
+        with pdfplumber.open(file_path) as pdf:
+            text = "".join(page.extract_text() or "" for page in pdf.pages)
+            tables = [t for page in pdf.pages for t in page.extract_tables()]
+
+    headers, footers = [], []
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            header = page.crop((0, 0, page.width, page.height * 0.1)).extract_text() or ""
+            footer = page.crop((0, page.height * 0.9, page.width, page.height)).extract_text() or ""
+            if header: headers.append(header)
+            if footer: footers.append(footer)
+
+    return text
+
+def _repeat_pages(file_path: Path, copies: int) -> str:
+    """Build a larger PDF by repeating the pages of a sample document."""
+    reader = PyPDF2.PdfReader(str(file_path))
+    writer = PyPDF2.PdfWriter()
+    for _ in range(copies):
+        for page in reader.pages:
+            writer.add_page(page)
+
+    out_path = f"/tmp/benchmark_{file_path.stem}_{copies}.pdf"
+    with open(out_path, 'wb') as out:
+        writer.write(out)
+    return out_path
+
+def _measure(func, *args):
+    """Wall time of an untraced run and peak traced memory of a second run."""
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def benchmark_pdf_extraction(copies=(1, 20, 100)):
+    """Compare wall time and peak traced memory of the old and single-open pipelines."""
+    extractor = PDFExtractor()
+    sample = sorted(FILES_DIR.glob("*.pdf"))[0]
+
+    print(f"PDF extraction ({sample.name} repeated)")
+    print("-" * 70)
+    for count in copies:
+        file_path = _repeat_pages(sample, count)
+
+        legacy_time, legacy_peak = _measure(_legacy_extract, extractor, file_path)
+        new_time, new_peak = _measure(extractor.extract_content, file_path)
+
+        print(f"{count:>4} pages  legacy {legacy_time * 1000:8.1f} ms {legacy_peak / 2**20:6.1f} MB  "
+              f"single-open {new_time * 1000:8.1f} ms {new_peak / 2**20:6.1f} MB")
+
+if __name__ == "__main__":
+    benchmark_pdf_extraction()
@@ -0,0 +1,59 @@
+import io
+import os
+import time
+from pathlib import Path
+import PyPDF2
+import pdfplumber
+from src.core.extractors.ocr import configure_ocr_pool
+from src.core.extractors.pdf import PDFExtractor
+
+FILES_DIR = Path(__file__).parent.parent / "files"
+
+def _scanned_copy(file_path: Path) -> PyPDF2.PdfReader:
+    """Rasterize a native PDF into an image-only ("scanned") PDF."""
+    with pdfplumber.open(file_path) as pdf:
+        images = [page.to_image(resolution=200).original.convert('RGB') for page in pdf.pages]
+
+    buffer = io.BytesIO()
+    images[0].save(buffer, format='PDF', save_all=True, append_images=images[1:])
+    buffer.seek(0)
+    return PyPDF2.PdfReader(buffer)
+
+def _mixed_pdf(file_path: Path, pages: int, scanned_ratio: float) -> str:
+    """Interleave native and scanned copies of a sample page."""
+    native = PyPDF2.PdfReader(str(file_path)).pages[0]
+    scanned = _scanned_copy(file_path).pages[0]
+
+    writer = PyPDF2.PdfWriter()
+    scanned_pages = round(pages * scanned_ratio)
+    for i in range(pages):
+        is_scanned = scanned_pages and i % max(1, pages // scanned_pages) == 0
+        writer.add_page(scanned if is_scanned else native)
+
+    out_path = f"/tmp/benchmark_mixed_{pages}_{int(scanned_ratio * 100)}.pdf"
+    with open(out_path, 'wb') as out:
+        writer.write(out)
+    return out_path
+
+def benchmark_pdf_ocr(pages=20, scanned_ratios=(0.0, 0.25, 0.5, 1.0)):
+    """Pages per second for mixed native/scanned PDFs, serial vs pooled OCR."""
+    extractor = PDFExtractor()
+    sample = sorted(FILES_DIR.glob("*.pdf"))[0]
+    pool_sizes = sorted({1, os.cpu_count() or 1})
+
+    print(f"PDF OCR throughput ({pages} pages of {sample.name})")
+    print("-" * 60)
+    for ratio in scanned_ratios:
+        file_path = _mixed_pdf(sample, pages, ratio)
+        row = f"{int(ratio * 100):>3}% scanned"
+        for size in pool_sizes:
+            pool = configure_ocr_pool(size)
+            start = time.perf_counter()
+            content = extractor.extract_content(file_path)
+            elapsed = time.perf_counter() - start
+            row += f"  pool={size}: {pages / elapsed:6.1f} pages/s"
+        print(f"{row}  (OCR'd {len(content.metadata['ocr_pages'])})")
+    pool.shutdown()
+
+if __name__ == "__main__":
+    benchmark_pdf_ocr()
@@ -0,0 +1,40 @@
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+from src.core.classifier import DocumentClassifier
+classifier = DocumentClassifier()
+if {preload}:
+    classifier.registry.preload()
+print(json.dumps({{
+    'seconds': time.perf_counter() - start,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': len(sys.modules),
+}}))
+"""
+
+def _probe(preload: bool) -> dict:
+    """Build a classifier in a fresh interpreter and report its startup cost."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(preload=preload)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def benchmark_startup(runs=5):
+    """Compare lazy extractor loading with importing every extractor up front."""
+    print("Classifier startup (fresh interpreter, median of runs)")
+    print("-" * 60)
+    for label, preload in (("eager extractors", True), ("lazy extractors", False)):
+        samples = [_probe(preload) for _ in range(runs)]
+        seconds = statistics.median(s['seconds'] for s in samples)
+        rss = statistics.median(s['max_rss_kb'] for s in samples)
+        modules = samples[0]['modules']
+        print(f"{label:<18} {seconds * 1000:8.1f} ms  {rss / 1024:7.1f} MB RSS  {modules:5d} modules")
+
+if __name__ == "__main__":
+    benchmark_startup()
@@ -30,6 +30,22 @@ def test_classify_endpoint(client, sample_files):
     assert 'confidence_score' in result
     assert 'metadata' in result
 
+def test_classify_endpoint_returns_text_when_configured(client, sample_files):
+    """Test INCLUDE_EXTRACTED_TEXT puts the extracted text in the /classify response."""
+    app.config['INCLUDE_EXTRACTED_TEXT'] = True
+    try:
+        with open(sample_files['bank_statement'], 'rb') as f:
+            response = client.post(
+                '/classify',
+                data={'file': (f, 'bank_statement.docx')},
+                content_type='multipart/form-data'
+            )
+    finally:
+        app.config['INCLUDE_EXTRACTED_TEXT'] = False
+
+    assert response.status_code == 200
+    assert json.loads(response.data)['extracted_text']
+
 def test_batch_endpoint(client, sample_files):
     """Test the /batch/submit endpoint."""
     files = []
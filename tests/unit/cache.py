@@ -0,0 +1,73 @@
+import pytest
+from document_classifier.core.cache import LRUCache, ClassificationCache
+import time
+
+def test_lru_eviction():
+    """Test least recently used entries are evicted first."""
+    cache = LRUCache(max_size=2, ttl=None)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+def test_lru_ttl_expiry():
+    """Test entries expire after their TTL."""
+    cache = LRUCache(max_size=10, ttl=0.01)
+    cache.set('a', 1)
+    time.sleep(0.02)
+    assert cache.get('a') is None
+
+def test_cache_key_includes_strategy_version():
+    """Test strategy-set changes move lookups to a new key."""
+    key_v1 = ClassificationCache.make_key('abc', 'financial', 'v1')
+    key_v2 = ClassificationCache.make_key('abc', 'financial', 'v2')
+    assert key_v1 != key_v2
+
+def test_classifier_cache_hit_skips_extraction(classifier, sample_files, monkeypatch):
+    """Test repeated classification is served from the cache."""
+    first = classifier.classify(sample_files['bank_statement'], industry='financial')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("extractor should not run on a cache hit")
+
+    monkeypatch.setattr(classifier.registry, 'get_extractor', fail)
+    second = classifier.classify(sample_files['bank_statement'], industry='financial')
+
+    assert second.document_type == first.document_type
+    assert second.confidence_score == first.confidence_score
+
+def test_classifier_caches_text_only_when_requested(classifier, sample_files, monkeypatch):
+    """Test cache entries hold extracted content only for callers that asked for it."""
+    key = ClassificationCache.make_key(
+        classifier.classify(sample_files['invoice']).file_hash, None, classifier.strategy_version
+    )
+    assert classifier.cache.get(key)['extracted_text'] is None
+
+    with_text = classifier.classify(sample_files['invoice'], return_extracted_text=True)
+    assert with_text.extracted_text
+    assert classifier.cache.get(key)['extracted_text'] == with_text.extracted_text
+
+    monkeypatch.setattr(classifier.registry, 'get_extractor', lambda *args, **kwargs: None)
+    assert classifier.classify(sample_files['invoice']).extracted_text is None
+    assert classifier.classify(sample_files['invoice'], return_extracted_text=True).extracted_text == with_text.extracted_text
+
+def test_classifier_cache_hits_are_not_shared(classifier, sample_files):
+    """Test mutating a returned result does not corrupt later cache hits."""
+    first = classifier.classify(sample_files['invoice'])
+    expected = (dict(first.metadata), first.tables and [list(row) for row in first.tables[0]])
+    first.metadata.clear()
+    if first.tables:
+        first.tables[0].clear()
+
+    second = classifier.classify(sample_files['invoice'])
+    second.metadata['classification_method'] = 'mutated'
+    if second.tables:
+        second.tables[0].append(['mutated'])
+
+    third = classifier.classify(sample_files['invoice'])
+    assert third.metadata == expected[0]
+    assert (third.tables and [list(row) for row in third.tables[0]]) == expected[1]
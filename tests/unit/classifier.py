@@ -1,7 +1,9 @@
 import pytest
-from document_classifier.core.classifier import DocumentClassifier
+from document_classifier.core.classifier import DocumentClassifier, get_classifier
 from document_classifier.exceptions.classification_exceptions import ClassificationError
 from document_classifier.core.models.document import Document
+from document_classifier.core.models.context import DocumentContext
+from document_classifier.core.extractors.base import BaseExtractor, ExtractedContent, ImageReference
 import os
 
 def test_classify_bank_statement(classifier, sample_files):
@@ -49,3 +51,194 @@ def test_multiple_industries(classifier, sample_files):
     # Should have different confidence scores for different industries
     confidence_scores = [r.confidence_score for r in results]
     assert len(set(confidence_scores)) > 1
+
+def test_classify_many_matches_classify(classifier, sample_files):
+    """Test batch classification matches per-document classification."""
+    paths = list(sample_files.values())
+    batch_results = classifier.classify_many(paths)
+
+    assert len(batch_results) == len(paths)
+    for path, batch_result in zip(paths, batch_results):
+        classifier.cache.clear()
+        single = classifier.classify(path)
+        assert batch_result.document_type == single.document_type
+        assert batch_result.confidence_score == single.confidence_score
+
+def test_classify_many_reports_failures_in_place(classifier, sample_files, temp_upload_dir):
+    """Test a failing document does not abort the rest of the batch."""
+    missing = os.path.join(temp_upload_dir, "missing.pdf")
+    results = classifier.classify_many([missing, sample_files['invoice']])
+
+    assert isinstance(results[0], ClassificationError)
+    assert isinstance(results[1], Document)
+
+def test_early_exit_skips_remaining_strategies(sample_files):
+    """Test generic classification stops once a strategy clears the threshold."""
+    classifier = DocumentClassifier(early_exit_threshold=0.0)
+    evaluated = []
+    for strategy in classifier.strategies.values():
+        original = strategy.classify_features
+        strategy.classify_features = lambda features, s=strategy, f=original: evaluated.append(s) or f(features)
+
+    # Only count the generic cascade, not the page-level confidence checks
+    classify_generic = classifier._classify_generic
+    classifier._classify_generic = lambda features: evaluated.clear() or classify_generic(features)
+
+    classifier.classify(sample_files['invoice'])
+    assert len(evaluated) == 1
+
+def test_full_evaluation_without_threshold(sample_files):
+    """Test disabling early exit evaluates every strategy."""
+    classifier = DocumentClassifier(early_exit_threshold=None)
+    result = classifier.classify(sample_files['bank_statement'])
+    assert 0 <= result.confidence_score <= 1
+
+class PagedExtractor(BaseExtractor):
+    """Extractor yielding fixed page texts and recording how many were read."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.read = 0
+
+    def supported_mimes(self):
+        return ['text/plain']
+
+    def extract_content(self, file_path):
+        return self.combine_pages(list(self.iter_pages(file_path)))
+
+    def validate_file(self, file_path):
+        return True
+
+    def iter_pages(self, file_path):
+        for text in self.pages:
+            self.read += 1
+            yield ExtractedContent(text=text, metadata={'mime_type': 'text/plain'})
+
+    def combine_pages(self, pages):
+        return ExtractedContent(
+            text="\n".join(page.text for page in pages),
+            metadata=dict(pages[0].metadata)
+        )
+
+def test_page_budget_limits_extraction(sample_files, monkeypatch):
+    """Test extraction stops at the page budget and reports pages read."""
+    classifier = DocumentClassifier(early_exit_threshold=None)
+    extractor = PagedExtractor(["filler text"] * 10)
+    monkeypatch.setattr(classifier.registry, 'get_extractor', lambda file_path, mime_type=None: extractor)
+
+    result = classifier.classify(sample_files['invoice'], max_pages=3)
+    assert extractor.read == 3
+    assert result.metadata['pages_read'] == 3
+    assert result.metadata['extraction_stopped'] == 'page_budget'
+
+def test_confident_prefix_stops_extraction(sample_files, monkeypatch):
+    """Test extraction stops once the pages read are confidently classified."""
+    classifier = DocumentClassifier(early_exit_threshold=0.0)
+    extractor = PagedExtractor(["invoice total due"] + ["filler text"] * 10)
+    monkeypatch.setattr(classifier.registry, 'get_extractor', lambda file_path, mime_type=None: extractor)
+
+    result = classifier.classify(sample_files['invoice'])
+    assert extractor.read == 1
+    assert result.metadata['extraction_stopped'] == 'confident'
+
+def test_requested_text_is_never_a_confident_prefix(sample_files, monkeypatch):
+    """Test callers asking for the text get every page, even after a confident cached result."""
+    classifier = DocumentClassifier(early_exit_threshold=0.0)
+    extractor = PagedExtractor(["invoice total due"] + ["filler text"] * 10)
+    monkeypatch.setattr(classifier.registry, 'get_extractor', lambda file_path, mime_type=None: extractor)
+
+    classifier.classify(sample_files['invoice'])
+    result = classifier.classify(sample_files['invoice'], return_extracted_text=True)
+    assert extractor.read == 1 + 11
+    assert 'extraction_stopped' not in result.metadata
+    assert result.extracted_text.count("filler text") == 10
+
+def test_classify_context_uses_precomputed_facts(classifier, sample_files, monkeypatch):
+    """Test a DocumentContext is classified without re-hashing or re-sniffing the file."""
+    context = DocumentContext.from_path(sample_files['invoice'])
+    by_path = classifier.classify(sample_files['invoice'])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("context facts should not be recomputed")
+
+    monkeypatch.setattr(DocumentContext, 'from_path', fail)
+    monkeypatch.setattr(classifier.registry, 'detect_mime_type', fail)
+    classifier.cache.clear()
+    result = classifier.classify(context)
+
+    assert result.file_hash == by_path.file_hash == context.file_hash
+    assert result.file_size == os.path.getsize(sample_files['invoice'])
+    assert result.mime_type == context.mime_type
+    assert result.document_type == by_path.document_type
+
+def test_classify_in_memory_context(classifier, sample_files):
+    """Test a buffered context is classified without a file path."""
+    with open(sample_files['invoice'], 'rb') as f:
+        context = DocumentContext.from_bytes(f.read(), filename='invoice.pdf')
+
+    result = classifier.classify(context)
+    assert context.file_path is None
+    assert result.file_hash == DocumentContext.from_path(sample_files['invoice']).file_hash
+
+def test_classify_bytes_reads_from_memory(classifier, sample_files, monkeypatch):
+    """Test classify_bytes never spills stream-capable formats to disk."""
+    import tempfile
+
+    def fail(*args, **kwargs):
+        raise AssertionError("in-memory document was written to disk")
+
+    monkeypatch.setattr(tempfile, 'mkstemp', fail)
+    with open(sample_files['invoice'], 'rb') as f:
+        data = f.read()
+
+    from_memory = classifier.classify_bytes(memoryview(data), filename='invoice.pdf')
+    classifier.cache.clear()
+    from_disk = classifier.classify(sample_files['invoice'])
+
+    assert from_memory.document_type == from_disk.document_type
+    assert from_memory.file_hash == from_disk.file_hash
+    assert from_memory.file_path == 'invoice.pdf'
+
+def test_results_hold_no_image_references(classifier, sample_files, monkeypatch):
+    """Test image references to the (possibly spooled) source never reach results or the cache."""
+    class ImagePagedExtractor(PagedExtractor):
+        def combine_pages(self, pages):
+            content = super().combine_pages(pages)
+            content.images = [ImageReference(sample_files['invoice'])]
+            return content
+
+    cached = []
+    monkeypatch.setattr(classifier.registry, 'get_extractor',
+                        lambda file_path, mime_type=None: ImagePagedExtractor(["scanned page"]))
+    monkeypatch.setattr(classifier.cache, 'set', lambda key, value: cached.append(value))
+
+    result = classifier.classify(sample_files['invoice'])
+    assert cached and 'ImageReference' not in repr(cached)
+    assert 'ImageReference' not in repr(result)
+
+def test_shared_classifier_follows_config():
+    """Test shared classifiers are built from config and never reused across differing config."""
+    from config.base import BaseConfig
+    from config.testing import TestingConfig
+    config = {key: getattr(BaseConfig, key) for key in dir(BaseConfig) if key.isupper()}
+    testing = {key: getattr(TestingConfig, key) for key in dir(TestingConfig) if key.isupper()}
+
+    shared = get_classifier(dict(config, EARLY_EXIT_CONFIDENCE=0.8))
+    assert get_classifier(dict(config, EARLY_EXIT_CONFIDENCE=0.8)) is shared
+    assert shared.early_exit_threshold == 0.8
+    assert get_classifier(testing) is not shared
+    assert get_classifier(testing).cache.memory.max_size == 0
+
+def test_classify_spreadsheet(classifier, temp_upload_dir):
+    """Test spreadsheets classify end to end, header row included."""
+    import openpyxl
+    workbook = openpyxl.Workbook()
+    workbook.active.append(['Date', 'Description', 'Amount'])
+    workbook.active.append(['2024-01-02', 'Opening balance', 1200])
+    workbook.active.append(['2024-01-05', 'Deposit', None])
+    excel_path = os.path.join(temp_upload_dir, 'statement.xlsx')
+    workbook.save(excel_path)
+
+    result = classifier.classify(excel_path, return_extracted_text=True)
+    assert result.mime_type == 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    assert result.headers == ['Date Description Amount']
@@ -1,6 +1,9 @@
 import pytest
 from document_classifier.core.extractors.office import WordExtractor, ExcelExtractor
 from document_classifier.core.extractors.base import ExtractedContent
+from document_classifier.core.extractors.pdf import PDFExtractor
+from document_classifier.core.extractors.mime import sniff_mime_type, detect_file_mime_type
+from pathlib import Path
 import os
 
 def test_word_extractor_supported_mimes(extractor_registry):
@@ -57,6 +60,15 @@ def test_invalid_word_document(temp_upload_dir):
     with pytest.raises(Exception):
         extractor.extract_content(invalid_path)
 
+def test_legacy_word_document_unsupported(temp_upload_dir):
+    """Test binary .doc files are rejected with an explicit error."""
+    doc_path = os.path.join(temp_upload_dir, "legacy.doc")
+    with open(doc_path, "wb") as f:
+        f.write(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + b'\x00' * 512)
+
+    with pytest.raises(Exception, match="not supported"):
+        WordExtractor().extract_content(doc_path)
+
 def test_metadata_extraction(document_generator):
     """Test metadata extraction from documents."""
     extractor = WordExtractor()
@@ -65,3 +77,204 @@ def test_metadata_extraction(document_generator):
     content = extractor.extract_content(doc_path)
     assert 'page_count' in content.metadata
     assert 'word_count' in content.metadata
+
+def test_pdf_extraction_opens_file_once(monkeypatch):
+    """Test PDF text and header/footer bands come from a single parse."""
+    import pdfplumber
+    opened = []
+    original_open = pdfplumber.open
+    monkeypatch.setattr(pdfplumber, 'open', lambda *args, **kwargs: opened.append(args) or original_open(*args, **kwargs))
+
+    pdf_path = Path(__file__).parent.parent / "files" / "invoice_1.pdf"
+    content = PDFExtractor().extract_content(str(pdf_path))
+
+    assert len(opened) == 1
+    assert 'INVOICE' in content.text.replace(' ', '')
+    assert content.headers
+    assert content.metadata['ocr_pages'] == []
+
+def test_ocr_pool_size_splits_cpus(monkeypatch):
+    """Test the OCR pool is sized against the worker concurrency."""
+    from document_classifier.core.extractors.ocr import ocr_pool_size
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+    assert ocr_pool_size(4) == 2
+    assert ocr_pool_size(16) == 1
+
+def test_ocr_pool_processes_are_not_forked():
+    """Test pool processes never fork the (possibly multithreaded) caller."""
+    from document_classifier.core.extractors.ocr import _process_context
+    assert _process_context().get_start_method() in ('forkserver', 'spawn')
+
+def test_image_text_rebuilt_from_ocr_data():
+    """Test page text is derived from the single image_to_data result."""
+    from document_classifier.core.extractors.image import ImageExtractor
+    data = {
+        'text': ['', 'Patient', 'Name', '', 'Dosage', '10mg'],
+        'block_num': [1, 1, 1, 2, 2, 2],
+        'par_num': [1, 1, 1, 1, 1, 1],
+        'line_num': [1, 1, 1, 1, 1, 2],
+        'conf': ['-1', '95', '91', '-1', '88', '90']
+    }
+    assert ImageExtractor()._text_from_data(data) == "Patient Name\n\nDosage\n10mg"
+
+def test_ocr_engine_recycled_after_max_pages(monkeypatch):
+    """Test pooled OCR engines are reused and replaced after max_pages."""
+    import pytesseract
+    from document_classifier.core.extractors.ocr import OCREnginePool
+    monkeypatch.setattr(pytesseract, 'image_to_string', lambda image: "text")
+
+    pool = OCREnginePool(size=1, max_pages=2, engine='pytesseract')
+    with pool.engine() as first:
+        first.image_to_string(None)
+    with pool.engine() as engine:
+        assert engine is first
+        engine.image_to_string(None)
+    with pool.engine() as engine:
+        assert engine is not first
+
+def test_image_reference_reads_lazily(temp_upload_dir):
+    """Test image references only load the referenced byte range on request."""
+    from document_classifier.core.extractors.base import ImageReference
+    path = os.path.join(temp_upload_dir, "blob.bin")
+    with open(path, 'wb') as f:
+        f.write(b"headerIMAGEtrailer")
+
+    reference = ImageReference(path, offset=6, length=5)
+    assert reference.read() == b"IMAGE"
+
+def test_image_normalized_to_target_dpi(temp_upload_dir):
+    """Test oversized photos are decoded at reduced scale to the target DPI."""
+    from PIL import Image
+    from document_classifier.core.extractors.image import ImageExtractor
+    path = os.path.join(temp_upload_dir, "photo.jpg")
+    Image.new('RGB', (4000, 3000), 'white').save(path, dpi=(600, 600))
+
+    pixels, metadata = ImageExtractor(target_dpi=300)._load_image(path)
+    assert pixels.shape[:2] == (1500, 2000)
+    assert metadata['width'] == 4000
+    assert metadata['scale'] == 0.5
+
+    pixels, _ = ImageExtractor(normalize=False)._load_image(path)
+    assert pixels.shape[:2] == (3000, 4000)
+
+def test_image_table_grid_detection():
+    """Test ruled tables are found by morphology and filled from OCR word boxes."""
+    import cv2
+    import numpy as np
+    from document_classifier.core.extractors.image import ImageExtractor
+    image = np.full((1000, 1400), 255, np.uint8)
+    for y in (200, 300, 400):
+        cv2.line(image, (100, y), (700, y), 0, 2)
+    for x in (100, 400, 700):
+        cv2.line(image, (x, 200), (x, 400), 0, 2)
+
+    data = {
+        'text': ['Item', 'Amount', 'Total', '12.00', 'outside'],
+        'left': [150, 450, 150, 450, 150],
+        'top': [240, 240, 340, 340, 800],
+        'width': [60, 80, 60, 60, 50],
+        'height': [20, 20, 20, 20, 20]
+    }
+    tables = ImageExtractor()._detect_tables(image, data)
+    assert tables == [[['Item', 'Amount'], ['Total', '12.00']]]
+
+def test_excel_streaming_row_cap(temp_upload_dir):
+    """Test sheets are read up to the row cap and blank rows split tables."""
+    import openpyxl
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['Item', 'Amount'])
+    sheet.append(['Rent', 1200])
+    sheet.append([])
+    for i in range(20):
+        sheet.append([f"row {i}", i])
+    excel_path = os.path.join(temp_upload_dir, "capped.xlsx")
+    workbook.save(excel_path)
+
+    content = ExcelExtractor(max_rows=10).extract_content(excel_path)
+    assert content.tables[0].tolist() == [['Item', 'Amount'], ['Rent', '1200']]
+    assert len(content.tables[1]) == 7
+    assert content.metadata['total_rows'] == 23
+    assert content.metadata['truncated_sheets'] == ['Sheet']
+
+def test_excel_tables_split_on_blank_rows_and_columns():
+    """Test sheet segmentation finds blocks separated by blank rows or columns."""
+    import numpy as np
+    cells = np.array([
+        ['Item', 'Amount', '', 'Note'],
+        ['Rent', '1200', '', 'paid'],
+        ['', '', '', ''],
+        ['Total', '1200', '', ''],
+        ['Tax', '0', '', ''],
+    ], dtype=object)
+
+    tables = ExcelExtractor()._detect_tables(cells, 'Sheet1')
+    assert [(t.top, t.left) for t in tables] == [(0, 0), (0, 3), (3, 0)]
+    assert tables[1].tolist() == [['Note'], ['paid']]
+    assert tables[2][0] == ['Total', '1200']
+
+def test_word_streaming_parse_matches_python_docx(temp_upload_dir):
+    """Test the streaming DOCX parser matches python-docx, merged cells included."""
+    import docx
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "Confidential"
+    document.add_paragraph("Payment\tterms")
+    table = document.add_table(rows=3, cols=3)
+    for i, row in enumerate(table.rows):
+        for j, cell in enumerate(row.cells):
+            cell.text = f"{i}{j}"
+    table.cell(0, 0).merge(table.cell(0, 1))
+    table.cell(1, 2).merge(table.cell(2, 2))
+    doc_path = os.path.join(temp_upload_dir, "contract.docx")
+    document.save(doc_path)
+
+    extractor = WordExtractor()
+    assert extractor._parse_streaming(doc_path) == extractor._parse_with_python_docx(doc_path)
+
+def test_registry_lazy_shared_instances(extractor_registry):
+    """Test built-in extractors are declared lazily and instantiated once."""
+    assert extractor_registry.get_supported_mime_types()['image/png'] == 'image:ImageExtractor'
+
+    first = extractor_registry.get_extractor_for_mime_type('application/pdf')
+    assert isinstance(first, PDFExtractor)
+    assert extractor_registry.get_extractor_for_mime_type('application/pdf') is first
+    assert extractor_registry.get_extractor_for_mime_type('text/plain') is None
+
+def test_classifier_config_sets_pdf_tables():
+    """Test PDF_EXTRACT_TABLES reaches the shared PDF extractor and the cache key."""
+    from config.base import BaseConfig
+    from document_classifier.core.classifier import DocumentClassifier
+    default = DocumentClassifier()
+    without_tables = DocumentClassifier.from_config({'PDF_EXTRACT_TABLES': False})
+
+    assert default.pdf_extract_tables == BaseConfig.PDF_EXTRACT_TABLES
+    assert default.registry.get_extractor_for_mime_type('application/pdf').extract_tables
+    assert not without_tables.registry.get_extractor_for_mime_type('application/pdf').extract_tables
+    assert without_tables.strategy_version != default.strategy_version
+
+def test_mime_signatures(temp_upload_dir):
+    """Test accepted formats are identified from their leading bytes."""
+    import docx
+    import openpyxl
+
+    docx_path = os.path.join(temp_upload_dir, 'sniff.docx')
+    document = docx.Document()
+    document.add_paragraph('text')
+    document.save(docx_path)
+
+    xlsx_path = os.path.join(temp_upload_dir, 'sniff.xlsx')
+    openpyxl.Workbook().save(xlsx_path)
+
+    files_dir = Path(__file__).parent.parent / "files"
+    assert detect_file_mime_type(str(files_dir / 'invoice_1.pdf')) == 'application/pdf'
+    assert detect_file_mime_type(str(files_dir / 'drivers_license_1.jpg')) == 'image/jpeg'
+    assert detect_file_mime_type(docx_path) == 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+    assert detect_file_mime_type(xlsx_path) == 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    assert sniff_mime_type(b'\xff\xd8\xff\xe0\x00\x10JFIF') == 'image/jpeg'
+    assert sniff_mime_type(b'\x89PNG\r\n\x1a\n\x00') == 'image/png'
+    assert sniff_mime_type(b'II*\x00\x08\x00') == 'image/tiff'
+
+def test_mime_ambiguous_signatures_fall_back():
+    """Test OLE2 containers and unknown bytes are left to libmagic."""
+    assert sniff_mime_type(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + b'\x00' * 512) is None
+    assert sniff_mime_type(b'plain text') is None
@@ -0,0 +1,152 @@
+import pytest
+import hashlib
+import io
+import os
+import time
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import encode_multipart
+from document_classifier.api.ingest import ingest_multipart
+from document_classifier.utils.file_utils import FileManager, UploadRejected, UploadTooLarge
+from document_classifier.core.models.context import DocumentContext
+
+PDF_BYTES = b'%PDF-1.4\n' + b'0' * 100000
+
+def _body(fields):
+    boundary, body = encode_multipart(fields)
+    return io.BytesIO(body), boundary.encode()
+
+def _stored_files(upload_dir):
+    """Files left in the upload directory, ignoring spool lock files."""
+    return [
+        os.path.join(root, name)
+        for root, _, names in os.walk(upload_dir)
+        for name in names if name != '.lock'
+    ]
+
+def test_ingest_spools_files_and_fields(temp_upload_dir):
+    """Test file parts are spooled with hash, size and type, and fields are decoded."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 10 * 1024 * 1024)
+    stream, boundary = _body({
+        'industry': 'financial',
+        'file': FileStorage(io.BytesIO(PDF_BYTES), 'statement.pdf'),
+        'skipped': FileStorage(io.BytesIO(b''), '')
+    })
+
+    ingested = ingest_multipart(stream, boundary, file_manager)
+    context = ingested.files['file']
+
+    assert ingested.form['industry'] == 'financial'
+    assert len(ingested.contexts) == 1
+    assert context.file_hash == hashlib.sha256(PDF_BYTES).hexdigest()
+    assert context.file_size == len(PDF_BYTES)
+    assert context.mime_type == 'application/pdf'
+    with open(context.file_path, 'rb') as f:
+        assert f.read() == PDF_BYTES
+
+def test_ingest_rejects_oversized_upload_mid_stream(temp_upload_dir):
+    """Test the size limit aborts the upload and removes already spooled files."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 50000)
+    stream, boundary = _body({
+        'small': FileStorage(io.BytesIO(b'%PDF-1.4\n'), 'small.pdf'),
+        'large': FileStorage(io.BytesIO(PDF_BYTES), 'large.pdf')
+    })
+
+    with pytest.raises(UploadTooLarge):
+        ingest_multipart(stream, boundary, file_manager)
+    assert _stored_files(temp_upload_dir) == []
+
+def test_ingest_rejects_disallowed_extension_and_truncated_body(temp_upload_dir):
+    """Test invalid parts and truncated bodies are rejected without leftovers."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 10 * 1024 * 1024)
+
+    stream, boundary = _body({'file': FileStorage(io.BytesIO(PDF_BYTES), 'payload.exe')})
+    with pytest.raises(UploadRejected):
+        ingest_multipart(stream, boundary, file_manager)
+
+    stream, boundary = _body({'file': FileStorage(io.BytesIO(PDF_BYTES), 'statement.pdf')})
+    truncated = io.BytesIO(stream.getvalue()[:50000])
+    with pytest.raises(UploadRejected):
+        ingest_multipart(truncated, boundary, file_manager)
+    assert _stored_files(temp_upload_dir) == []
+
+def test_ingest_in_memory_writes_nothing(temp_upload_dir):
+    """Test small requests can be ingested without touching the upload directory."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 10 * 1024 * 1024)
+    stream, boundary = _body({'file': FileStorage(io.BytesIO(PDF_BYTES), 'statement.pdf')})
+
+    context = ingest_multipart(stream, boundary, file_manager, in_memory=True).files['file']
+
+    assert context.file_path is None
+    assert bytes(context.buffer) == PDF_BYTES
+    assert context.file_hash == hashlib.sha256(PDF_BYTES).hexdigest()
+    assert _stored_files(temp_upload_dir) == []
+
+def test_duplicate_uploads_share_one_spooled_file(temp_upload_dir):
+    """Test identical uploads resolve to one file that lives until the last release."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 10 * 1024 * 1024)
+    first = file_manager.save_upload(io.BytesIO(PDF_BYTES), 'first.pdf')
+    second = file_manager.save_upload(io.BytesIO(PDF_BYTES), 'second.pdf')
+
+    name = first.file_hash + '.pdf'
+    assert first.file_path == second.file_path
+    assert first.file_path.endswith(os.path.join(name[:2], name[2:4], name))
+    assert file_manager.spool.references(name) == 2
+
+    file_manager.release(first)
+    assert os.path.exists(second.file_path)
+    file_manager.release(second)
+    assert _stored_files(temp_upload_dir) == []
+
+def test_spool_sweep_removes_abandoned_and_stale_files(temp_upload_dir):
+    """Test the sweep removes old partial uploads and entries pinned past their age."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 10 * 1024 * 1024)
+    spool = file_manager.spool
+    stale = file_manager.save_upload(io.BytesIO(PDF_BYTES), 'stale.pdf')
+    fresh = file_manager.save_upload(io.BytesIO(b'%PDF-1.4\n'), 'fresh.pdf')
+    fd, abandoned = spool.temp_file()
+    os.close(fd)
+    _, in_progress = spool.temp_file()
+
+    hour_ago = time.time() - 3600
+    for path in (abandoned, stale.file_path, stale.file_path + '.refs'):
+        os.utime(path, (hour_ago, hour_ago))
+
+    assert spool.sweep(temp_max_age=60, max_age=60) == 2
+    assert sorted(_stored_files(temp_upload_dir)) == sorted(
+        [in_progress, fresh.file_path, fresh.file_path + '.refs']
+    )
+    assert spool.references(os.path.basename(stale.file_path)) == 0
+
+def test_spooled_spreadsheet_classifies(temp_upload_dir, classifier):
+    """Test spooled files keep a type suffix so suffix-sensitive readers can open them."""
+    import openpyxl
+    workbook = openpyxl.Workbook()
+    workbook.active.append(['Date', 'Description', 'Amount'])
+    workbook.active.append(['2024-01-02', 'Deposit', 1200])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    file_manager = FileManager(temp_upload_dir, {'xlsx'}, 10 * 1024 * 1024)
+    context = file_manager.save_upload(io.BytesIO(buffer.getvalue()), 'statement.xlsx')
+    assert context.file_path.endswith(context.file_hash + '.xlsx')
+
+    result = classifier.classify(context)
+    assert result.mime_type == context.mime_type
+    assert result.metadata['sheet_count'] == 1
+
+def test_task_payloads_accept_context_and_legacy_forms(temp_upload_dir):
+    """Test tasks rebuild contexts from new payloads and from ones queued before the spool change."""
+    file_manager = FileManager(temp_upload_dir, {'pdf'}, 10 * 1024 * 1024)
+    context = file_manager.save_upload(io.BytesIO(PDF_BYTES), 'statement.pdf')
+
+    assert DocumentContext.from_task_payload({'document': context.to_dict()}) == context
+    from_path = DocumentContext.from_task_payload({'file_path': context.file_path})
+    assert from_path.file_hash == context.file_hash
+    from_content = DocumentContext.from_task_payload(
+        {'file_content': PDF_BYTES, 'filename': 'statement.pdf', 'industry': 'financial'}
+    )
+    assert from_content.file_hash == context.file_hash
+    assert from_content.mime_type == 'application/pdf'
+
+    with pytest.raises(ValueError):
+        DocumentContext.from_task_payload({'filename': 'statement.pdf'})
@@ -0,0 +1,37 @@
+import pytest
+from config.base import BaseConfig
+from document_classifier.utils.startup_profile import measure_import, _parse_importtime
+
+# Measured through the app factory: routes, ingestion, monitoring and the
+# classifier are only imported and built inside create_app
+WEB_ENTRY_POINT = 'document_classifier.api.app:create_app'
+DEFERRED_MODULES = {'cv2', 'numpy', 'pandas', 'pdfplumber', 'PyPDF2', 'langdetect'}
+
+@pytest.fixture(scope='module')
+def web_profile():
+    return measure_import(WEB_ENTRY_POINT)
+
+def test_parse_importtime():
+    """Test self and cumulative costs are read from -X importtime output."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   encodings.utf_8\n"
+        "import time:      4500 |      31000 | numpy\n"
+    )
+    costs = _parse_importtime(stderr)
+    assert [(c.name, c.self_us, c.cumulative_us) for c in costs] == [
+        ('encodings.utf_8', 120, 120),
+        ('numpy', 4500, 31000),
+    ]
+
+def test_web_import_defers_heavy_dependencies(web_profile):
+    """Test format and OCR libraries are not imported by app startup, before the first request."""
+    assert not DEFERRED_MODULES & set(web_profile.heavy_modules)
+
+def test_web_import_within_time_budget(web_profile):
+    """Test creating the web app stays under the configured startup budget."""
+    assert web_profile.seconds < BaseConfig.STARTUP_IMPORT_BUDGET_SECONDS
+
+def test_web_import_within_rss_budget(web_profile):
+    """Test the web process RSS after app creation stays under the configured budget."""
+    assert web_profile.rss_mb < BaseConfig.STARTUP_RSS_BUDGET_MB
@@ -0,0 +1,56 @@
+import pytest
+from document_classifier.core.strategies.financial import FinancialIndustryStrategy
+from document_classifier.core.strategies.healthcare import HealthcareIndustryStrategy
+from document_classifier.core.strategies.keywords import KeywordIndex
+from document_classifier.core.strategies.rules import RuleSet
+from document_classifier.core.strategies.features import DocumentFeatures
+import re
+
+@pytest.fixture
+def strategies():
+    return [FinancialIndustryStrategy(), HealthcareIndustryStrategy()]
+
+def test_keyword_index_matches_substring_scan(strategies):
+    """Test single-pass hit counts equal the per-keyword substring loop."""
+    text = "opening balance, deposit and withdrawal. patient vital signs and dosage. due date"
+    index = KeywordIndex(strategies)
+
+    counts = index.hit_counts(text)
+    for strategy in strategies:
+        for doc_type, keywords in strategy.keywords.items():
+            expected = sum(1 for keyword in keywords if keyword in text)
+            assert counts[(strategy.industry_name, doc_type)] == expected
+
+def test_shared_features_give_same_result(strategies):
+    """Test strategies classify identically from features shared across industries."""
+    text = "Invoice date, bill to, subtotal and total amount. Medications and dosage."
+    metadata = {'tables': [["Test", "Result", "Units"]]}
+    features = DocumentFeatures.build(text, metadata, KeywordIndex(strategies), strategies)
+
+    for strategy in strategies:
+        assert strategy.classify_features(features) == strategy.classify(text, metadata)
+
+def test_rule_families_match_raw_patterns(strategies):
+    """Test compiled rule families agree with re.search on the raw patterns."""
+    text = "mrn: 12345 lab results reference range. account: 42 credit card apr"
+    for strategy in strategies:
+        rule_hits = strategy.rules.match(text)
+        for family, patterns in strategy.rule_patterns.items():
+            expected = any(re.search(pattern, text, re.I) for pattern in patterns)
+            assert (family in rule_hits) == expected
+
+def test_rule_families_evaluated_lazily():
+    """Test families are only scanned when custom_rules asks for them."""
+    rules = RuleSet({"first": [r"alpha"], "second": [r"beta"]})
+    rule_hits = rules.match("alpha")
+
+    assert "first" in rule_hits
+    assert "second" not in rule_hits._results
+    assert rule_hits.fired() == {"first"}
+
+def test_custom_rules_precedence():
+    """Test account-number rules take precedence over invoice rules."""
+    strategy = FinancialIndustryStrategy()
+    result = strategy.classify("Account: 12345 opening balance, invoice number 7")
+    assert result['document_type'] == "bank_statement"
+    assert result['method'] == "custom_rules"